@@ -1,6 +1,7 @@
+import asyncio
 import logging
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -15,6 +16,7 @@ from backend.routes.auth.auth_db import admin_exists
 from backend.routes.auth.auth_router import auth_router
 from backend.routes.diagnostics.diagnostics_router import diagnostics_router
 from backend.routes.admin.admin_router import admin_router
+from backend.routes.admin.simulation_jobs import run_job_consumer
 from backend.routes.user.user_router import user_router
 from sqlmodel import Session, text
 
@@ -62,11 +64,19 @@ def check_database_status():
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifecycle manager for the FastAPI application"""
+    job_consumer = None
     try:
         logger.info("Starting application...")
         check_database_status()
         # Container management now handled by Docker Compose
 
+        # Saves finished /admin/enqueue-simulation runs. Every gunicorn worker
+        # runs one; jobs are claimed row by row, so each is saved once. Not
+        # under the test suite, which drives collect_finished_jobs directly
+        # against a schema it truncates at will.
+        if os.environ.get("DB_ENVIRONMENT") != "test":
+            job_consumer = asyncio.create_task(run_job_consumer())
+
     except Exception as e:
         logger.error(f"Failed to start application: {e}")
 
@@ -75,6 +85,10 @@ async def lifespan(app: FastAPI):
     try:
         logger.info("Shutting down application...")
         # Container shutdown now handled by Docker Compose
+        if job_consumer is not None:
+            job_consumer.cancel()
+            with suppress(asyncio.CancelledError):
+                await job_consumer
 
     except Exception as e:
         logger.error(f"Error during application shutdown: {e}")
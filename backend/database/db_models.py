@@ -43,6 +43,13 @@ class LeagueType(str, PyEnum):
     AGENT = "agent"
 
 
+class SimulationJobStatus(str, PyEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
 class Admin(SQLModel, table=True):
     """The single account that runs this deployment.
 
@@ -163,6 +170,9 @@ class Submission(SQLModel, table=True):
     # Rank against the game's validation bots (1 = best, competition ranking),
     # from the validation run's total_points. Not a league standing.
     ranking: Optional[int] = Field(default=None)
+    # JSON: the validation run's per-player decision latency and engine time
+    # (games/decision_profile.py summary).
+    decision_profile: Optional[str] = Field(default=None, sa_column=Column(Text()))
     metadata_id: int = Field(
         foreign_key="submissionmetadata.id", ondelete="CASCADE", unique=True, index=True
     )
@@ -179,6 +189,10 @@ class SimulationResult(SQLModel, table=True):
     custom_rewards: str = Field(default="[10, 0, 0, 0, 0, 0, 0]")
     feedback_str: Optional[str] = Field(default=None, sa_column=Column(Text()))
     feedback_json: Optional[str] = Field(default=None, sa_column=Column(Text()))
+    # JSON {team: {placement span: games}} of a placement game's run that
+    # recorded placements; /admin/rescore-simulation reads it. None: not
+    # recorded, so the run cannot be rescored.
+    placements: Optional[str] = Field(default=None, sa_column=Column(Text()))
     # Public lookup key for the shareable results page — unique and indexed for
     # the same reason as League.signup_link.
     publish_link: Optional[str] = Field(default=None, unique=True, index=True)
@@ -211,6 +225,38 @@ class SimulationResultItem(SQLModel, table=True):
     team: Team = Relationship()
 
 
+class SimulationJob(SQLModel, table=True):
+    """A league simulation run asynchronously, outliving the request that
+    started it.
+
+    Created by /admin/enqueue-simulation with the Celery task id; the API's job
+    consumer (backend.routes.admin.simulation_jobs) saves the SimulationResult
+    when the task finishes, whether or not anyone is still watching.
+    """
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    league_id: int = Field(foreign_key="league.id", ondelete="CASCADE", index=True)
+    # For a sharded run this is the merge (chord callback) task's id.
+    task_id: str = Field(index=True)
+    # Key of the run's live progress in valkey (see tasks.simulation_progress).
+    progress_id: str
+    status: SimulationJobStatus = Field(default=SimulationJobStatus.QUEUED, index=True)
+    num_simulations: int
+    custom_rewards: Optional[str] = Field(default=None)  # JSON list
+    shards: int = Field(default=1)
+    games_completed: int = Field(default=0)
+    error: Optional[str] = Field(default=None, sa_column=Column(Text()))
+    simulation_result_id: Optional[int] = Field(
+        default=None, foreign_key="simulationresult.id", ondelete="SET NULL"
+    )
+    created_at: datetime = Field(
+        default_factory=utc_now, sa_column=Column(DateTime(timezone=True))
+    )
+    finished_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
+
+
 class AgentAPIKey(SQLModel, table=True):
     """Model for API key management"""
 
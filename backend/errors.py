@@ -93,6 +93,15 @@ class ResultNotFoundError(Exception):
     """Raised when a published result is not found (maps to HTTP 404)."""
 
 
+class SimulationJobNotFoundError(Exception):
+    """Raised when a referenced simulation job does not exist (maps to HTTP 404)."""
+
+
+class PlacementsNotRecordedError(Exception):
+    """Raised when rescoring a simulation that did not record placements (maps
+    to HTTP 400)."""
+
+
 # --- AI providers ----------------------------------------------------------
 # Re-exported by backend/routes/ai/clients/base.py, which owns the provider
 # contract; defined here so this module imports nothing from backend.routes.
@@ -152,6 +161,8 @@ EXCEPTION_STATUS_MAP: dict[type[Exception], int] = {
     SimulationLimitExceededError: 429,
     SimulationResultNotFoundError: 404,
     ResultNotFoundError: 404,
+    SimulationJobNotFoundError: 404,
+    PlacementsNotRecordedError: 400,
     UnknownProviderError: 400,
     NoApiKeyError: 400,
     NoSubmissionsError: 400,
@@ -1,5 +1,3 @@
-import itertools
-import random
 from typing import Dict, List, Optional, Tuple
 
 from backend.games.base_game import BaseGame
@@ -40,6 +38,9 @@ class ArenaChampionsGame(BaseGame):
     # Benchmarked: ~3.6ms per simulation + feedback game keeps validation <1s.
     validation_simulations = 200
 
+    # Battles are independent; run_simulations ranks on points (wins) alone.
+    bot_baseline_stats = ()
+
     starter_code = """
 from games.arena_champions.player import Player
 import random
@@ -217,8 +218,13 @@ bonuses or per-outcome payoffs to tune.
         """Get action from player with explicit role validation"""
         opponent_stats = opponent.get_combat_info()
         try:
-            action = player.make_combat_decision(
-                opponent_stats, turn, role, last_opponent_action
+            action = self.profiler.time(
+                player.name,
+                player.make_combat_decision,
+                opponent_stats,
+                turn,
+                role,
+                last_opponent_action,
             )
         except Exception as e:
             raise ValueError(f"Invalid action by {player.name}: {e}")
@@ -301,7 +307,7 @@ bonuses or per-outcome payoffs to tune.
                 attack_type = "precise_attack"
 
             # Attempt dodge
-            if random.randint(0, 100) <= dodge_chance:
+            if self._rng.randint(0, 100) <= dodge_chance:
                 return 0, f"dodged {attack_type} completely"
 
             # Failed dodge - take full damage
@@ -346,6 +352,14 @@ bonuses or per-outcome payoffs to tune.
         # Return final damage (at least min_damage)
         return max(min_damage, final_damage), msg
 
+    def _apply_round(self, attacker, defender, attack_action, defend_action):
+        """Apply one round's damage; returns (damage dealt, defense message)."""
+        final_damage, defense_msg = self.calculate_damage(
+            attacker, defender, attack_action, defend_action
+        )
+        defender.health -= final_damage
+        return final_damage, defense_msg
+
     def resolve_combat_round(
         self,
         attacker,
@@ -368,10 +382,9 @@ bonuses or per-outcome payoffs to tune.
         }
 
         # Calculate damage the defender takes
-        final_damage, defense_msg = self.calculate_damage(
+        final_damage, defense_msg = self._apply_round(
             attacker, defender, attack_action, defend_action
         )
-        defender.health -= final_damage
         turn_result["effects"]["defense_result"] = defense_msg
 
         turn_result["effects"]["damage_dealt"] = final_damage
@@ -401,6 +414,7 @@ bonuses or per-outcome payoffs to tune.
         second_player.health = second_player.max_health
 
         battle_result = BattleResult(str(first_player.name), str(second_player.name))
+        recorder = self.recorder
 
         turn_number = 0
         last_actions = {str(first_player.name): None, str(second_player.name): None}
@@ -438,27 +452,25 @@ bonuses or per-outcome payoffs to tune.
                 defender_last_opponent_action,
             )
 
-            # Resolve the combat round
-            turn_result = self.resolve_combat_round(
-                attacker, defender, attack_action, defend_action
-            )
-
-            turn_result["turn"] = turn_number
-            battle_result.add_turn(turn_result)
+            # Resolve the combat round; the turn record is only built for
+            # feedback runs
+            if recorder:
+                turn_result = self.resolve_combat_round(
+                    attacker, defender, attack_action, defend_action
+                )
+                turn_result["turn"] = turn_number
+                battle_result.add_turn(turn_result)
+            else:
+                self._apply_round(attacker, defender, attack_action, defend_action)
+                attacker.feedback = []
+                defender.feedback = []
 
             # New rule: if a big_attack causes the attacker to KO themselves,
             # the attacker loses immediately (defender wins), even if it's a double-KO.
-            try:
-                if attack_action == "big_attack":
-                    after_attacker_hp = turn_result["health_after"][str(attacker.name)]
-                    after_defender_hp = turn_result["health_after"][str(defender.name)]
-                    if after_attacker_hp <= 0:
-                        battle_result.set_winner(str(defender.name))
-                        # End battle immediately per self-KO rule
-                        break
-            except Exception:
-                # If anything goes wrong reading the turn_result, fall back to default logic
-                pass
+            if attack_action == "big_attack" and attacker.health <= 0:
+                battle_result.set_winner(str(defender.name))
+                # End battle immediately per self-KO rule
+                break
 
             # Update last actions
             last_actions[str(attacker.name)] = attack_action
@@ -529,25 +541,20 @@ bonuses or per-outcome payoffs to tune.
         # Initialize characters without validation (preserve leveled-up stats)
         self.initialize_characters(validate_initial_attributes=True)
 
+        recorder = self.recorder
         # FIXED: Use combinations to ensure each pair fights exactly twice
-        for player1, player2 in itertools.combinations(self.players, 2):
+        for player1, player2 in self.player_pairs():
             # Match 1: player1 goes first ("home" match for player1)
-            winner_name, battle_result = self.execute_combat(player1, player2)
-            battle_result.match_info = {
-                "type": "home",
-                "first_player": str(player1.name),
-            }
-            self.game_feedback["battles"].append(battle_result.to_dict())
-            self._update_stats_and_history(winner_name, player1, player2, "home")
-
             # Match 2: player2 goes first ("home" match for player2)
-            winner_name, battle_result = self.execute_combat(player2, player1)
-            battle_result.match_info = {
-                "type": "home",
-                "first_player": str(player2.name),
-            }
-            self.game_feedback["battles"].append(battle_result.to_dict())
-            self._update_stats_and_history(winner_name, player2, player1, "home")
+            for first, second in ((player1, player2), (player2, player1)):
+                winner_name, battle_result = self.execute_combat(first, second)
+                if recorder:
+                    battle_result.match_info = {
+                        "type": "home",
+                        "first_player": str(first.name),
+                    }
+                    recorder.record("battles", battle_result.to_dict())
+                self._update_stats_and_history(winner_name, first, second, "home")
 
         # Calculate final scores (wins)
         scores = {str(player.name): player.wins for player in self.players}
@@ -582,7 +589,7 @@ bonuses or per-outcome payoffs to tune.
                 str(player.name): getattr(player, stat_name) for player in self.players
             }
 
-        return {
+        results = {
             "points": scores,
             "score_aggregate": scores,
             "table": {
@@ -594,6 +601,9 @@ bonuses or per-outcome payoffs to tune.
                 },
             },
         }
+        if self._bot_baseline is not None:
+            self._add_bot_baseline(results)
+        return results
 
     def run_simulations(self, num_simulations, league, custom_rewards=None):
         """Run multiple simulations"""
@@ -636,8 +646,7 @@ bonuses or per-outcome payoffs to tune.
 
     def run_single_game_with_feedback(self, custom_rewards=None):
         """Run a single game with feedback"""
-        self.verbose = True
-        results = self.play_game(custom_rewards)
+        results = self._play_verbose(custom_rewards)
         return {
             "results": results,
             "feedback": self.game_feedback,
@@ -537,18 +537,20 @@ class StrategicAdaptiveRandom(Player):
 
 
 # List of players to be used for validation games
-players = [
-    AttackDefend(),
-    AttackDodge(),
-    AttackBrace(),
-    BigAttackDefend(),
-    BigAttackDodge(),
-    BigAttackBrace(),
-    PreciseAttackDefend(),
-    PreciseAttackDodge(),
-    PreciseAttackBrace(),
-    AdaptiveAttacker(),
-    FullyAdaptivePlayer(),
-    OptimisedRandomVCC(),
-    StrategicAdaptiveRandom(),
-]
\ No newline at end of file
+player_factories = [
+    AttackDefend,
+    AttackDodge,
+    AttackBrace,
+    BigAttackDefend,
+    BigAttackDodge,
+    BigAttackBrace,
+    PreciseAttackDefend,
+    PreciseAttackDodge,
+    PreciseAttackBrace,
+    AdaptiveAttacker,
+    FullyAdaptivePlayer,
+    OptimisedRandomVCC,
+    StrategicAdaptiveRandom,
+]
+
+players = [factory() for factory in player_factories]
\ No newline at end of file
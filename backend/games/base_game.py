@@ -1,12 +1,167 @@
 import copy
+import hashlib
 import importlib
+import itertools
 import logging
+import random
 import traceback
 from abc import ABC
+from collections.abc import Mapping, Sequence, Set
+
+from backend.games.decision_profile import DecisionProfiler
 
 logger = logging.getLogger(__name__)
 
 
+def derive_seed(seed, *stream):
+    """Deterministic 64-bit seed for the named sub-stream `stream` of `seed`.
+
+    Used to split one run seed into independent streams (a shard, the agents'
+    shared RNG, ...): the same (seed, stream) always yields the same value,
+    different streams are unrelated.
+    """
+    digest = hashlib.sha256(repr((seed, *stream)).encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def plain_data(value):
+    """`value` with every read-only view an engine hands agents (an
+    AppendOnlyView, a ReadOnlyMapping) turned back into the list or dict it
+    stands for, at any depth. A Set view (breakthrough's visited cells) becomes a
+    list in its own order, since JSON has no sets.
+
+    Player.add_feedback runs messages through this, so an agent that echoes
+    part of its game state into its feedback puts a snapshot of plain data
+    into the results, which must still serialize to JSON.
+    """
+    if value is None or isinstance(value, (str, bytes, int, float)):
+        return value
+    if isinstance(value, Mapping):
+        return {key: plain_data(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return tuple(plain_data(item) for item in value)
+    if isinstance(value, Sequence):
+        return [plain_data(item) for item in value]
+    if isinstance(value, Set) and not isinstance(value, (set, frozenset)):
+        return list(value)
+    return value
+
+
+class AppendOnlyView(Sequence):
+    """Read-only view of the first items of an append-only list: those it
+    held when the view was made.
+
+    A view fixed at the list's current length never changes and costs O(1)
+    to hand out, where copying the list for every decision did not (a
+    prisoners' dilemma history, a breakthrough trace). It reads like the
+    list it stands for; copies (copy, deepcopy, pickle, .copy(), + and *)
+    are plain lists, and so is one echoed into feedback (see plain_data).
+    """
+
+    __slots__ = ("_items", "_length")
+
+    def __init__(self, items):
+        self._items = items
+        self._length = len(items)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._items[: self._length][index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("index out of range")
+        return self._items[index]
+
+    def __iter__(self):
+        return itertools.islice(self._items, self._length)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple, AppendOnlyView)):
+            return len(other) == self._length and all(
+                a == b for a, b in zip(self, other)
+            )
+        return NotImplemented
+
+    __hash__ = None
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __mul__(self, count):
+        return list(self) * count
+
+    __rmul__ = __mul__
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+    def copy(self):
+        return list(self)
+
+
+class ReadOnlyMapping(Mapping):
+    """Live read-only view of a dict, `wrap` applied to values as they are
+    read. One view can be shared by every agent's game_state, since none of
+    them can write to it. Prints like the dict; copies are plain dicts."""
+
+    __slots__ = ("_data", "_wrap")
+
+    def __init__(self, data, wrap=None):
+        self._data = data
+        self._wrap = wrap
+
+    def __getitem__(self, key):
+        value = self._data[key]
+        return self._wrap(value) if self._wrap else value
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+    def copy(self):
+        return dict(self)
+
+
+def spawn_validation_players(module):
+    """Fresh instances of a validation_players module's bots.
+
+    Modules list ``player_factories``: player classes (or any zero-argument
+    callables), or ``(cls, args)`` / ``(cls, args, kwargs)`` tuples for bots
+    that take constructor arguments. Constructing a bot is far cheaper than
+    deep-copying one, which walks its whole attribute graph. Modules with
+    only the legacy ``players`` list of instances are deep-copied instead.
+    """
+    factories = getattr(module, "player_factories", None)
+    if factories is None:
+        return copy.deepcopy(module.players)
+    players = []
+    for factory in factories:
+        if isinstance(factory, tuple):
+            cls, args, *kwargs = factory
+            players.append(cls(*args, **(kwargs[0] if kwargs else {})))
+        else:
+            players.append(factory())
+    return players
+
+
 class PlayerConstructionError(Exception):
     """A submission could not be turned into a live player instance.
 
@@ -21,6 +176,50 @@ class PlayerConstructionError(Exception):
         self.traceback_str = traceback_str
 
 
+class FeedbackRecorder:
+    """Appends engine events to the sections of ``game.game_feedback``.
+
+    Engines emit through ``BaseGame.recorder``, which is this recorder only
+    while the game is verbose. ``record_with`` defers building the event to
+    the recorder, and the recorder is truthy, so an event assembled over
+    several steps can be built under ``if recorder:`` instead.
+    """
+
+    __slots__ = ("_game",)
+
+    def __init__(self, game):
+        self._game = game
+
+    def __bool__(self):
+        return True
+
+    def record(self, section, event):
+        """Append `event` to the ``section`` list of the game's feedback."""
+        self._game.game_feedback[section].append(event)
+
+    def record_with(self, section, build, *args):
+        """Append ``build(*args)`` to the ``section`` list."""
+        self._game.game_feedback[section].append(build(*args))
+
+
+class _NullRecorder:
+    """The recorder of a non-verbose game: falsy, and every call a no-op."""
+
+    __slots__ = ()
+
+    def __bool__(self):
+        return False
+
+    def record(self, section, event):
+        pass
+
+    def record_with(self, section, build, *args):
+        pass
+
+
+NULL_RECORDER = _NullRecorder()
+
+
 class BaseGame(ABC):
     starter_code = """
     # This is a base starter code.
@@ -48,19 +247,107 @@ class BaseGame(ABC):
     # How many simulation passes a submission validation runs for this game.
     # Each game overrides this with a value benchmarked (in the worker image)
     # so the whole validation load — feedback game + simulations — stays under
-    # one second. Games whose run_simulations fans out into many sub-games per
-    # pass (hearts, ohhell, thirteen) need only a handful of passes.
+    # one second; backend/tests/benchmarks/engine_bench.py prints the value
+    # that fits for every game. Games whose run_simulations fans out into many
+    # sub-games per pass (hearts, ohhell, thirteen) need only a handful of
+    # passes.
     validation_simulations = 20
 
+    # Whether every play_game call is a self-contained, independent game. The
+    # league runner relies on this to split a run across worker shards. The
+    # table games (hearts, ohhell, thirteen) set it False: they play ONE
+    # stateful tournament across calls and report windowed deltas, so their
+    # calls cannot be farmed out to separate processes.
+    independent_games = True
+
+    # How the cost of one simulation (one play_game call) grows with the
+    # number of players N, as the exponent k of O(N^k) for time and for peak
+    # memory. A round robin of
+    # pairings is inherently quadratic; games override this with their own
+    # bound, which backend/tests/benchmarks/scaling_bench.py enforces.
+    player_scaling = {"time": 2, "memory": 2}
+
+    # Pairwise games — every play_game a round robin of independent pairings,
+    # drawn from player_pairs() — name the per-player ``table`` entries of
+    # play_game that add up over pairings ("points" always does). Validation
+    # then plays only the submission's pairings and adds a cached bot-vs-bot
+    # pass for the rest (see bot_baseline), and a league run can replay only
+    # the pairings whose code changed (see tasks.pairing_cache). A pairing is
+    # only independent if its agents see nothing of the other pairings, so a
+    # game whose state shows the whole field must leave this None: always
+    # play everyone.
+    bot_baseline_stats = None
+
+    # Set by use_bot_baseline.
+    _bot_baseline = None
+    _baseline_focus = frozenset()
+
+    # Placement games (reward_schema kind "placement") add a ``placements``
+    # histogram to play_game's results while this is set, so the run can be
+    # rescored under other rewards without replaying it (see placements).
+    record_placements = False
+
+    @classmethod
+    def _resolve_rewards(cls, custom_rewards):
+        """The placement rewards a placement game pays for `custom_rewards`."""
+        return list(custom_rewards or cls.reward_schema["default"])
+
+    @classmethod
+    def merge_tables(cls, tables):
+        """Combine the ``table`` payloads of several simulation shards.
+
+        A single-task run reports the table of its last game, so the default
+        keeps that meaning across shards: the last non-empty table wins.
+        """
+        for table in reversed(tables):
+            if table:
+                return table
+        return {}
+
     def __init__(self, league, verbose=False):
         self.verbose = verbose
         self.league = league
+        self.seed_rng()
+        # Engines route every agent call through profiler.time, so a run can
+        # report per-player decision latency and the engine's own share.
+        self.profiler = DecisionProfiler()
         self.players = []
         self.scores = {}
         self.game_feedback = []  # Can be overridden by games to be a dict if needed
         self.player_feedback = {}
         self.load_validation_players()
 
+    def seed_rng(self, seed=None):
+        """(Re)seed the engine's private RNG; None draws a fresh OS seed.
+
+        Every engine-side random choice (dice, deals, pairing order, ...) comes
+        from ``self._rng``, which agent code is never handed, so an agent that
+        reseeds the module-level ``random`` cannot steer or predict the game.
+        An explicit seed also seeds that shared module RNG from its own derived
+        stream, so a run with deterministic-given-seed agents reproduces
+        exactly.
+        """
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        else:
+            random.seed(derive_seed(seed, "agents"))
+        self._seed = seed
+        self._rng = random.Random(seed)
+
+    def spawn_rng(self, *stream):
+        """An independent random.Random for sub-stream `stream` of this game's seed."""
+        return random.Random(derive_seed(self._seed, *stream))
+
+    @property
+    def recorder(self):
+        """Where the engine emits feedback events: a FeedbackRecorder while
+        verbose, otherwise NULL_RECORDER, which allocates and formats nothing.
+
+        Simulations run thousands of non-verbose games, so engines should
+        build an event only through the recorder (or under ``if recorder:``).
+        """
+        return FeedbackRecorder(self) if self.verbose else NULL_RECORDER
+
     def add_feedback(self, message):
         """Add a feedback message if verbose mode is on"""
         if self.verbose:
@@ -79,7 +366,9 @@ class BaseGame(ABC):
     def load_validation_players(self):
         """
         Load validation players from the game's validation_players module.
-        Each game must have a validation_players.py file with a 'players' list.
+        Each game must have a validation_players.py file with a
+        'player_factories' list (or a legacy 'players' list); see
+        spawn_validation_players.
         """
         try:
             # Get the name of the game from the class name
@@ -89,11 +378,13 @@ class BaseGame(ABC):
             module_path = f"backend.games.{game_name}.validation_players"
             validation_module = importlib.import_module(module_path)
 
-            # Get the players list and create a copy
-            if hasattr(validation_module, "players"):
+            # Build fresh players from the module's factories
+            if hasattr(validation_module, "player_factories") or hasattr(
+                validation_module, "players"
+            ):
                 # Only load if players list is empty
                 if not self.players:
-                    self.players = copy.deepcopy(validation_module.players)
+                    self.players = spawn_validation_players(validation_module)
                     self.scores = {str(player.name): 0 for player in self.players}
                 logger.info(
                     f"Successfully loaded {len(self.players)} validation players for {game_name}"
@@ -128,7 +419,10 @@ class BaseGame(ABC):
         module = importlib.import_module(
             f"backend.games.{game_name}.validation_players"
         )
-        return len(getattr(module, "players", []))
+        factories = getattr(module, "player_factories", None)
+        if factories is None:
+            factories = getattr(module, "players", [])
+        return len(factories)
 
     def get_player_strategies(self):
         """Map player name -> strategy for players that declare one.
@@ -214,10 +508,109 @@ class BaseGame(ABC):
                 f"{type(e).__name__}: {e}", traceback_str=traceback.format_exc()
             ) from e
 
+    def use_bot_baseline(self, focus_names):
+        """Play only the pairings of `focus_names` from now on, adding a
+        cached bot-vs-bot pass for every other pairing to play_game's results.
+
+        Returns False, changing nothing, when the game is not pairwise, its
+        baseline is missing or stale, or the other players are not exactly
+        the bots it was built for.
+        """
+        from backend.games import bot_baseline
+
+        if self.bot_baseline_stats is None:
+            return False
+        baseline = bot_baseline.load(type(self))
+        focus = frozenset(str(name) for name in focus_names)
+        others = sorted(str(p.name) for p in self.players if str(p.name) not in focus)
+        if baseline is None or others != baseline["bots"]:
+            return False
+        self._bot_baseline = baseline
+        self._baseline_focus = focus
+        return True
+
+    def player_pairs(self):
+        """The pairings of one round robin: every pair of players, or under a
+        bot baseline only the pairs with a focus player in them."""
+        pairs = itertools.combinations(self.players, 2)
+        if self._bot_baseline is None:
+            return list(pairs)
+        focus = self._baseline_focus
+        return [
+            (a, b) for a, b in pairs if str(a.name) in focus or str(b.name) in focus
+        ]
+
+    def _baseline_sample(self, results):
+        """The per-player stats of one play_game that a bot baseline records."""
+        table = results.get("table", {})
+        sample = {"points": results["points"]}
+        for stat in self.bot_baseline_stats:
+            sample[stat] = table[stat]
+        return sample
+
+    def play_pairing_passes(self, pair, passes, custom_rewards=None):
+        """Play `passes` passes of the game between the two players of `pair`
+        alone; returns their stats summed over the passes, in the shape of
+        _baseline_sample. The other players are back in place afterwards."""
+        players = self.players
+        self.players = list(pair)
+        totals = {}
+        try:
+            for _ in range(passes):
+                self.reset()
+                sample = self._baseline_sample(self.play_game(custom_rewards))
+                for stat, values in sample.items():
+                    total = totals.setdefault(stat, {})
+                    for name, value in values.items():
+                        total[name] = total.get(name, 0) + value
+        finally:
+            self.players = players
+            self.reset()
+        return totals
+
+    def _add_bot_baseline(self, results):
+        """Add a random cached bot-vs-bot pass to a play_game's results."""
+        from backend.games import bot_baseline
+
+        self._add_baseline_sample(
+            results, bot_baseline.draw(self._bot_baseline, self._rng)
+        )
+
+    def _add_baseline_sample(self, results, sample):
+        targets = [results["points"]]
+        if results.get("score_aggregate") is not results["points"]:
+            targets.append(results["score_aggregate"])
+        for target in targets:
+            for name, value in sample["points"].items():
+                target[name] = target.get(name, 0) + value
+        for stat in self.bot_baseline_stats:
+            target = results["table"][stat]
+            for name, value in sample[stat].items():
+                target[name] = target.get(name, 0) + value
+
+    def remove_player(self, name):
+        """Drop player `name` from the run, e.g. after a disqualification.
+
+        Games that carry per-player state across play_game calls override
+        this to forget it.
+        """
+        self.players = [p for p in self.players if str(p.name) != str(name)]
+        self.scores.pop(str(name), None)
+
+    def _play_verbose(self, custom_rewards=None):
+        """play_game with feedback on. The game is back to its previous
+        verbosity afterwards, so the simulations that follow the feedback
+        game record nothing."""
+        verbose = self.verbose
+        self.verbose = True
+        try:
+            return self.play_game(custom_rewards)
+        finally:
+            self.verbose = verbose
+
     def run_single_game_with_feedback(self, custom_rewards=None):
         """Run a single game with feedback"""
-        self.verbose = True  # Enable feedback for this run
-        results = self.play_game(custom_rewards)
+        results = self._play_verbose(custom_rewards)
         return {
             "results": results,
             "feedback": self.game_feedback,
@@ -0,0 +1,216 @@
+"""Cached bot-vs-bot results for validating pairwise games.
+
+In a pairwise game (one that sets BaseGame.bot_baseline_stats) every
+play_game is a round robin of independent pairings, and the validation bots
+never change between submissions: most of each validation used to replay
+the same bot-vs-bot matches. A baseline records, per game, the distribution
+of the stats each bot collects against the other bots in one bot-only
+play_game, over thousands of seeded passes, stored next to the game in
+bot_baseline.json. Validation then plays only the submission's pairings —
+O(bots) per pass instead of O(bots^2) — and adds a pass drawn from that
+distribution to each (BaseGame.use_bot_baseline). The bots' totals keep
+the spread of a full run, ties between whole-number scores included.
+
+A baseline belongs to one engine version (engine_source.engine_version,
+the digest validation results are cached under), and is ignored as soon as
+the game's sources or a module the engines share change. Build them at deploy, or let the worker rebuild stale ones
+at startup (celery_app._preload_games):
+
+    python -m backend.games.bot_baseline                  # every pairwise game
+    python -m backend.games.bot_baseline --game breakthrough
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import sys
+from collections import Counter
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from backend.games import engine_source
+
+logger = logging.getLogger(__name__)
+
+BASELINE_FILENAME = "bot_baseline.json"
+# Passes recorded per pass a validation plays. The bots' totals are sums of
+# draws from the recorded distribution, so its sampling error grows with
+# the validation's pass count: at 10x, the error of a total stays a third
+# of the total's own spread.
+BASELINE_PASSES_PER_VALIDATION_PASS = 10
+MIN_BASELINE_PASSES = 50
+BASELINE_SEED = 0
+
+# Baselines read in this process, by game name (None: missing or stale).
+# The worker parent fills it before forking, so children inherit it.
+_loaded: Dict[str, Optional[Dict[str, Any]]] = {}
+
+
+def _game_name(game_class) -> str:
+    return game_class.__module__.split(".")[2]
+
+
+def _game_dir(game_class) -> Path:
+    return Path(sys.modules[game_class.__module__].__file__).parent
+
+
+def baseline_path(game_class) -> Path:
+    return _game_dir(game_class) / BASELINE_FILENAME
+
+
+def engine_version(game_class) -> str:
+    """The engine version of the sources that decide the game's bot-vs-bot
+    results."""
+    return engine_source.engine_version(_game_name(game_class))
+
+
+def default_passes(game_class) -> int:
+    return max(
+        MIN_BASELINE_PASSES,
+        BASELINE_PASSES_PER_VALIDATION_PASS * game_class.validation_simulations,
+    )
+
+
+def build(
+    game_class, passes: Optional[int] = None, seed: int = BASELINE_SEED
+) -> Dict[str, Any]:
+    """Play `passes` seeded bot-only passes (default_passes when None) and
+    record the distribution of the bots' stats.
+
+    ``samples`` holds each distinct outcome once, most frequent first, as
+    ``[count, outcome]``; ``outcome[j][k]`` is stat ``stats[j]`` of bot
+    ``bots[k]``.
+    """
+    from backend.database.db_models import League
+    from backend.time_utils import utc_now
+
+    game_name = _game_name(game_class)
+    league = League(
+        name="bot_baseline_league",
+        created_date=utc_now(),
+        expiry_date=utc_now() + timedelta(days=1),
+        game=game_name,
+    )
+    passes = passes or default_passes(game_class)
+    game = game_class(league)
+    game.seed_rng(seed)
+    bots = sorted(str(p.name) for p in game.players)
+    stats = None
+    outcomes = Counter()
+    for _ in range(passes):
+        game.reset()
+        sample = game._baseline_sample(game.play_game())
+        stats = stats or list(sample)
+        outcomes[tuple(tuple(sample[stat][bot] for bot in bots) for stat in stats)] += 1
+    return {
+        "game": game_name,
+        "engine_version": engine_version(game_class),
+        "passes": passes,
+        "seed": seed,
+        "bots": bots,
+        "stats": stats,
+        "samples": [
+            [count, [list(values) for values in outcome]]
+            for outcome, count in outcomes.most_common()
+        ],
+    }
+
+
+def draw(baseline: Dict[str, Any], rng) -> Dict[str, Dict[str, float]]:
+    """One bot-only pass drawn from the recorded distribution with `rng`,
+    as {stat: {bot: value}}."""
+    if "_cum_counts" not in baseline:
+        counts = (count for count, _ in baseline["samples"])
+        baseline["_cum_counts"] = list(itertools.accumulate(counts))
+    samples = baseline["samples"]
+    _, sample = rng.choices(samples, cum_weights=baseline["_cum_counts"])[0]
+    bots = baseline["bots"]
+    return {
+        stat: dict(zip(bots, values))
+        for stat, values in zip(baseline["stats"], sample)
+    }
+
+
+def write(game_class, baseline: Dict[str, Any]) -> Path:
+    path = baseline_path(game_class)
+    # One outcome per line keeps the file readable and diffable.
+    lines = ",\n".join(json.dumps(sample) for sample in baseline["samples"])
+    header = json.dumps(
+        {k: v for k, v in baseline.items() if k != "samples" and k[0] != "_"}
+    )
+    path.write_text(f'{header[:-1]}, "samples": [\n{lines}\n]}}\n')
+    _loaded[_game_name(game_class)] = baseline
+    return path
+
+
+def load(game_class) -> Optional[Dict[str, Any]]:
+    """The game's baseline, or None when it is missing or stale."""
+    game_name = _game_name(game_class)
+    if game_name not in _loaded:
+        _loaded[game_name] = _read(game_class)
+    return _loaded[game_name]
+
+
+def _read(game_class) -> Optional[Dict[str, Any]]:
+    try:
+        baseline = json.loads(baseline_path(game_class).read_text())
+    except (OSError, ValueError):
+        return None
+    if baseline.get("engine_version") != engine_version(game_class):
+        return None
+    return baseline
+
+
+def pairwise_games() -> List[str]:
+    """The games in config.GAMES that support a bot baseline."""
+    from backend.config import GAMES
+    from backend.games.game_factory import GameFactory
+
+    return [
+        name
+        for name in GAMES
+        if GameFactory.get_game_class(name).bot_baseline_stats is not None
+    ]
+
+
+def ensure_all() -> List[str]:
+    """Load every pairwise game's baseline, rebuilding missing or stale ones;
+    returns the games that were rebuilt. A baseline that cannot be written
+    (read-only tree) is still kept for this process. A game that fails is
+    logged and skipped: validation falls back to the full round robin."""
+    from backend.games.game_factory import GameFactory
+
+    rebuilt = []
+    for game_name in pairwise_games():
+        game_class = GameFactory.get_game_class(game_name)
+        try:
+            if load(game_class) is not None:
+                continue
+            baseline = build(game_class)
+            _loaded[game_name] = baseline
+            rebuilt.append(game_name)
+            write(game_class, baseline)
+        except Exception:
+            logger.exception(f"Could not build the bot baseline for {game_name}")
+    return rebuilt
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from backend.games.game_factory import GameFactory
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--game", help="build one game's baseline")
+    parser.add_argument("--passes", type=int, help="default: default_passes")
+    args = parser.parse_args(argv)
+
+    for game_name in [args.game] if args.game else pairwise_games():
+        game_class = GameFactory.get_game_class(game_name)
+        path = write(game_class, build(game_class, args.passes))
+        print(f"{game_name}: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
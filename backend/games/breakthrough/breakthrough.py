@@ -1,7 +1,7 @@
 import itertools
-import random
+from collections.abc import Set
 
-from backend.games.base_game import BaseGame
+from backend.games.base_game import AppendOnlyView, BaseGame
 
 GRID_SIZE = 100
 MOVE_CAP = 1000
@@ -22,11 +22,72 @@ DIRECTIONS = {
 DEFAULT_REWARDS = [100, 100, 100, 100, 50]
 
 
+class _Trail:
+    """One dot's trail through a match: ``cells`` in visit order, and
+    ``first_visit`` mapping each distinct cell to the index in ``cells`` of
+    its first visit (in first-visit order). Both only ever grow."""
+
+    __slots__ = ("cells", "first_visit")
+
+    def __init__(self, start):
+        self.cells = [start]
+        self.first_visit = {start: 0}
+
+    def append(self, cell):
+        if cell not in self.first_visit:
+            self.first_visit[cell] = len(self.cells)
+        self.cells.append(cell)
+
+
+class _VisitedView(Set):
+    """Read-only set of the distinct cells of a trail as it was when the view
+    was made: O(1) to hand out and O(1) membership. Prints like the set;
+    copies are plain sets."""
+
+    __slots__ = ("_first_visit", "_length", "_size")
+
+    def __init__(self, trail):
+        self._first_visit = trail.first_visit
+        self._length = len(trail.cells)
+        self._size = len(trail.first_visit)
+
+    def __contains__(self, cell):
+        try:
+            return self._first_visit.get(cell, self._length) < self._length
+        except TypeError:
+            return False  # unhashable, so never a visited (x, y) tuple
+
+    def __iter__(self):
+        return itertools.islice(self._first_visit, self._size)
+
+    def __len__(self):
+        return self._size
+
+    @classmethod
+    def _from_iterable(cls, cells):
+        return set(cells)
+
+    def __repr__(self):
+        return repr(set(self))
+
+    def __reduce__(self):
+        return set, (set(self),)
+
+
 class BreakthroughGame(BaseGame):
     # Benchmarked: ~104ms per simulation (a full round-robin of board games)
     # + ~100ms feedback game keeps validation <1s.
     validation_simulations = 5
 
+    # Per simulation: a board game per pairing; each board game is bounded by
+    # its turn limit and keeps only its own traces. Time measures O(N^2.2) to
+    # O(N^2.5) over 4..64 players: on top of the N(N-1) matches, Rusher's
+    # short matches are half of a 4-player league's but a third of a big one's.
+    player_scaling = {"time": 2.5, "memory": 1}
+
+    # Matches are independent; these table entries add up over them.
+    bot_baseline_stats = ("matches_played", "wins", "catches", "breakthroughs")
+
     starter_code = """
 from games.breakthrough.player import Player
 import random
@@ -46,6 +107,8 @@ class CustomPlayer(Player):
         #   opp_frozen  - True if the opponent hit a mine (they can't move again)
         #   my_trace    - list of every cell you have visited
         #   opp_trace   - list of every cell your opponent has visited
+        #   my_visited  - set of the distinct cells in my_trace
+        #   opp_visited - set of the distinct cells in opp_trace
         #   grid_size   - 100
         #   move_cap    - 1000
         #
@@ -131,6 +194,8 @@ a sitting duck — walk over and catch them.
 - `my_mine` — where your laid mine sits, or `None` (the opponent's is hidden)
 - `opp_frozen` — `True` once the opponent has been blown up by your mine
 - `my_trace` / `opp_trace` — every cell each dot has visited, in order
+- `my_visited` / `opp_visited` — the same cells as a set, for fast `in` checks
+  (both traces and sets are read-only; `list(...)` / `set(...)` gives a copy)
 - `grid_size` (100) and `move_cap` (1000)
 
 ## 4. Scoring (defaults)
@@ -227,7 +292,7 @@ Defaults: `[100, 100, 100, 100, 50]`.
     def _get_decision(self, player, game_state):
         """Get a player's move; exceptions and unparseable moves abort the match."""
         try:
-            raw = player.make_decision(game_state)
+            raw = self.profiler.time(player.name, player.make_decision, game_state)
         except Exception as e:
             raise ValueError(f"Invalid move by {player.name}: {e}")
         move = self._normalize_move(raw)
@@ -250,7 +315,7 @@ Defaults: `[100, 100, 100, 100, 50]`.
         return (nx, ny), boost
 
     def _build_state(
-        self, role, turn, my_pos, opp_pos, my_boosts, opp_boosts, my_trace, opp_trace,
+        self, role, turn, my_pos, opp_pos, my_boosts, opp_boosts, my_trail, opp_trail,
         my_mines, opp_mines, my_mine, opp_frozen,
     ):
         return {
@@ -264,8 +329,10 @@ Defaults: `[100, 100, 100, 100, 50]`.
             "opp_mines": opp_mines,
             "my_mine": my_mine,
             "opp_frozen": opp_frozen,
-            "my_trace": list(my_trace),
-            "opp_trace": list(opp_trace),
+            "my_trace": AppendOnlyView(my_trail.cells),
+            "opp_trace": AppendOnlyView(opp_trail.cells),
+            "my_visited": _VisitedView(my_trail),
+            "opp_visited": _VisitedView(opp_trail),
             "grid_size": self.grid_size,
             "move_cap": self.move_cap,
         }
@@ -296,8 +363,8 @@ Defaults: `[100, 100, 100, 100, 50]`.
         else:
             margin = min(20, self.grid_size // 5)
             start_x = min(self.defender_start_x, self.grid_size - 2)
-            a_pos = (0, random.randint(margin, self.grid_size - 1 - margin))
-            d_pos = (start_x, random.randint(margin, self.grid_size - 1 - margin))
+            a_pos = (0, self._rng.randint(margin, self.grid_size - 1 - margin))
+            d_pos = (start_x, self._rng.randint(margin, self.grid_size - 1 - margin))
 
         attacker.role = "attacker"
         defender.role = "defender"
@@ -305,9 +372,10 @@ Defaults: `[100, 100, 100, 100, 50]`.
         a_mines = d_mines = self.mines_per_player
         a_mine_pos = d_mine_pos = None  # where each player's own mine sits
         a_frozen = d_frozen = False
-        a_trace, d_trace = [a_pos], [d_pos]
+        a_trail, d_trail = _Trail(a_pos), _Trail(d_pos)
         furthest_x = a_pos[0]
         goal_x = self.grid_size - 1
+        recorder = self.recorder
 
         match = {
             "attacker": str(attacker.name),
@@ -329,7 +397,7 @@ Defaults: `[100, 100, 100, 100, 50]`.
                 a_dir, a_boost, a_mine = "STAY", False, False
             else:
                 a_state = self._build_state(
-                    "attacker", turn, a_pos, d_pos, a_boosts, d_boosts, a_trace, d_trace,
+                    "attacker", turn, a_pos, d_pos, a_boosts, d_boosts, a_trail, d_trail,
                     a_mines, d_mines, a_mine_pos, d_frozen,
                 )
                 a_dir, a_boost, a_mine = self._get_decision(attacker, a_state)
@@ -337,7 +405,7 @@ Defaults: `[100, 100, 100, 100, 50]`.
                 d_dir, d_boost, d_mine = "STAY", False, False
             else:
                 d_state = self._build_state(
-                    "defender", turn, d_pos, a_pos, d_boosts, a_boosts, d_trace, a_trace,
+                    "defender", turn, d_pos, a_pos, d_boosts, a_boosts, d_trail, a_trail,
                     d_mines, a_mines, d_mine_pos, a_frozen,
                 )
                 d_dir, d_boost, d_mine = self._get_decision(defender, d_state)
@@ -376,13 +444,13 @@ Defaults: `[100, 100, 100, 100, 50]`.
             )
 
             a_pos, d_pos = new_a, new_d
-            if a_trace[-1] != a_pos:
-                a_trace.append(a_pos)
-            if d_trace[-1] != d_pos:
-                d_trace.append(d_pos)
+            if a_trail.cells[-1] != a_pos:
+                a_trail.append(a_pos)
+            if d_trail.cells[-1] != d_pos:
+                d_trail.append(d_pos)
             furthest_x = max(furthest_x, a_pos[0])
 
-            if self.verbose:
+            if recorder:
                 turn_record = {
                     "a": list(a_pos),
                     "d": list(d_pos),
@@ -444,9 +512,10 @@ Defaults: `[100, 100, 100, 100, 50]`.
         breakthroughs = {str(p.name): 0 for p in self.players}
         matches_played = {str(p.name): 0 for p in self.players}
 
-        player_pairs = list(itertools.combinations(self.players, 2))
-        random.shuffle(player_pairs)
+        player_pairs = self.player_pairs()
+        self._rng.shuffle(player_pairs)
 
+        recorder = self.recorder
         for p1, p2 in player_pairs:
             for attacker, defender in ((p1, p2), (p2, p1)):
                 match, a_score, d_score = self.play_match(attacker, defender, rewards)
@@ -465,11 +534,10 @@ Defaults: `[100, 100, 100, 100, 50]`.
                     if match["result"] == "caught":
                         catches[d_name] += 1
 
-                if self.verbose:
-                    self.game_feedback["matches"].append(match)
+                recorder.record("matches", match)
 
         points = {name: round(value, 1) for name, value in scores.items()}
-        return {
+        results = {
             "points": points,
             "score_aggregate": dict(points),
             "table": {
@@ -479,6 +547,9 @@ Defaults: `[100, 100, 100, 100, 50]`.
                 "breakthroughs": breakthroughs,
             },
         }
+        if self._bot_baseline is not None:
+            self._add_bot_baseline(results)
+        return results
 
     def run_simulations(self, num_simulations, league, custom_rewards=None):
         """Run multiple simulations, capping total matches (matches run up to 1000 turns)."""
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from backend.games.base_game import plain_data
+
 
 class Player(ABC):
     def __init__(self):
@@ -9,7 +11,8 @@ class Player(ABC):
 
     def add_feedback(self, message):
         """Add feedback that will be visible in the game output"""
-        self.feedback.append(message)
+        # A snapshot, even of the trace views in game_state
+        self.feedback.append(plain_data(message))
 
     @abstractmethod
     def make_decision(self, game_state):
@@ -33,6 +36,9 @@ class Player(ABC):
                   up by your mine — they can never move again
                 - my_trace (list): Every cell you have visited, in order
                 - opp_trace (list): Every cell your opponent has visited
+                - my_visited (set): The distinct cells of my_trace
+                - opp_visited (set): The distinct cells of opp_trace
+                  (traces and visited sets are read-only)
                 - grid_size (int): Board is grid_size x grid_size
                 - move_cap (int): Match ends in a timeout after this many turns
 
@@ -222,7 +222,10 @@ class MineAvoider(Player):
     def _risky(self, cell, game_state):
         if game_state["opp_mines"] == 0:
             # Their mine is armed somewhere along their trail
-            if cell in {tuple(c) for c in game_state["opp_trace"]}:
+            visited = game_state.get("opp_visited")
+            if visited is None:
+                visited = {tuple(c) for c in game_state["opp_trace"]}
+            if cell in visited:
                 return True
         elif cell == tuple(game_state["opp_pos"]):
             # They may mine the cell they stand on this very turn
@@ -260,11 +263,13 @@ class MineAvoider(Player):
         return "STAY"  # the cell we stand on is always mine-free
 
 
-players = [
-    RandomWanderer(),
-    Rusher(),
-    WallKeeper(),
-    Juker(),
-    MineTrapper(),
-    MineAvoider(),
+player_factories = [
+    RandomWanderer,
+    Rusher,
+    WallKeeper,
+    Juker,
+    MineTrapper,
+    MineAvoider,
 ]
+
+players = [factory() for factory in player_factories]
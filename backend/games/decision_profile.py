@@ -0,0 +1,250 @@
+"""Per-player decision latency, recorded around every agent call.
+
+Each engine routes its make_decision / make_combat_decision calls through
+``game.profiler.time(player.name, method, *args)``. Per player the profiler
+keeps an exact count, total and max plus a log-bucketed histogram (8 buckets
+per power of two, so p50/p99 are within 1/8 of the true value) in a flat list
+indexed by bucket — a handful of integer operations per call on top of the two
+clock reads, and bounded memory however many games a run plays.
+Whatever wall time is not spent inside agents is the engine's own: building
+state, checking moves, recording feedback.
+
+The raw state is plain JSON-able data, so shards of a sharded simulation ship
+it in their results and the merge step folds them with ``merged``.
+
+With a budget set (``set_budget``), the same choke point pins slowness on the
+agent responsible: a call over the per-decision budget is an overrun, and a
+player with more than ``max_overruns`` of them — or a single call past the
+hard limit — is disqualified by raising DecisionBudgetExceeded. The hard limit
+also needs someone to stop a call that never returns; see
+backend/tasks/decision_budget.py.
+"""
+
+from time import perf_counter_ns
+from typing import Any, Dict, Iterable, Optional
+
+# log2 of the sub-buckets per power of two.
+_SUB_BITS = 3
+_SUB_MASK = (1 << _SUB_BITS) - 1
+# Durations below 2**(_SUB_BITS + 1) ns get a bucket each.
+_EXACT_LIMIT = 1 << (_SUB_BITS + 1)
+# Enough slots for any 64-bit duration.
+_BUCKETS = (64 + 1) << _SUB_BITS
+# Budget of a profiler with no budget set: no duration exceeds it.
+_NO_BUDGET = 1 << 64
+
+
+def _bucket(ns: int) -> int:
+    # Inlined in DecisionProfiler.time; keep the two in step.
+    if ns < _EXACT_LIMIT:
+        return ns
+    bits = ns.bit_length()
+    return (bits << _SUB_BITS) | ((ns >> (bits - 1 - _SUB_BITS)) & _SUB_MASK)
+
+
+def _bucket_upper(bucket: int) -> int:
+    """Largest duration (ns) that falls in `bucket`."""
+    if bucket < _EXACT_LIMIT:
+        return bucket
+    bits, mantissa = bucket >> _SUB_BITS, bucket & _SUB_MASK
+    shift = bits - 1 - _SUB_BITS
+    return ((((1 << _SUB_BITS) | mantissa) + 1) << shift) - 1
+
+
+def _ms(ns: float) -> float:
+    return round(ns / 1e6, 4)
+
+
+class DecisionBudgetExceeded(BaseException):
+    """An agent was disqualified for exceeding its per-decision time budget.
+
+    A BaseException on purpose: it must pass through the engines' and the
+    agents' own ``except Exception`` handlers and reach the task, which drops
+    ``player_name`` from the run. ``reason`` is a human-readable sentence
+    fragment ("3 decisions over the 250 ms budget ...").
+    """
+
+    def __init__(self, player_name: str, reason: str):
+        super().__init__(f"{player_name} disqualified: {reason}")
+        self.player_name = player_name
+        self.reason = reason
+
+
+class DecisionProfiler:
+    """Times agent calls per player; `summary()` reports where the time went."""
+
+    def __init__(self):
+        self.set_budget(None)
+        self.reset()
+
+    @classmethod
+    def merged(cls, states: Iterable[Dict[str, Any]]) -> "DecisionProfiler":
+        """A profiler holding only the given `state()`s (its own clock stopped)."""
+        profiler = cls()
+        profiler._start = None
+        for state in states:
+            profiler.merge(state)
+        return profiler
+
+    def reset(self) -> None:
+        """Drop the timings recorded and restart the wall clock.
+
+        Budget overruns and disqualifications are kept: they belong to the
+        run, and a run resets the timings after its feedback game.
+        """
+        # name -> [count, total_ns, max_ns, [count per bucket]]
+        self.players: Dict[str, list] = {}
+        self.extra_wall_ns = 0
+        self._start = perf_counter_ns()
+
+    def set_budget(
+        self,
+        budget_ms: Optional[float],
+        hard_limit_ms: Optional[float] = None,
+        max_overruns: int = 0,
+    ) -> None:
+        """Enforce a per-decision budget from now on; None lifts it.
+
+        Clears the overruns and disqualifications recorded so far.
+        """
+        self.budget_ms = budget_ms
+        self.hard_limit_ms = hard_limit_ms
+        self.max_overruns = max_overruns
+        self._budget_ns = (
+            int(budget_ms * 1e6) if budget_ms is not None else _NO_BUDGET
+        )
+        self._hard_limit_ns = (
+            int(hard_limit_ms * 1e6) if hard_limit_ms is not None else _NO_BUDGET
+        )
+        self._overrun_ns = min(self._budget_ns, self._hard_limit_ns)
+        self.overruns: Dict[str, int] = {}
+        self.disqualified: Dict[str, str] = {}
+        # The call in flight, for the watchdog: start (0 when idle) and player.
+        self._call_start = 0
+        self._call_name = None
+
+    def overdue(self) -> Optional[str]:
+        """Player whose call in flight is past the hard limit, if any."""
+        start, name = self._call_start, self._call_name
+        if start and perf_counter_ns() - start > self._hard_limit_ns:
+            return name
+        return None
+
+    def time(self, name, method, *args):
+        """Call ``method(*args)`` and charge its duration to player `name`.
+
+        Raises DecisionBudgetExceeded when this call disqualifies `name`.
+        """
+        start = perf_counter_ns()
+        self._call_name = name
+        self._call_start = start
+        try:
+            return method(*args)
+        finally:
+            ns = perf_counter_ns() - start
+            self._call_start = 0
+            acc = self.players.get(name)
+            if acc is None:
+                acc = self.players[name] = [0, 0, 0, [0] * _BUCKETS]
+            acc[0] += 1
+            acc[1] += ns
+            if ns > acc[2]:
+                acc[2] = ns
+            if ns < _EXACT_LIMIT:
+                acc[3][ns] += 1
+            else:
+                bits = ns.bit_length()
+                acc[3][
+                    (bits << _SUB_BITS) | ((ns >> (bits - 1 - _SUB_BITS)) & _SUB_MASK)
+                ] += 1
+            if ns > self._overrun_ns:
+                self._overrun(name, ns)
+
+    def _overrun(self, name, ns: int) -> None:
+        count = self.overruns[name] = self.overruns.get(name, 0) + 1
+        if ns > self._hard_limit_ns:
+            reason = (
+                f"a single decision took {ns / 1e6:.0f} ms "
+                f"(hard limit {self.hard_limit_ms:g} ms)"
+            )
+        elif count > self.max_overruns:
+            reason = (
+                f"{count} decisions over the {self.budget_ms:g} ms per-decision "
+                f"budget (slowest {_ms(self.players[name][2]):g} ms)"
+            )
+        else:
+            return
+        self.disqualified[str(name)] = reason
+        raise DecisionBudgetExceeded(str(name), reason)
+
+    def wall_ns(self) -> int:
+        own = perf_counter_ns() - self._start if self._start is not None else 0
+        return own + self.extra_wall_ns
+
+    def state(self) -> Dict[str, Any]:
+        """JSON-able raw state; histograms are sparse {bucket: count} maps
+        (whose keys become strings in JSON)."""
+        return {
+            "wall_ns": self.wall_ns(),
+            "players": {
+                str(name): [count, total, peak, self._sparse(hist)]
+                for name, (count, total, peak, hist) in self.players.items()
+            },
+            "overruns": {str(name): n for name, n in self.overruns.items()},
+            "disqualified": dict(self.disqualified),
+        }
+
+    @staticmethod
+    def _sparse(hist: list) -> Dict[int, int]:
+        return {bucket: n for bucket, n in enumerate(hist) if n}
+
+    def merge(self, state: Dict[str, Any]) -> None:
+        """Fold in another profiler's `state()`, e.g. from another shard."""
+        self.extra_wall_ns += state["wall_ns"]
+        for name, (count, total, peak, hist) in state["players"].items():
+            acc = self.players.get(name)
+            if acc is None:
+                acc = self.players[name] = [0, 0, 0, [0] * _BUCKETS]
+            acc[0] += count
+            acc[1] += total
+            acc[2] = max(acc[2], peak)
+            for bucket, n in hist.items():
+                acc[3][int(bucket)] += n
+        for name, n in state.get("overruns", {}).items():
+            self.overruns[name] = self.overruns.get(name, 0) + n
+        self.disqualified.update(state.get("disqualified", {}))
+
+    @staticmethod
+    def _percentile(hist: list, count: int, q: float) -> int:
+        rank = q * count
+        seen = 0
+        for bucket, n in enumerate(hist):
+            seen += n
+            if n and seen >= rank:
+                return _bucket_upper(bucket)
+        return 0
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-player count/total/mean/p50/p99/max (ms) and budget overruns,
+        agent vs engine time, and who was disqualified and why."""
+        players = {}
+        agent_ns = 0
+        for name, (count, total, peak, hist) in self.players.items():
+            agent_ns += total
+            players[str(name)] = {
+                "count": count,
+                "total_ms": _ms(total),
+                "mean_ms": _ms(total / count) if count else 0.0,
+                "p50_ms": _ms(min(self._percentile(hist, count, 0.50), peak)),
+                "p99_ms": _ms(min(self._percentile(hist, count, 0.99), peak)),
+                "max_ms": _ms(peak),
+                "overruns": self.overruns.get(name, 0),
+            }
+        wall_ns = self.wall_ns()
+        return {
+            "players": players,
+            "wall_ms": _ms(wall_ns),
+            "agent_ms": _ms(agent_ns),
+            "engine_ms": _ms(max(0, wall_ns - agent_ns)),
+            "disqualified": dict(self.disqualified),
+        }
@@ -0,0 +1,35 @@
+"""Engine version: a digest of the source that decides a game's results.
+
+Everything cached across processes and deploys keys on it — validation
+results and league pairings (backend.tasks.validation_cache,
+backend.tasks.pairing_cache) and the bot-vs-bot baselines (bot_baseline) —
+so a deploy that changes an engine, its player base class, its validation
+bots or a module the engines share never serves a result computed by the
+old code.
+"""
+
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+from backend.config import ROOT_DIR
+
+
+@lru_cache(maxsize=None)
+def engine_version(game_name: str) -> str:
+    """Digest of the source a run of `game_name` executes.
+
+    Covers every .py file of the game's package plus every module shared by
+    the engines (the .py files directly under games/: base_game,
+    table_tournament, placements, decision_profile, bot_baseline, ...);
+    computed once per process, since the source cannot change under a
+    running process.
+    """
+    games_dir = Path(ROOT_DIR) / "games"
+    shared_sources = sorted(games_dir.glob("*.py"))
+    game_sources = sorted((games_dir / game_name).rglob("*.py"))
+    digest = hashlib.sha256()
+    for path in [*shared_sources, *game_sources]:
+        digest.update(str(path.relative_to(games_dir)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
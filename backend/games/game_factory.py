@@ -1,9 +1,12 @@
 import importlib
 import inspect
+import logging
 
 from backend.config import GAMES
 from backend.games.base_game import BaseGame
 
+logger = logging.getLogger(__name__)
+
 
 class GameFactory:
     _cache = {}
@@ -41,3 +44,29 @@ class GameFactory:
         raise ValueError(
             f"No BaseGame subclass found in backend.games.{game_name}.{game_name}"
         )
+
+    @staticmethod
+    def preload_all(league=None):
+        """Import and warm every game in GAMES; returns the names that loaded.
+
+        Resolves each game class, imports its player and validation_players
+        modules and builds one throwaway instance, so constructor-time work
+        (spawning validation players, anything a game precomputes) has run
+        once. The Celery worker parent calls this before forking (see
+        celery_app._preload_games) so every one-task child inherits it all
+        copy-on-write instead of re-importing per task. A game that fails to
+        load is logged and skipped: one broken game must not keep the worker
+        from booting.
+        """
+        loaded = []
+        for game_name in GAMES:
+            try:
+                game_class = GameFactory.get_game_class(game_name)
+                for module in ("player", "validation_players"):
+                    importlib.import_module(f"backend.games.{game_name}.{module}")
+                game_class(league)
+            except Exception:
+                logger.exception(f"Could not preload game {game_name}")
+                continue
+            loaded.append(game_name)
+        return loaded
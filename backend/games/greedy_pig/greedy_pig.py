@@ -1,8 +1,81 @@
-import random
+
+from bisect import bisect_left, insort
 
 from backend.config import ROOT_DIR
-from backend.games.base_game import BaseGame
+from backend.games.base_game import BaseGame, ReadOnlyMapping
 from backend.games.greedy_pig.player import Player as GreedyPigPlayer
+from backend.games.placements import placement_points, span_key, tied_spans
+
+
+class _GameState(dict):
+    """One player's game_state: a plain dict over the roll's shared maps,
+    carrying the roll's snapshot so Player.my_rank need not sort."""
+
+    __slots__ = ("snapshot",)
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class _RollSnapshot:
+    """The money maps and ranking the decisions on one roll read.
+
+    Built once per roll and kept up to date as each seat adds the roll to
+    its own unbanked money, so a player decides on the state as it is at
+    its turn (earlier seats with the roll, later ones without) without
+    rebuilding O(N) state per decision. The ranking is sorted on the roll's
+    first my_rank call and from then on moved in O(log N) per seat. Banking
+    moves money between the maps but leaves a player's total, and so the
+    ranking, unchanged.
+    """
+
+    def __init__(self, players):
+        # One pair of money maps is shared by every player's game_state on
+        # the roll, so agents get read-only views of them.
+        self._banked = {p.name: p.banked_money for p in players}
+        self._unbanked = {p.name: p.unbanked_money for p in players}
+        self.banked = ReadOnlyMapping(self._banked)
+        self.unbanked = ReadOnlyMapping(self._unbanked)
+        self._seats = {p.name: seat for seat, p in enumerate(players)}
+        # (-total, seat) of every player, sorted: the order of Player.my_rank's
+        # sort, by total with ties in seat order. None until first needed.
+        self._order = None
+
+    def _key(self, name):
+        return -(self._banked[name] + self._unbanked[name]), self._seats[name]
+
+    def add_roll(self, player):
+        """Take in `player`'s unbanked money once the roll is added to it."""
+        name = player.name
+        if self._order is not None:
+            banked, seat = self._banked[name], self._seats[name]
+            old_key = (-(banked + self._unbanked[name]), seat)
+            del self._order[bisect_left(self._order, old_key)]
+            insort(self._order, (-(banked + player.unbanked_money), seat))
+        self._unbanked[name] = player.unbanked_money
+
+    def rank(self, name):
+        """`name`'s 1-based rank by total money; 0 for an unknown name."""
+        if name not in self._seats:
+            return 0
+        if self._order is None:
+            self._order = sorted(map(self._key, self._seats))
+        return bisect_left(self._order, self._key(name)) + 1
+
+    def bank(self, player):
+        self._banked[player.name] = player.banked_money
+        self._unbanked[player.name] = player.unbanked_money
+
+    def view(self, round_no, roll_no, players_banked_this_round):
+        state = _GameState(
+            round_no=round_no,
+            roll_no=roll_no,
+            players_banked_this_round=players_banked_this_round,
+            banked_money=self.banked,
+            unbanked_money=self.unbanked,
+        )
+        state.snapshot = self
+        return state
 
 
 class GreedyPigGame(BaseGame):
@@ -14,6 +87,10 @@ class GreedyPigGame(BaseGame):
     # Benchmarked: ~0.8ms per simulation keeps validation <1s.
     validation_simulations = 300
 
+    # Every roll asks each active player; their game_states share one
+    # per-roll snapshot.
+    player_scaling = {"time": 1, "memory": 1}
+
     starter_code = """
 from games.greedy_pig.player import Player
 import random
@@ -59,6 +136,7 @@ class CustomPlayer(Player):
     <li><code>banked_money</code>: Dictionary of each player's banked money</li>
     <li><code>unbanked_money</code>: Dictionary of each player's unbanked money</li>
 </ul>
+<p>The two money dictionaries are read-only; use <code>dict(...)</code> for a copy you can change.</p>
 
 <h2>4. Helpful Methods</h2>
 <p>You can use the following methods in your implementation:</p>
@@ -151,60 +229,57 @@ and the rewards list is paid out top-down.
                 pass
 
     def roll_dice(self):
-        return random.randint(1, 6)
+        return self._rng.randint(1, 6)
 
     def get_game_state(self):
-        return {
-            "round_no": self.round_no,
-            "roll_no": self.roll_no,
-            "players_banked_this_round": self.players_banked_this_round,
-            "banked_money": {
-                player.name: player.banked_money for player in self.players
-            },
-            "unbanked_money": {
-                player.name: player.unbanked_money for player in self.players
-            },
-        }
+        return _RollSnapshot(self.players).view(
+            self.round_no, self.roll_no, self.players_banked_this_round
+        )
 
     def play_round(self):
         self.players_banked_this_round = []
         self.round_no += 1
         self.roll_no = 0
-
-        round_data = {
-            "round_no": self.round_no,
-            "rolls": [],
-            "end_of_round": {},
-        }
+        # Round, roll and per-player records exist only for feedback runs
+        recorder = self.recorder
+
+        if recorder:
+            round_data = {
+                "round_no": self.round_no,
+                "rolls": [],
+                "end_of_round": {},
+            }
 
         while True:
             self.roll_no += 1
-            random.seed()  # Reset random seed each roll to prevent manipulation
             roll = self.roll_dice()
 
-            roll_data = {
-                "roll_no": self.roll_no,
-                "dice_value": roll,
-                "busted": roll == 1,
-                "players": [],
-            }
+            if recorder:
+                roll_data = {
+                    "roll_no": self.roll_no,
+                    "dice_value": roll,
+                    "busted": roll == 1,
+                    "players": [],
+                }
 
             if roll == 1:
                 # Everyone busts - record state before reset
                 for player in self.active_players:
-                    player_roll_data = {
-                        "name": player.name,
-                        "unbanked_before": player.unbanked_money,
-                        "unbanked": 0,
-                        "banked": player.banked_money,
-                        "action": None,
-                        "lost_money": player.unbanked_money > 0,
-                        "player_feedback": [],
-                    }
-                    roll_data["players"].append(player_roll_data)
+                    if recorder:
+                        roll_data["players"].append(
+                            {
+                                "name": player.name,
+                                "unbanked_before": player.unbanked_money,
+                                "unbanked": 0,
+                                "banked": player.banked_money,
+                                "action": None,
+                                "lost_money": player.unbanked_money > 0,
+                                "player_feedback": [],
+                            }
+                        )
                     player.reset_unbanked_money()
 
-                if self.verbose:
+                if recorder:
                     roll_data["all_players"] = {
                         p.name: {"banked": p.banked_money, "unbanked": p.unbanked_money}
                         for p in self.players
@@ -212,13 +287,22 @@ and the rewards list is paid out top-down.
                     round_data["rolls"].append(roll_data)
                 break
 
+            # Every decision on the roll reads one snapshot, which each seat
+            # adds the roll to as its turn comes.
+            snapshot = _RollSnapshot(self.players)
+
             # Process each active player's decision
             for player in self.active_players.copy():
                 if not player.has_banked_this_turn:
                     player.unbanked_money += roll
-                    player_state = self.get_game_state()
+                    snapshot.add_roll(player)
+                    player_state = snapshot.view(
+                        self.round_no, self.roll_no, self.players_banked_this_round
+                    )
                     try:
-                        decision = player.make_decision(player_state)
+                        decision = self.profiler.time(
+                            player.name, player.make_decision, player_state
+                        )
                     except Exception as e:
                         raise ValueError(
                             f"Invalid decision by {player.name}: {e}"
@@ -236,29 +320,31 @@ and the rewards list is paid out top-down.
                     if forced_bank:
                         decision = "bank"
 
-                    player_roll_data = {
-                        "name": player.name,
-                        "unbanked": player.unbanked_money,
-                        "banked": player.banked_money,
-                        "action": decision,
-                        "player_feedback": list(player.feedback),
-                    }
-                    if forced_bank:
-                        player_roll_data["forced_bank"] = True
+                    if recorder:
+                        player_roll_data = {
+                            "name": player.name,
+                            "unbanked": player.unbanked_money,
+                            "banked": player.banked_money,
+                            "action": decision,
+                            "player_feedback": list(player.feedback),
+                        }
+                        if forced_bank:
+                            player_roll_data["forced_bank"] = True
+                        roll_data["players"].append(player_roll_data)
                     player.feedback = []
 
                     if decision == "bank":
                         player.bank_money()
+                        snapshot.bank(player)
                         player.has_banked_this_turn = True
                         self.players_banked_this_round.append(player.name)
                         self.active_players.remove(player)
-                        # Update banked amount after banking
-                        player_roll_data["banked"] = player.banked_money
-                        player_roll_data["unbanked"] = player.unbanked_money
-
-                    roll_data["players"].append(player_roll_data)
+                        if recorder:
+                            # Update banked amount after banking
+                            player_roll_data["banked"] = player.banked_money
+                            player_roll_data["unbanked"] = player.unbanked_money
 
-            if self.verbose:
+            if recorder:
                 roll_data["all_players"] = {
                     p.name: {"banked": p.banked_money, "unbanked": p.unbanked_money}
                     for p in self.players
@@ -282,17 +368,17 @@ and the rewards list is paid out top-down.
         for player in self.players:
             player.reset_turn()
 
-        round_data["end_of_round"] = {
-            player.name: player.banked_money for player in self.players
-        }
-        if self.verbose:
-            self.game_feedback["rounds"].append(round_data)
+        if recorder:
+            round_data["end_of_round"] = {
+                player.name: player.banked_money for player in self.players
+            }
+            recorder.record("rounds", round_data)
 
     def play_game(self, custom_rewards=None):
         if self.verbose:
             self.game_feedback = {"game": "greedy_pig", "rounds": []}
 
-        random.shuffle(self.players)
+        self._rng.shuffle(self.players)
 
         while not self.game_over:
             self.active_players = list(self.players)
@@ -300,6 +386,11 @@ and the rewards list is paid out top-down.
 
         game_state = self.get_game_state()
         results = self.assign_points(game_state, custom_rewards)
+        if self.record_placements:
+            spans = tied_spans(results["score_aggregate"], highest_first=True)
+            results["placements"] = {
+                name: {span_key(*span): 1} for name, span in spans.items()
+            }
 
         if self.verbose:
             self.game_feedback["final_results"] = results["points"]
@@ -315,29 +406,14 @@ and the rewards list is paid out top-down.
             player: game_state["banked_money"][player]
             for player in game_state["banked_money"]
         }
-        sorted_players = sorted(
-            score_aggregate.items(), key=lambda x: x[1], reverse=True
-        )
-
         # Tied players pool the rewards for the placements they span and split
         # them equally — identical strategies share the prize instead of each
         # collecting it in full.
-        points = {}
-        i = 0
-        while i < len(sorted_players):
-            j = i
-            while (
-                j < len(sorted_players)
-                and sorted_players[j][1] == sorted_players[i][1]
-            ):
-                j += 1
-            pool = sum(rewards[k] for k in range(i, min(j, len(rewards))))
-            share = round(pool / (j - i), 2)
-            for player, _ in sorted_players[i:j]:
-                points[player] = share
-            i = j
-
-        return {"points": points, "score_aggregate": score_aggregate}
+        spans = tied_spans(score_aggregate, highest_first=True)
+        return {
+            "points": placement_points(spans, rewards),
+            "score_aggregate": score_aggregate,
+        }
 
     def reset(self):
         """Reset game state"""
@@ -362,19 +438,15 @@ and the rewards list is paid out top-down.
         """Run a single game with feedback"""
         import copy
         # Enable feedback for this run
-        self.verbose = True
         self.collect_player_feedback = True
 
         # Run the game
-        results = self.play_game(custom_rewards)
+        results = self._play_verbose(custom_rewards)
 
         # Deep copy feedback so subsequent reset/simulations can't mutate it
         feedback = copy.deepcopy(self.game_feedback)
         player_feedback = copy.deepcopy(self.player_feedback)
 
-        # Turn off verbose so run_simulations doesn't waste time building feedback
-        self.verbose = False
-
         return {
             "results": results,
             "feedback": feedback,
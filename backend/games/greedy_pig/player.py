@@ -21,6 +21,11 @@ class Player(ABC):
         self.has_banked_this_turn = False  # Reset banking status at the start of each turn
 
     def my_rank(self, game_state):
+        # The engine's game_state carries the roll's snapshot, which keeps
+        # the ranking up to date for every player
+        snapshot = getattr(game_state, "snapshot", None)
+        if snapshot is not None:
+            return snapshot.rank(self.name)
         # Extract the points_aggregate dictionary
         points_aggregate = dict()
         for player in game_state['banked_money']:
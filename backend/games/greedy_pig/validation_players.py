@@ -104,12 +104,14 @@ class AdaptiveRankStop(Player):
         return "continue"
 
 
-players = [
-    Bank5(),
-    Bank15(),
-    BankRoll3(),
-    BankRoll4(),
-    StopAt21(),
-    StopAt20Win100(),
-    AdaptiveRankStop(),
+player_factories = [
+    Bank5,
+    Bank15,
+    BankRoll3,
+    BankRoll4,
+    StopAt21,
+    StopAt20Win100,
+    AdaptiveRankStop,
 ]
+
+players = [factory() for factory in player_factories]
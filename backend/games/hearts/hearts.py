@@ -1,34 +1,25 @@
 """Hearts — the classic trick-avoidance card game, played at tables of 4.
 
 Tournament structure (driven by the simulation task calling play_game
-num_simulations times on one instance; None results are skipped):
-
-- 4 to EXHAUSTIVE_MAX_PLAYERS players: every possible group of 4 plays one
-  game per play_game call (one exhaustive pass), until MAX_TOTAL_GAMES.
-- More players: semi-random tables of 4 (greedy pair-coverage scheduler,
-  byes rotate to the most-played players) until every player has played
-  RECENT_GAMES_WINDOW games or MAX_TOTAL_GAMES is hit. Rankings count each
-  player's most recent RECENT_GAMES_WINDOW games only — play_game reports
-  per-call deltas of that sliding-window total, so the aggregator's running
-  sum always equals the windowed total.
+num_simulations times on one instance; None results are skipped): the shared
+table tournament of backend/games/table_tournament.py — every group of 4 for
+small leagues, scheduled tables of 4 with a sliding window of recent games
+for big ones.
 
 Scoring: placement points per game (default 4/2/1/0, ties share the mean).
 The raw Hearts score only feeds placements and the avg_points_per_hand stat.
 """
 
-import copy
-import itertools
-import random
-from collections import deque
+import functools
 
-from backend.games.base_game import BaseGame
+from backend.games.placements import tied_spans
+from backend.games.table_tournament import TABLE_SIZE, TableGame
 
 RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
 RANK_VALUE = {r: i for i, r in enumerate(RANKS, start=2)}
 SUITS = ["C", "D", "S", "H"]
 DECK = [r + s for s in SUITS for r in RANKS]
 
-TABLE_SIZE = 4
 PASS_DIRECTIONS = ["left", "right", "across", "hold"]
 DEFAULT_REWARDS = [4, 2, 1, 0]  # placement points for 1st..4th (lowest score first)
 
@@ -53,69 +44,131 @@ def sort_hand(cards):
     return sorted(cards, key=lambda c: (SUITS.index(card_suit(c)), card_rank_value(c)))
 
 
-class TableScheduler:
-    """Semi-random tables of 4: greedy pair coverage, byes to the most-played.
+# ------------------------------------------------------------ card sets
+# The engine keeps hands and played/remaining cards as 52-bit integers:
+# card DECK[i] is bit i, so a set read from its low bit up comes out in
+# sort_hand order, and suit or point filters are a single AND.
 
-    Round-based version of docs/hearts_tournament_scheduler.py phase 1. When
-    every pair has met, the uncovered set refills so later rounds keep mixing
-    opponents instead of collapsing into repeats.
-    """
+CARD_INDEX = {card: i for i, card in enumerate(DECK)}
+CARD_BIT = {card: 1 << i for i, card in enumerate(DECK)}
+CARD_POINTS = [card_points(card) for card in DECK]
+SUIT_MASKS = [((1 << len(RANKS)) - 1) << (len(RANKS) * i) for i in range(len(SUITS))]
+HEARTS_MASK = SUIT_MASKS[SUITS.index("H")]
+QUEEN_OF_SPADES = CARD_BIT["QS"]
+POINTS_MASK = HEARTS_MASK | QUEEN_OF_SPADES
+TWO_OF_CLUBS = CARD_BIT["2C"]
+FULL_DECK = (1 << len(DECK)) - 1
+
+
+def card_set(cards):
+    """The 52-bit set of `cards`."""
+    mask = 0
+    for card in cards:
+        mask |= CARD_BIT[card]
+    return mask
+
+
+# Per suit: the card codes of each 13-bit rank pattern seen so far.
+_SUIT_CARDS = [{} for _ in SUITS]
+
+
+def _suit_cards(suit, ranks):
+    base = suit * len(RANKS)
+    cards = _SUIT_CARDS[suit][ranks] = tuple(
+        DECK[base + i] for i in range(len(RANKS)) if ranks >> i & 1
+    )
+    return cards
 
-    def __init__(self, names, rng):
-        self.names = list(names)
-        self.rng = rng
-        self.count = {p: 0 for p in self.names}
-        self.uncovered = set(itertools.combinations(sorted(self.names), 2))
-
-    def _pair(self, p, q):
-        return (p, q) if p < q else (q, p)
-
-    def _new_pairs(self, table, q):
-        return sum(1 for p in table if self._pair(p, q) in self.uncovered)
-
-    def _uncovered_degree(self, p, pool):
-        return sum(1 for q in pool if q != p and self._pair(p, q) in self.uncovered)
-
-    def next_round(self):
-        """One round of player-disjoint tables covering all but n % 4 players."""
-        if not self.uncovered:
-            self.uncovered = set(itertools.combinations(sorted(self.names), 2))
-        n_byes = len(self.names) % TABLE_SIZE
-        order = sorted(self.names, key=lambda p: (self.count[p], self.rng.random()))
-        pool = set(order[: len(self.names) - n_byes])
-        tables = []
-        while pool:
-            seed_p = max(
-                pool, key=lambda p: (self._uncovered_degree(p, pool), self.rng.random())
-            )
-            table = [seed_p]
-            pool.remove(seed_p)
-            for _ in range(TABLE_SIZE - 1):
-                nxt = max(
-                    pool,
-                    key=lambda q: (
-                        self._new_pairs(table, q),
-                        -self.count[q],
-                        self.rng.random(),
-                    ),
-                )
-                table.append(nxt)
-                pool.remove(nxt)
-            for p, q in itertools.combinations(table, 2):
-                self.uncovered.discard(self._pair(p, q))
-            for p in table:
-                self.count[p] += 1
-            tables.append(tuple(table))
-        return tables
 
+def set_cards(mask):
+    """The cards of set `mask`, in sort_hand order."""
+    cards = []
+    suit = 0
+    while mask:
+        ranks = mask & SUIT_MASKS[0]
+        if ranks:
+            cards += _SUIT_CARDS[suit].get(ranks) or _suit_cards(suit, ranks)
+        mask >>= len(RANKS)
+        suit += 1
+    return cards
 
-class HeartsGame(BaseGame):
+
+# Placeholder value of a _LazyState entry that has not been built yet.
+_UNREAD = object()
+
+
+class _LazyState(dict):
+    """A game_state whose costlier entries are built only if the agent reads
+    them.
+
+    Created like a dict with those entries set to _UNREAD; ``_pending`` then
+    maps each to a (function, argument) pair that builds it. The keys are
+    there from the start (so ``in``, len and iteration are unaffected) and
+    every way of reading a value builds it first. Copies are plain dicts.
+    """
+
+    __slots__ = ("_pending",)
+
+    def _build(self, key):
+        build = self._pending.pop(key, None)
+        if build is not None:
+            function, argument = build
+            dict.__setitem__(self, key, function(argument))
+
+    def _build_all(self):
+        for key in list(self._pending):
+            self._build(key)
+
+    def __getitem__(self, key):
+        if key in self._pending:
+            self._build(key)
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        if key in self._pending:
+            self._build(key)
+        return dict.get(self, key, default)
+
+    # Defined so that dict(state), {**state} and update(state) go through
+    # keys() and __getitem__ rather than reading the storage directly.
+    def __iter__(self):
+        return dict.__iter__(self)
+
+    def __reduce__(self):
+        self._build_all()
+        return dict, (dict(self),)
+
+    def _building_all(name):
+        method = getattr(dict, name)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            self._build_all()
+            return method(self, *args, **kwargs)
+
+        return wrapper
+
+    items = _building_all("items")
+    values = _building_all("values")
+    copy = _building_all("copy")
+    pop = _building_all("pop")
+    popitem = _building_all("popitem")
+    setdefault = _building_all("setdefault")
+    update = _building_all("update")
+    __setitem__ = _building_all("__setitem__")
+    __delitem__ = _building_all("__delitem__")
+    __eq__ = _building_all("__eq__")
+    __ne__ = _building_all("__ne__")
+    __or__ = _building_all("__or__")
+    __ror__ = _building_all("__ror__")
+    __ior__ = _building_all("__ior__")
+    __repr__ = _building_all("__repr__")
+    del _building_all
+
+
+class HeartsGame(TableGame):
     TARGET_SCORE = 100
     MAX_HANDS = 25  # someone must reach 100 within 16 hands; hard backstop
-    EXHAUSTIVE_MAX_PLAYERS = 20
-    RECENT_GAMES_WINDOW = 500
-    SCHEDULER_ROUNDS_PER_CALL = 5
-    MAX_TOTAL_GAMES = 6000
 
     # Benchmarked: one pass plays every table of 4 exhaustively (~374ms with
     # the 8 validation bots + submission), so 2 passes keep validation <1s.
@@ -242,31 +295,28 @@ Default: 1st = **4**, 2nd = **2**, 3rd = **1**, 4th = **0**. Ties share the
 mean of the tied placements' points.
 """
 
-    def __init__(self, league, verbose=False):
-        super().__init__(league, verbose)
-        self.game_feedback = {"game": "hearts", "hands": []}
-        self.player_feedback = {}
-        self._tournament = None
+    def _empty_feedback(self):
+        return {"game": "hearts", "hands": []}
 
     # ------------------------------------------------------------- engine
 
-    def _legal_moves(self, hand, trick_plays, first_trick, hearts_broken):
-        if not trick_plays:  # leading
+    def _legal_moves(self, hand, led_suit, first_trick, hearts_broken):
+        """The playable subset of `hand`, both card sets. `led_suit` is the
+        SUITS index of the card led to this trick, None when leading."""
+        if led_suit is None:  # leading
             if first_trick:
-                return ["2C"]
+                return TWO_OF_CLUBS
             if hearts_broken:
-                return list(hand)
-            non_hearts = [c for c in hand if card_suit(c) != "H"]
-            return non_hearts or list(hand)
-        led = card_suit(trick_plays[0]["card"])
-        follow = [c for c in hand if card_suit(c) == led]
+                return hand
+            return hand & ~HEARTS_MASK or hand
+        follow = hand & SUIT_MASKS[led_suit]
         if follow:
             return follow
         if first_trick:
-            clean = [c for c in hand if card_points(c) == 0]
+            clean = hand & ~POINTS_MASK
             if clean:
                 return clean
-        return list(hand)
+        return hand
 
     def _drain_feedback(self, player):
         if player.feedback:
@@ -277,33 +327,43 @@ mean of the tied placements' points.
         return None
 
     def _ask_pass(self, player, hand, direction, hand_number, scores, seat_names):
+        """The set of 3 cards `player` passes from `hand` (a card set)."""
         state = {
             "phase": "pass",
-            "hand": list(hand),
+            "hand": set_cards(hand),
             "pass_direction": direction,
             "hand_number": hand_number,
             "scores": dict(scores),
             "players": list(seat_names),
         }
         try:
-            picks = player.make_decision(state)
+            picks = self.profiler.time(player.name, player.make_decision, state)
             picks = list(picks)
         except Exception as e:
             raise ValueError(f"Invalid pass by {player.name}: {e}")
-        if len(picks) != 3 or len(set(picks)) != 3 or any(c not in hand for c in picks):
+        try:
+            picked = card_set(picks)
+        except (KeyError, TypeError):
+            picked = None
+        if len(picks) != 3 or picked is None or picked.bit_count() != 3 or picked & ~hand:
             raise ValueError(
                 f"Invalid pass by {player.name}: must be 3 distinct cards "
                 f"from your hand, got {picks}"
             )
-        return picks
+        return picked
 
     def _ask_play(self, player, hand, legal, trick_plays, trick_number, leader,
                   hearts_broken, points_taken, scores, seat_names,
-                  cards_played, cards_remaining):
-        state = {
+                  played, remaining):
+        """The card `player` plays. `hand`, `legal` and `remaining` are card
+        sets; cards_played is the first len(played) cards of `played`, and
+        it and cards_remaining are only turned into lists if the agent reads
+        them."""
+        legal_moves = set_cards(legal)
+        state = _LazyState({
             "phase": "play",
-            "hand": list(hand),
-            "legal_moves": list(legal),
+            "hand": set_cards(hand),
+            "legal_moves": legal_moves,
             "trick": [dict(p) for p in trick_plays],
             "trick_number": trick_number,
             "leader": leader,
@@ -311,111 +371,119 @@ mean of the tied placements' points.
             "points_taken": dict(points_taken),
             "scores": dict(scores),
             "players": list(seat_names),
-            "cards_played": list(cards_played),
-            "cards_remaining": list(cards_remaining),
+            "cards_played": _UNREAD,
+            "cards_remaining": _UNREAD,
+        })
+        state._pending = {
+            "cards_played": (played.__getitem__, slice(len(played))),
+            "cards_remaining": (set_cards, remaining),
         }
         try:
-            card = player.make_decision(state)
+            card = self.profiler.time(player.name, player.make_decision, state)
         except Exception as e:
             raise ValueError(f"Invalid move by {player.name}: {e}")
-        if card not in legal:
+        if not (isinstance(card, str) and CARD_BIT.get(card, 0) & legal):
             raise ValueError(
-                f"Invalid move by {player.name}: {card} is not one of {legal}"
+                f"Invalid move by {player.name}: {card} is not one of {legal_moves}"
             )
         return card
 
     def _play_hand(self, table, hand_number, scores, rng, verbose):
-        """Play one 13-trick hand. Returns (hand_record|None, hand_scores, stats)."""
+        """Play one 13-trick hand. Returns (hand_record|None, hand_scores, stats).
+
+        Hands and the cards still unplayed are card sets indexed by seat;
+        seats are positions in `table`.
+        """
         seat_names = [str(p.name) for p in table]
+        seats = range(TABLE_SIZE)
         deck = DECK[:]
         rng.shuffle(deck)
-        hands = {
-            str(p.name): sort_hand(deck[i * 13:(i + 1) * 13])
-            for i, p in enumerate(table)
-        }
-        dealt = {n: list(cs) for n, cs in hands.items()} if verbose else None
+        hands = [card_set(deck[i * 13:(i + 1) * 13]) for i in seats]
+        dealt = {seat_names[i]: set_cards(hands[i]) for i in seats} if verbose else None
 
         direction = PASS_DIRECTIONS[(hand_number - 1) % len(PASS_DIRECTIONS)]
         passes_record = None
         if direction != "hold":
             offset = {"left": 1, "right": -1, "across": 2}[direction]
-            targets = {
-                seat_names[i]: seat_names[(i + offset) % TABLE_SIZE]
-                for i in range(TABLE_SIZE)
-            }
-            picks = {}
-            for p in table:
-                name = str(p.name)
-                picks[name] = self._ask_pass(
-                    p, hands[name], direction, hand_number, scores, seat_names
+            picks = []
+            for i, p in enumerate(table):
+                picks.append(
+                    self._ask_pass(
+                        p, hands[i], direction, hand_number, scores, seat_names
+                    )
                 )
                 self._drain_feedback(p)
-            for name, cards in picks.items():
-                for c in cards:
-                    hands[name].remove(c)
-            for name, cards in picks.items():
-                hands[targets[name]].extend(cards)
-            for name in seat_names:
-                hands[name] = sort_hand(hands[name])
+            for i in seats:
+                hands[i] &= ~picks[i]
+            for i in seats:
+                hands[(i + offset) % TABLE_SIZE] |= picks[i]
             if verbose:
                 passes_record = {
-                    n: {"to": targets[n], "cards": sort_hand(picks[n])}
-                    for n in seat_names
+                    seat_names[i]: {
+                        "to": seat_names[(i + offset) % TABLE_SIZE],
+                        "cards": set_cards(picks[i]),
+                    }
+                    for i in seats
                 }
-        hands_after_pass = {n: list(cs) for n, cs in hands.items()} if verbose else None
+        hands_after_pass = (
+            {seat_names[i]: set_cards(hands[i]) for i in seats} if verbose else None
+        )
 
-        players_by_name = {str(p.name): p for p in table}
-        leader = next(n for n in seat_names if "2C" in hands[n])
+        leader = next(i for i in seats if hands[i] & TWO_OF_CLUBS)
         hearts_broken = False
         taken = {n: 0 for n in seat_names}
         queens = {n: 0 for n in seat_names}
         played = []  # every card played this hand, in play order
+        remaining = FULL_DECK
         tricks_record = [] if verbose else None
 
         for trick_number in range(1, 14):
             plays = []
-            order = [
-                seat_names[(seat_names.index(leader) + i) % TABLE_SIZE]
-                for i in range(TABLE_SIZE)
-            ]
-            for name in order:
-                player = players_by_name[name]
+            led_suit = None
+            trick_cards = 0
+            winner, best, pts = leader, -1, 0
+            for k in seats:
+                seat = (leader + k) % TABLE_SIZE
+                name = seat_names[seat]
+                player = table[seat]
                 legal = self._legal_moves(
-                    hands[name], plays, trick_number == 1, hearts_broken
+                    hands[seat], led_suit, trick_number == 1, hearts_broken
                 )
-                cards_played = played + [p["card"] for p in plays]
-                played_set = set(cards_played)
-                cards_remaining = [c for c in DECK if c not in played_set]
                 card = self._ask_play(
-                    player, hands[name], legal, plays, trick_number, leader,
-                    hearts_broken, taken, scores, seat_names,
-                    cards_played, cards_remaining,
+                    player, hands[seat], legal, plays, trick_number,
+                    seat_names[leader], hearts_broken, taken, scores, seat_names,
+                    played, remaining,
                 )
-                hands[name].remove(card)
-                if card_suit(card) == "H":
+                index = CARD_INDEX[card]
+                bit = 1 << index
+                hands[seat] ^= bit
+                remaining ^= bit
+                trick_cards |= bit
+                played.append(card)
+                pts += CARD_POINTS[index]
+                if bit & HEARTS_MASK:
                     hearts_broken = True
+                suit = index // len(RANKS)
+                if led_suit is None:
+                    led_suit = suit
+                if suit == led_suit and index > best:
+                    winner, best = seat, index
                 play = {"player": name, "card": card}
                 fb = self._drain_feedback(player)
                 if verbose and fb:
                     play["feedback"] = fb
                 plays.append(play)
 
-            led = card_suit(plays[0]["card"])
-            winner = max(
-                (p for p in plays if card_suit(p["card"]) == led),
-                key=lambda p: card_rank_value(p["card"]),
-            )["player"]
-            pts = sum(card_points(p["card"]) for p in plays)
-            taken[winner] += pts
-            played.extend(p["card"] for p in plays)
-            if any(p["card"] == "QS" for p in plays):
-                queens[winner] += 1
+            winner_name = seat_names[winner]
+            taken[winner_name] += pts
+            if trick_cards & QUEEN_OF_SPADES:
+                queens[winner_name] += 1
             if verbose:
                 tricks_record.append({
                     "trick_number": trick_number,
-                    "leader": leader,
+                    "leader": seat_names[leader],
                     "plays": plays,
-                    "winner": winner,
+                    "winner": winner_name,
                     "points": pts,
                     "hearts_broken": hearts_broken,
                 })
@@ -484,125 +552,29 @@ mean of the tied placements' points.
         return list(DEFAULT_REWARDS)
 
     @staticmethod
-    def _placement_points(final_scores, rewards):
-        """Placement points, lowest Hearts score first; ties share the mean."""
-        ordered = sorted(final_scores.items(), key=lambda kv: kv[1])
-        points = {}
-        i = 0
-        while i < len(ordered):
-            j = i
-            while j < len(ordered) and ordered[j][1] == ordered[i][1]:
-                j += 1
-            share = sum(rewards[i:j]) / (j - i)
-            for name, _ in ordered[i:j]:
-                points[name] = round(share, 2)
-            i = j
-        return points
+    def _placements(final_scores):
+        """Placement slots, lowest Hearts score first; ties share a span."""
+        return tied_spans(final_scores, highest_first=False)
 
     # ---------------------------------------------------------- tournament
 
-    def _roster(self):
-        """League players padded to a full table with validation players."""
-        roster = list(self.players)
-        if len(roster) < TABLE_SIZE:
-            module = __import__(
-                "backend.games.hearts.validation_players", fromlist=["players"]
-            )
-            taken_names = {str(p.name) for p in roster}
-            for vp in copy.deepcopy(module.players):
-                if len(roster) >= TABLE_SIZE:
-                    break
-                if str(vp.name) in taken_names:
-                    vp.name = f"{vp.name}_bot"
-                roster.append(vp)
-        return roster
-
-    def _ensure_tournament(self):
-        if self._tournament is not None:
-            return self._tournament
-        rng = random.Random()
-        roster = self._roster()
-        names = [str(p.name) for p in roster]
-        state = {
-            "rng": rng,
-            "roster": roster,
-            "by_name": {str(p.name): p for p in roster},
-            "exhaustive": len(roster) <= self.EXHAUSTIVE_MAX_PLAYERS,
-            "scheduler": None if len(roster) <= self.EXHAUSTIVE_MAX_PLAYERS
-            else TableScheduler(names, rng),
-            "total_games": 0,
-            "games_played": {n: 0 for n in names},
-            # sliding window of placement points per player (ranking basis)
-            "recent": {n: deque(maxlen=self.RECENT_GAMES_WINDOW) for n in names},
-            "reported": {n: 0.0 for n in names},
-            "games_won": {n: 0 for n in names},
+    def _new_stats(self, names):
+        return {
             "hands_played": {n: 0 for n in names},
             "hand_points": {n: 0 for n in names},
             "moons_shot": {n: 0 for n in names},
             "queens_taken": {n: 0 for n in names},
         }
-        self._tournament = state
-        return state
-
-    def _next_tables(self, state):
-        """The batch of tables for one play_game call, or [] when done."""
-        names = list(state["by_name"].keys())
-        if state["exhaustive"]:
-            # Whole passes only: the first pass always runs (full coverage even
-            # if it alone exceeds the budget); later passes must fit.
-            tables = list(itertools.combinations(names, TABLE_SIZE))
-            played = state["total_games"]
-            if played and played + len(tables) > self.MAX_TOTAL_GAMES:
-                return []
-            state["rng"].shuffle(tables)
-            return tables
-        if state["total_games"] >= self.MAX_TOTAL_GAMES:
-            return []
-        if all(
-            g >= self.RECENT_GAMES_WINDOW for g in state["games_played"].values()
-        ):
-            return []
-        tables = []
-        for _ in range(self.SCHEDULER_ROUNDS_PER_CALL):
-            tables.extend(state["scheduler"].next_round())
-        remaining = self.MAX_TOTAL_GAMES - state["total_games"]
-        return tables[:remaining]
-
-    def play_game(self, custom_rewards=None):
-        """Play one tournament batch; None when the tournament is complete."""
-        state = self._ensure_tournament()
-        rewards = self._resolve_rewards(custom_rewards)
-        tables = self._next_tables(state)
-        if not tables:
-            return None
-
-        for table_names in tables:
-            table = [state["by_name"][n] for n in table_names]
-            state["rng"].shuffle(table)
-            final_scores, winner, stats, _ = self._play_table_game(
-                table, state["rng"], verbose=False
-            )
-            placement = self._placement_points(final_scores, rewards)
-            state["total_games"] += 1
-            state["games_won"][winner] += 1
-            for n in table_names:
-                state["games_played"][n] += 1
-                state["recent"][n].append(placement[n])
-                state["hands_played"][n] += stats["hands"]
-                state["hand_points"][n] += stats["hand_points"][n]
-                state["moons_shot"][n] += stats["moons"][n]
-                state["queens_taken"][n] += stats["queens"][n]
-
-        # Report the change in each player's windowed total: the caller's
-        # running sum of these deltas always equals sum(recent games).
-        points = {}
-        for n, window in state["recent"].items():
-            windowed = round(sum(window), 2)
-            points[n] = round(windowed - state["reported"][n], 2)
-            state["reported"][n] = windowed
-
-        table_stats = {
-            "games_won": dict(state["games_won"]),
+
+    def _add_stats(self, state, table_names, stats):
+        for n in table_names:
+            state["hands_played"][n] += stats["hands"]
+            state["hand_points"][n] += stats["hand_points"][n]
+            state["moons_shot"][n] += stats["moons"][n]
+            state["queens_taken"][n] += stats["queens"][n]
+
+    def _table_stats(self, state):
+        return {
             "avg_points_per_hand": {
                 n: round(state["hand_points"][n] / state["hands_played"][n], 2)
                 if state["hands_played"][n]
@@ -611,40 +583,14 @@ mean of the tied placements' points.
             },
             "moons_shot": dict(state["moons_shot"]),
             "queens_taken": dict(state["queens_taken"]),
-            "games_played": dict(state["games_played"]),
-        }
-        return {
-            "points": points,
-            "score_aggregate": dict(state["reported"]),
-            "table": table_stats,
-        }
-
-    def run_simulations(self, num_simulations, league, custom_rewards=None):
-        """Validation-path entry point: run the tournament in one call."""
-        self._tournament = None
-        total_points = {}
-        table_stats = {}
-        for _ in range(max(1, num_simulations)):
-            result = self.play_game(custom_rewards)
-            if result is None:
-                break
-            for n, pts in result["points"].items():
-                total_points[n] = round(total_points.get(n, 0) + pts, 2)
-            table_stats = result["table"]
-        games_played = table_stats.pop("games_played", {})
-        return {
-            "total_points": total_points,
-            "num_simulations": max(games_played.values()) if games_played else 0,
-            "table": table_stats,
         }
 
     # ------------------------------------------------------------- feedback
 
     def run_single_game_with_feedback(self, custom_rewards=None):
         """One 4-player game with the full hand-by-hand feedback payload."""
-        self.verbose = True
         self.player_feedback = {}
-        rng = random.Random()
+        rng = self._rng
         roster = self._roster()
         table = rng.sample(roster, TABLE_SIZE) if len(roster) > TABLE_SIZE else list(roster)
         rng.shuffle(table)
@@ -672,11 +618,3 @@ mean of the tied placements' points.
             "feedback": self.game_feedback,
             "player_feedback": self.player_feedback,
         }
-
-    def reset(self):
-        """Reset per-call scores/feedback but keep the tournament running."""
-        tournament = self._tournament
-        super().reset()
-        self.game_feedback = {"game": "hearts", "hands": []}
-        self.player_feedback = {}
-        self._tournament = tournament
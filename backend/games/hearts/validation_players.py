@@ -179,13 +179,15 @@ class Cautious(Player):
         return min(legal, key=_rank)
 
 
-players = [
-    RandomBot(),
-    LowballBot(),
-    MoonShooter(),
-    QueenDumper(),
-    HeartAvoider(),
-    TrickDucker(),
-    VoidMaker(),
-    Cautious(),
+player_factories = [
+    RandomBot,
+    LowballBot,
+    MoonShooter,
+    QueenDumper,
+    HeartAvoider,
+    TrickDucker,
+    VoidMaker,
+    Cautious,
 ]
+
+players = [factory() for factory in player_factories]
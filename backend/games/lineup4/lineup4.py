@@ -1,8 +1,35 @@
-import itertools
-import random
-import string
-
 from backend.games.base_game import BaseGame
+from backend.games.lineup4.player import WINNING_SETS
+
+COLUMNS = 7
+ROWS = "ABCDEF"
+
+# The engine keeps one bitboard per symbol. Cell (column c, row r) is bit
+# c * HEIGHT + r; the extra bit on top of every column stays empty, so a line
+# shifted across the board can never wrap from one column into the next.
+HEIGHT = len(ROWS) + 1
+CELL_BIT = {
+    f"{c + 1}{row}": 1 << (c * HEIGHT + r)
+    for c in range(COLUMNS)
+    for r, row in enumerate(ROWS)
+}
+CELLS = tuple(CELL_BIT.items())  # in board order, '1A', '1B', ... '7F'
+CELL_NAMES = [[f"{c + 1}{row}" for row in ROWS] for c in range(COLUMNS)]
+FULL_BOARD = sum(CELL_BIT.values())
+COLUMN_MASK = (1 << len(ROWS)) - 1
+
+# Bit distance between neighbours along a line: vertical, horizontal,
+# falling diagonal, rising diagonal.
+LINE_SHIFTS = (1, HEIGHT, HEIGHT - 1, HEIGHT + 1)
+
+
+def has_line(bits):
+    """Whether the bitboard `bits` holds four in a row in any direction."""
+    for shift in LINE_SHIFTS:
+        pairs = bits & (bits >> shift)
+        if pairs & (pairs >> 2 * shift):
+            return True
+    return False
 
 
 class Lineup4Game(BaseGame):
@@ -10,6 +37,9 @@ class Lineup4Game(BaseGame):
     # validation <1s; 30 also stays below run_simulations' 1000-match cap.
     validation_simulations = 30
 
+    # Matches are independent; these table entries add up over them.
+    bot_baseline_stats = ("matches_played", "wins", "draws")
+
     starter_code = """
 from games.lineup4.player import Player
 import random
@@ -65,102 +95,67 @@ rewards. Every pairing is played twice (once with each player going first):
 
     def __init__(self, league, verbose=False):
         super().__init__(league, verbose)
-        self.board = {}
+        self.bitboards = {"X": 0, "O": 0}
         self.move_history = []
         self.game_feedback = {"game": "lineup4", "matches": []}
-        self.winning_sets = self.calculate_winning_sets()  # Pre-calculate winning sets
+        self.winning_sets = self.calculate_winning_sets()
         self.initialize_board()
 
     def calculate_winning_sets(self):
-        """Calculate all possible winning combinations"""
-        all_winning_sets = set()
-
-        # Horizontal winning sets
-        for row in string.ascii_uppercase[:6]:
-            for col in range(1, 5):
-                winning_set = tuple(f"{col+i}{row}" for i in range(4))
-                all_winning_sets.add(winning_set)
-
-        # Vertical winning sets
-        for col in range(1, 8):
-            for start_row in range(3):
-                winning_set = tuple(
-                    f"{col}{string.ascii_uppercase[start_row+i]}" for i in range(4)
-                )
-                all_winning_sets.add(winning_set)
-
-        # Rising diagonal winning sets
-        for col in range(1, 5):
-            for row in range(3):
-                winning_set = tuple(
-                    f"{col+i}{string.ascii_uppercase[row+i]}" for i in range(4)
-                )
-                all_winning_sets.add(winning_set)
-
-        # Falling diagonal winning sets
-        for col in range(1, 5):
-            for row in range(3, 6):
-                winning_set = tuple(
-                    f"{col+i}{string.ascii_uppercase[row-i]}" for i in range(4)
-                )
-                all_winning_sets.add(winning_set)
-
-        return all_winning_sets
+        """All possible winning combinations"""
+        return set(WINNING_SETS)
+
+    @property
+    def board(self):
+        """The board as agents and feedback see it: position ('1A'..'7F') ->
+        'X', 'O' or None. Built from the bitboards on every read."""
+        x, o = self.bitboards["X"], self.bitboards["O"]
+        return {
+            pos: "X" if x & bit else "O" if o & bit else None for pos, bit in CELLS
+        }
 
     def initialize_board(self):
         """Set up an empty board"""
-        self.board = {}
-        for col in range(1, 8):  # 7 columns
-            for row in string.ascii_uppercase[:6]:  # 6 rows A-F
-                self.board[f"{col}{row}"] = None
+        self.bitboards = {"X": 0, "O": 0}
         self.move_history = []
 
     def get_possible_moves(self):
         """Get list of valid moves"""
+        occupied = self.bitboards["X"] | self.bitboards["O"]
         possible_moves = []
-        for col in range(1, 8):
-            # Check each column from bottom up
-            for row in string.ascii_uppercase[:6]:
-                pos = f"{col}{row}"
-                if self.board[pos] is None:
-                    possible_moves.append(pos)
-                    break  # Only the lowest empty position in each column is valid
+        for col in range(COLUMNS):
+            column = (occupied >> (col * HEIGHT)) & COLUMN_MASK
+            # Only the lowest empty position in each column is valid
+            row = (~column & (column + 1)).bit_length() - 1
+            if row < len(ROWS):
+                possible_moves.append(CELL_NAMES[col][row])
         return possible_moves
 
     def make_move(self, position, symbol):
         """Make a move on the board"""
-        if position in self.board and self.board[position] is None:
-            self.board[position] = symbol
-            self.move_history.append(position)
-            return True
-        return False
+        bit = CELL_BIT.get(position)
+        if bit is None or (self.bitboards["X"] | self.bitboards["O"]) & bit:
+            return False
+        self.bitboards[symbol] |= bit
+        self.move_history.append(position)
+        return True
 
     def check_winner(self):
-        """Check if anyone has won using pre-calculated winning sets"""
-        # Get last move if available
-        last_move = self.move_history[-1] if self.move_history else None
-        if not last_move:
+        """Check if the player who made the last move has four in a row"""
+        if not self.move_history:
             return False
-
-        # Get the symbol at the last move
-        last_symbol = self.board[last_move]
-
-        # Only check winning sets that include the last move made
-        for winning_set in self.winning_sets:
-            if last_move in winning_set:
-                if all(self.board[pos] == last_symbol for pos in winning_set):
-                    return True
-
-        return False
+        bit = CELL_BIT[self.move_history[-1]]
+        symbol = "X" if self.bitboards["X"] & bit else "O"
+        return has_line(self.bitboards[symbol])
 
     def is_board_full(self):
         """Check if the board is full"""
-        return all(self.board[pos] is not None for pos in self.board)
+        return self.bitboards["X"] | self.bitboards["O"] == FULL_BOARD
 
     def get_game_state(self, current_player):
         """Get the current game state"""
         return {
-            "board": dict(self.board),
+            "board": self.board,
             "possible_moves": self.get_possible_moves(),
             "current_player": str(current_player.name),
             "last_move": self.move_history[-1] if self.move_history else None,
@@ -170,6 +165,7 @@ rewards. Every pairing is played twice (once with each player going first):
     def play_match(self, player1, player2):
         """Play a single match between two players"""
         self.initialize_board()
+        recorder = self.recorder
         match_feedback = {
             "player1": str(player1.name),
             "player2": str(player2.name),
@@ -189,7 +185,9 @@ rewards. Every pairing is played twice (once with each player going first):
             game_state = self.get_game_state(current_player)
 
             try:
-                move = current_player.make_decision(game_state)
+                move = self.profiler.time(
+                    current_player.name, current_player.make_decision, game_state
+                )
                 if move not in game_state["possible_moves"]:
                     raise ValueError(
                         f"Invalid move {move} - must be one of {game_state['possible_moves']}"
@@ -199,21 +197,22 @@ rewards. Every pairing is played twice (once with each player going first):
 
             # Make the move FIRST
             if not self.make_move(move, current_player.symbol):
-                if self.verbose:
+                if recorder:
                     match_feedback["moves"].append(
                         f"Invalid move by {current_player.name}: {move}"
                     )
                 continue
 
             # THEN record the move data with updated board state
-            move_data = {
-                "player": str(current_player.name),
-                "symbol": current_player.symbol,
-                "position": move,
-                "player_feedback": current_player.feedback,
-                "board_state": dict(self.board),  # Now includes the move just made
-            }
-            match_feedback["moves"].append(move_data)
+            if recorder:
+                move_data = {
+                    "player": str(current_player.name),
+                    "symbol": current_player.symbol,
+                    "position": move,
+                    "player_feedback": current_player.feedback,
+                    "board_state": self.board,  # Now includes the move just made
+                }
+                match_feedback["moves"].append(move_data)
             current_player.feedback = []  # Clear feedback
 
             # Add any player feedback
@@ -239,7 +238,8 @@ rewards. Every pairing is played twice (once with each player going first):
             current_player, other_player = other_player, current_player
 
         # Record final board state
-        match_feedback["final_board"] = dict(self.board)
+        if recorder:
+            match_feedback["final_board"] = self.board
 
         return match_feedback
 
@@ -249,8 +249,8 @@ rewards. Every pairing is played twice (once with each player going first):
         self.player_feedback = {}
 
         # Create all possible pairs of players
-        player_pairs = list(itertools.combinations(self.players, 2))
-        random.shuffle(player_pairs)  # Randomize order of matches
+        player_pairs = self.player_pairs()
+        self._rng.shuffle(player_pairs)  # Randomize order of matches
 
         # Initialize scores and statistics
         scores = {str(player.name): 0 for player in self.players}
@@ -260,6 +260,7 @@ rewards. Every pairing is played twice (once with each player going first):
         total_draws = 0
 
         # Play each match
+        recorder = self.recorder
         for player1, player2 in player_pairs:
             # Each pair plays twice, alternating who goes first
             for first, second in [(player1, player2), (player2, player1)]:
@@ -269,8 +270,7 @@ rewards. Every pairing is played twice (once with each player going first):
                 matches_played[str(first.name)] += 1
                 matches_played[str(second.name)] += 1
 
-                if self.verbose:
-                    self.game_feedback["matches"].append(match_result)
+                recorder.record("matches", match_result)
 
                 # Award points - 2 points for win, 1 point for draw
                 if match_result["winner"] == str(first.name):
@@ -294,11 +294,14 @@ rewards. Every pairing is played twice (once with each player going first):
             "total_draws": total_draws,
         }
 
-        return {
+        results = {
             "points": scores,
             "score_aggregate": dict(scores),
             "table": stats,
         }
+        if self._bot_baseline is not None:
+            self._add_bot_baseline(results)
+        return results
 
     def run_simulations(self, num_simulations, league, custom_rewards=None):
         """Run multiple simulations"""
@@ -351,18 +354,16 @@ rewards. Every pairing is played twice (once with each player going first):
     def reset(self):
         """Reset game state"""
         super().reset()  # Call base class reset
-        self.board = {}  # Clear the board
-        self.initialize_board()  # Reinitialize with empty positions
+        self.initialize_board()  # Clear the board
         self.move_history = []  # Explicitly clear move history
         self.game_feedback = {"game": "lineup4", "matches": []}
 
     def run_single_game_with_feedback(self, custom_rewards=None):
         """Run a single game with feedback"""
-        self.verbose = True
         self.collect_player_feedback = True
 
         # Run the game
-        results = self.play_game(custom_rewards)
+        results = self._play_verbose(custom_rewards)
 
         return {
             "results": results,
@@ -1,45 +1,54 @@
 from abc import ABC, abstractmethod
 
 
+def _winning_sets():
+    all_winning_sets = set()
+
+    # Horizontal winning sets
+    for row in "ABCDEF":
+        for col in range(1, 5):
+            winning_set = tuple(f"{col+i}{row}" for i in range(4))
+            all_winning_sets.add(winning_set)
+
+    # Vertical winning sets
+    for col in range(1, 8):
+        for start_row in range(3):
+            winning_set = tuple(f"{col}{'ABCDEF'[start_row+i]}" for i in range(4))
+            all_winning_sets.add(winning_set)
+
+    # Rising diagonal winning sets
+    for col in range(1, 5):
+        for row in range(3):
+            winning_set = tuple(f"{col+i}{'ABCDEF'[row+i]}" for i in range(4))
+            all_winning_sets.add(winning_set)
+
+    # Falling diagonal winning sets
+    for col in range(1, 5):
+        for row in range(3, 6):
+            winning_set = tuple(f"{col+i}{'ABCDEF'[row-i]}" for i in range(4))
+            all_winning_sets.add(winning_set)
+
+    return all_winning_sets
+
+
+# Every line of four on the board, as position tuples. Built once and shared
+# by every player (and the game) instead of per instance.
+WINNING_SETS = frozenset(_winning_sets())
+
+
 class Player(ABC):
     def __init__(self):
         self.name = self.__class__.__name__
         self.feedback = []
         self.symbol = None  # 'X' or 'O'
-        self.all_winning_sets = self.calculate_winning_sets()
+        self.all_winning_sets = WINNING_SETS
 
     def add_feedback(self, message):
         """Add feedback that will be visible in the game output"""
         self.feedback.append(message)
 
     def calculate_winning_sets(self):
-        all_winning_sets = set()
-
-        # Horizontal winning sets
-        for row in "ABCDEF":
-            for col in range(1, 5):
-                winning_set = tuple(f"{col+i}{row}" for i in range(4))
-                all_winning_sets.add(winning_set)
-
-        # Vertical winning sets
-        for col in range(1, 8):
-            for start_row in range(3):
-                winning_set = tuple(f"{col}{'ABCDEF'[start_row+i]}" for i in range(4))
-                all_winning_sets.add(winning_set)
-
-        # Rising diagonal winning sets
-        for col in range(1, 5):
-            for row in range(3):
-                winning_set = tuple(f"{col+i}{'ABCDEF'[row+i]}" for i in range(4))
-                all_winning_sets.add(winning_set)
-
-        # Falling diagonal winning sets
-        for col in range(1, 5):
-            for row in range(3, 6):
-                winning_set = tuple(f"{col+i}{'ABCDEF'[row-i]}" for i in range(4))
-                all_winning_sets.add(winning_set)
-
-        return all_winning_sets
+        return set(WINNING_SETS)
 
     @abstractmethod
     def make_decision(self, game_state):
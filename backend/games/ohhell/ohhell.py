@@ -2,34 +2,23 @@
 tricks you bid, played at tables of 4.
 
 Tournament structure (driven by the simulation task calling play_game
-num_simulations times on one instance; None results are skipped):
-
-- 4 to EXHAUSTIVE_MAX_PLAYERS players: every possible group of 4 plays one
-  game per play_game call (one exhaustive pass), until MAX_TOTAL_GAMES.
-- More players: semi-random tables of 4 (greedy pair-coverage scheduler,
-  byes rotate to the most-played players) until every player has played
-  RECENT_GAMES_WINDOW games or MAX_TOTAL_GAMES is hit. Rankings count each
-  player's most recent RECENT_GAMES_WINDOW games only — play_game reports
-  per-call deltas of that sliding-window total, so the aggregator's running
-  sum always equals the windowed total.
+num_simulations times on one instance; None results are skipped): the shared
+table tournament of backend/games/table_tournament.py — every group of 4 for
+small leagues, scheduled tables of 4 with a sliding window of recent games
+for big ones.
 
 Scoring: placement points per game (default 4/2/1/0, ties share the mean). The
 raw Oh Hell score (highest wins) only feeds placements and the per-round stats.
 """
 
-import copy
-import itertools
-import random
-from collections import deque
-
-from backend.games.base_game import BaseGame
+from backend.games.placements import tied_spans
+from backend.games.table_tournament import TABLE_SIZE, TableGame
 
 RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
 RANK_VALUE = {r: i for i, r in enumerate(RANKS, start=2)}
 SUITS = ["C", "D", "S", "H"]
 DECK = [r + s for s in SUITS for r in RANKS]
 
-TABLE_SIZE = 4
 DEFAULT_REWARDS = [4, 2, 1, 0]  # placement points for 1st..4th (highest score first)
 BID_BONUS = 10  # bonus for taking exactly the number of tricks you bid
 
@@ -53,68 +42,7 @@ def sort_hand(cards):
     return sorted(cards, key=lambda c: (SUITS.index(card_suit(c)), card_rank_value(c)))
 
 
-class TableScheduler:
-    """Semi-random tables of 4: greedy pair coverage, byes to the most-played.
-
-    Round-based version of docs/hearts_tournament_scheduler.py phase 1. When
-    every pair has met, the uncovered set refills so later rounds keep mixing
-    opponents instead of collapsing into repeats.
-    """
-
-    def __init__(self, names, rng):
-        self.names = list(names)
-        self.rng = rng
-        self.count = {p: 0 for p in self.names}
-        self.uncovered = set(itertools.combinations(sorted(self.names), 2))
-
-    def _pair(self, p, q):
-        return (p, q) if p < q else (q, p)
-
-    def _new_pairs(self, table, q):
-        return sum(1 for p in table if self._pair(p, q) in self.uncovered)
-
-    def _uncovered_degree(self, p, pool):
-        return sum(1 for q in pool if q != p and self._pair(p, q) in self.uncovered)
-
-    def next_round(self):
-        """One round of player-disjoint tables covering all but n % 4 players."""
-        if not self.uncovered:
-            self.uncovered = set(itertools.combinations(sorted(self.names), 2))
-        n_byes = len(self.names) % TABLE_SIZE
-        order = sorted(self.names, key=lambda p: (self.count[p], self.rng.random()))
-        pool = set(order[: len(self.names) - n_byes])
-        tables = []
-        while pool:
-            seed_p = max(
-                pool, key=lambda p: (self._uncovered_degree(p, pool), self.rng.random())
-            )
-            table = [seed_p]
-            pool.remove(seed_p)
-            for _ in range(TABLE_SIZE - 1):
-                nxt = max(
-                    pool,
-                    key=lambda q: (
-                        self._new_pairs(table, q),
-                        -self.count[q],
-                        self.rng.random(),
-                    ),
-                )
-                table.append(nxt)
-                pool.remove(nxt)
-            for p, q in itertools.combinations(table, 2):
-                self.uncovered.discard(self._pair(p, q))
-            for p in table:
-                self.count[p] += 1
-            tables.append(tuple(table))
-        return tables
-
-
-class OhHellGame(BaseGame):
-    EXHAUSTIVE_MAX_PLAYERS = 20
-    RECENT_GAMES_WINDOW = 500
-    SCHEDULER_ROUNDS_PER_CALL = 5
-    MAX_TOTAL_GAMES = 6000
-
+class OhHellGame(TableGame):
     # Benchmarked: ~16ms per pass (each pass fans out into many sub-games)
     # keeps validation <1s.
     validation_simulations = 40
@@ -255,11 +183,8 @@ Default: 1st = **4**, 2nd = **2**, 3rd = **1**, 4th = **0**. Ties share the
 mean of the tied placements' points.
 """
 
-    def __init__(self, league, verbose=False):
-        super().__init__(league, verbose)
-        self.game_feedback = {"game": "ohhell", "rounds": []}
-        self.player_feedback = {}
-        self._tournament = None
+    def _empty_feedback(self):
+        return {"game": "ohhell", "rounds": []}
 
     # ------------------------------------------------------------- engine
 
@@ -300,7 +225,7 @@ mean of the tied placements' points.
             "players": list(seat_names),
         }
         try:
-            bid = int(player.make_decision(state))
+            bid = int(self.profiler.time(player.name, player.make_decision, state))
         except Exception as e:
             raise ValueError(f"Invalid bid by {player.name}: {e}")
         if bid < 0 or bid > cards:
@@ -335,7 +260,7 @@ mean of the tied placements' points.
             "cards_remaining": list(cards_remaining),
         }
         try:
-            card = player.make_decision(state)
+            card = self.profiler.time(player.name, player.make_decision, state)
         except Exception as e:
             raise ValueError(f"Invalid move by {player.name}: {e}")
         if card not in legal:
@@ -481,123 +406,27 @@ mean of the tied placements' points.
         return list(DEFAULT_REWARDS)
 
     @staticmethod
-    def _placement_points(final_scores, rewards):
-        """Placement points, highest Oh Hell score first; ties share the mean."""
-        ordered = sorted(final_scores.items(), key=lambda kv: -kv[1])
-        points = {}
-        i = 0
-        while i < len(ordered):
-            j = i
-            while j < len(ordered) and ordered[j][1] == ordered[i][1]:
-                j += 1
-            share = sum(rewards[i:j]) / (j - i)
-            for name, _ in ordered[i:j]:
-                points[name] = round(share, 2)
-            i = j
-        return points
+    def _placements(final_scores):
+        """Placement slots, highest Oh Hell score first; ties share a span."""
+        return tied_spans(final_scores, highest_first=True)
 
     # ---------------------------------------------------------- tournament
 
-    def _roster(self):
-        """League players padded to a full table with validation players."""
-        roster = list(self.players)
-        if len(roster) < TABLE_SIZE:
-            module = __import__(
-                "backend.games.ohhell.validation_players", fromlist=["players"]
-            )
-            taken_names = {str(p.name) for p in roster}
-            for vp in copy.deepcopy(module.players):
-                if len(roster) >= TABLE_SIZE:
-                    break
-                if str(vp.name) in taken_names:
-                    vp.name = f"{vp.name}_bot"
-                roster.append(vp)
-        return roster
-
-    def _ensure_tournament(self):
-        if self._tournament is not None:
-            return self._tournament
-        rng = random.Random()
-        roster = self._roster()
-        names = [str(p.name) for p in roster]
-        state = {
-            "rng": rng,
-            "roster": roster,
-            "by_name": {str(p.name): p for p in roster},
-            "exhaustive": len(roster) <= self.EXHAUSTIVE_MAX_PLAYERS,
-            "scheduler": None if len(roster) <= self.EXHAUSTIVE_MAX_PLAYERS
-            else TableScheduler(names, rng),
-            "total_games": 0,
-            "games_played": {n: 0 for n in names},
-            # sliding window of placement points per player (ranking basis)
-            "recent": {n: deque(maxlen=self.RECENT_GAMES_WINDOW) for n in names},
-            "reported": {n: 0.0 for n in names},
-            "games_won": {n: 0 for n in names},
+    def _new_stats(self, names):
+        return {
             "rounds_played": {n: 0 for n in names},
             "round_points": {n: 0 for n in names},
             "bids_hit": {n: 0 for n in names},
         }
-        self._tournament = state
-        return state
-
-    def _next_tables(self, state):
-        """The batch of tables for one play_game call, or [] when done."""
-        names = list(state["by_name"].keys())
-        if state["exhaustive"]:
-            # Whole passes only: the first pass always runs (full coverage even
-            # if it alone exceeds the budget); later passes must fit.
-            tables = list(itertools.combinations(names, TABLE_SIZE))
-            played = state["total_games"]
-            if played and played + len(tables) > self.MAX_TOTAL_GAMES:
-                return []
-            state["rng"].shuffle(tables)
-            return tables
-        if state["total_games"] >= self.MAX_TOTAL_GAMES:
-            return []
-        if all(
-            g >= self.RECENT_GAMES_WINDOW for g in state["games_played"].values()
-        ):
-            return []
-        tables = []
-        for _ in range(self.SCHEDULER_ROUNDS_PER_CALL):
-            tables.extend(state["scheduler"].next_round())
-        remaining = self.MAX_TOTAL_GAMES - state["total_games"]
-        return tables[:remaining]
-
-    def play_game(self, custom_rewards=None):
-        """Play one tournament batch; None when the tournament is complete."""
-        state = self._ensure_tournament()
-        rewards = self._resolve_rewards(custom_rewards)
-        tables = self._next_tables(state)
-        if not tables:
-            return None
-
-        for table_names in tables:
-            table = [state["by_name"][n] for n in table_names]
-            state["rng"].shuffle(table)
-            final_scores, winner, stats, _ = self._play_table_game(
-                table, state["rng"], verbose=False
-            )
-            placement = self._placement_points(final_scores, rewards)
-            state["total_games"] += 1
-            state["games_won"][winner] += 1
-            for n in table_names:
-                state["games_played"][n] += 1
-                state["recent"][n].append(placement[n])
-                state["rounds_played"][n] += stats["rounds"]
-                state["round_points"][n] += stats["round_score"][n]
-                state["bids_hit"][n] += stats["bids_hit"][n]
-
-        # Report the change in each player's windowed total: the caller's
-        # running sum of these deltas always equals sum(recent games).
-        points = {}
-        for n, window in state["recent"].items():
-            windowed = round(sum(window), 2)
-            points[n] = round(windowed - state["reported"][n], 2)
-            state["reported"][n] = windowed
-
-        table_stats = {
-            "games_won": dict(state["games_won"]),
+
+    def _add_stats(self, state, table_names, stats):
+        for n in table_names:
+            state["rounds_played"][n] += stats["rounds"]
+            state["round_points"][n] += stats["round_score"][n]
+            state["bids_hit"][n] += stats["bids_hit"][n]
+
+    def _table_stats(self, state):
+        return {
             "bid_accuracy": {
                 n: round(state["bids_hit"][n] / state["rounds_played"][n], 3)
                 if state["rounds_played"][n]
@@ -610,40 +439,14 @@ mean of the tied placements' points.
                 else 0
                 for n in state["by_name"]
             },
-            "games_played": dict(state["games_played"]),
-        }
-        return {
-            "points": points,
-            "score_aggregate": dict(state["reported"]),
-            "table": table_stats,
-        }
-
-    def run_simulations(self, num_simulations, league, custom_rewards=None):
-        """Validation-path entry point: run the tournament in one call."""
-        self._tournament = None
-        total_points = {}
-        table_stats = {}
-        for _ in range(max(1, num_simulations)):
-            result = self.play_game(custom_rewards)
-            if result is None:
-                break
-            for n, pts in result["points"].items():
-                total_points[n] = round(total_points.get(n, 0) + pts, 2)
-            table_stats = result["table"]
-        games_played = table_stats.pop("games_played", {})
-        return {
-            "total_points": total_points,
-            "num_simulations": max(games_played.values()) if games_played else 0,
-            "table": table_stats,
         }
 
     # ------------------------------------------------------------- feedback
 
     def run_single_game_with_feedback(self, custom_rewards=None):
         """One 4-player game with the full round-by-round feedback payload."""
-        self.verbose = True
         self.player_feedback = {}
-        rng = random.Random()
+        rng = self._rng
         roster = self._roster()
         table = rng.sample(roster, TABLE_SIZE) if len(roster) > TABLE_SIZE else list(roster)
         rng.shuffle(table)
@@ -670,11 +473,3 @@ mean of the tied placements' points.
             "feedback": self.game_feedback,
             "player_feedback": self.player_feedback,
         }
-
-    def reset(self):
-        """Reset per-call scores/feedback but keep the tournament running."""
-        tournament = self._tournament
-        super().reset()
-        self.game_feedback = {"game": "ohhell", "rounds": []}
-        self.player_feedback = {}
-        self._tournament = tournament
@@ -149,10 +149,12 @@ class Estimator(Player):
 
 # Order matters: _roster pads a short table with the first entries, and the
 # single-game preview samples this list — so lead with a good spread of skill.
-players = [
-    Estimator(),
-    AceCounter(),
-    ZeroBidder(),
-    RandomBot(),
-    GreedyBidder(),
+player_factories = [
+    Estimator,
+    AceCounter,
+    ZeroBidder,
+    RandomBot,
+    GreedyBidder,
 ]
+
+players = [factory() for factory in player_factories]
@@ -0,0 +1,108 @@
+"""Placements: where each player finished a game, kept apart from the rewards.
+
+The placement games (reward_schema kind "placement": greedy_pig, hearts,
+ohhell, thirteen) pay each game's players by finishing slot — slot 0 is
+first — and tied players pool the rewards of the slots they span and split
+them. A player's finish is therefore a span of slots [start, end), and what
+it pays under any reward vector is placement_share(rewards, start, end).
+
+A run that records placements (BaseGame.record_placements) also reports,
+per player, a histogram of those spans: {player: {span key: games}}, with
+span_key "2" for slot 2 alone and "1-2" for a tie over slots 1 and 2. Its
+totals under another reward vector are then a sum over a handful of
+entries (rescore) instead of another run.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Tuple
+
+Span = Tuple[int, int]
+Histogram = Dict[str, Dict[str, int]]
+
+
+def is_placement_game(game_class) -> bool:
+    schema = game_class.reward_schema
+    return bool(schema) and schema.get("kind") == "placement"
+
+
+def tied_spans(scores: Mapping[str, float], highest_first: bool) -> Dict[str, Span]:
+    """Each player's span of slots, ranked by `scores`; equal scores share one."""
+    ordered = sorted(scores.items(), key=lambda kv: kv[1], reverse=highest_first)
+    spans = {}
+    i = 0
+    while i < len(ordered):
+        j = i
+        while j < len(ordered) and ordered[j][1] == ordered[i][1]:
+            j += 1
+        for name, _ in ordered[i:j]:
+            spans[name] = (i, j)
+        i = j
+    return spans
+
+
+def placement_share(rewards: List[float], start: int, end: int) -> float:
+    """What each player tied over slots [start, end) is paid: the mean of those
+    slots' rewards (a slot past the end of `rewards` pays 0), to 2 places."""
+    return round(sum(rewards[start:end]) / (end - start), 2)
+
+
+def placement_points(
+    spans: Mapping[str, Span], rewards: List[float]
+) -> Dict[str, float]:
+    return {name: placement_share(rewards, *span) for name, span in spans.items()}
+
+
+def span_key(start: int, end: int) -> str:
+    return str(start) if end == start + 1 else f"{start}-{end - 1}"
+
+
+def _parse_span(key: str) -> Span:
+    first, _, last = key.partition("-")
+    return int(first), int(last or first) + 1
+
+
+def add_placements(
+    histogram: Histogram, other: Mapping[str, Mapping[str, int]]
+) -> Histogram:
+    """Add `other` into `histogram`, dropping entries that reach zero (the
+    table games report changes to a sliding window, which can be negative)."""
+    for name, counts in other.items():
+        mine = histogram.setdefault(name, {})
+        for key, count in counts.items():
+            total = mine.get(key, 0) + count
+            if total:
+                mine[key] = total
+            else:
+                mine.pop(key, None)
+    return histogram
+
+
+def merge_placements(
+    histograms: Iterable[Mapping[str, Mapping[str, int]]],
+) -> Histogram:
+    merged: Histogram = {}
+    for histogram in histograms:
+        add_placements(merged, histogram)
+    return merged
+
+
+def rescore(
+    histogram: Mapping[str, Mapping[str, int]], rewards: List[float]
+) -> Dict[str, float]:
+    """Each player's total points under `rewards`, as resolved by the game
+    (see rescore_run)."""
+    return {
+        name: round(
+            sum(
+                count * placement_share(rewards, *_parse_span(key))
+                for key, count in counts.items()
+            ),
+            2,
+        )
+        for name, counts in histogram.items()
+    }
+
+
+def rescore_run(game_class, histogram, custom_rewards) -> Dict[str, float]:
+    """The total_points a run of `game_class` that recorded `histogram` would
+    have reported under `custom_rewards` (None: the game's defaults)."""
+    return rescore(histogram, game_class._resolve_rewards(custom_rewards))
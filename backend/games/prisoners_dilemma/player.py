@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 import uuid
 
+from backend.games.base_game import plain_data
+
 class Player(ABC):
     def __init__(self):
         self.name = self.__class__.__name__
@@ -11,4 +13,5 @@ class Player(ABC):
         pass
 
     def add_feedback(self, message):
-        self.feedback.append(message)
\ No newline at end of file
+        # A snapshot, even of the history views in game_state
+        self.feedback.append(plain_data(message))
\ No newline at end of file
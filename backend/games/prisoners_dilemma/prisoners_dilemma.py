@@ -1,18 +1,32 @@
 # games/prisoners_dilemma/prisoners_dilemma.py
 
-import itertools
 import logging
-import random
 
-from backend.games.base_game import BaseGame
+from backend.games.base_game import AppendOnlyView, BaseGame, ReadOnlyMapping
 
 logger = logging.getLogger(__name__)
 
 
+def _opponent_histories(opponents):
+    return ReadOnlyMapping(opponents, AppendOnlyView)
+
+
+_NO_HISTORY = []
+
+
 class PrisonersDilemmaGame(BaseGame):
     # Benchmarked: ~2ms per simulation keeps validation <1s.
     validation_simulations = 300
 
+    # O(N^2) pairings, each a fixed number of rounds; get_game_state hands
+    # out views of the histories rather than copies.
+    player_scaling = {"time": 2, "memory": 2}
+
+    # Not pairwise (bot_baseline_stats stays None): game_state hands every
+    # agent all_history and scores for the whole field, so what a pairing
+    # plays out depends on the pairings before it. Validation and league runs
+    # always play the full round robin.
+
     starter_code = """
 from games.prisoners_dilemma.player import Player
 import random
@@ -49,8 +63,13 @@ The `game_state` parameter provides you with the following information:
 - `player_name`: Your player's name
 - `opponent_name`: Your current opponent's name
 - `opponent_history`: A list of your opponent's past decisions against you
+- `my_history`: A list of your past decisions against this opponent
+- `opponent_summary`: How often your opponent has chosen `'collude'` and `'defect'` so far this game, against everyone (e.g. `{'collude': 7, 'defect': 3}`)
+- `all_history`: Every player's decisions against every opponent so far, `all_history[player][opponent]`
 - `scores`: A dictionary of current scores for all players
 
+The histories and scores are read-only; use `list(...)` or `dict(...)` for a copy you can change.
+
 #### 4. Scoring
 The scoring is determined by a reward matrix. The default matrix is:
 - Both collude: 4 points each
@@ -137,6 +156,11 @@ Punishment > Sucker).
         """Initialize histories and scores after players are loaded"""
         self.histories = {str(player.name): {} for player in self.players}
         self.scores = {str(player.name): 0 for player in self.players}
+        # Each player's decisions over the game so far, kept as they are
+        # appended so neither agents nor run_simulations rescan histories.
+        self.decision_counts = {
+            str(player.name): {"collude": 0, "defect": 0} for player in self.players
+        }
 
     def play_game(self, custom_rewards=None):
         """Play a complete game between all players"""
@@ -144,15 +168,9 @@ Punishment > Sucker).
             print("No players loaded for the game.")
             return {"points": {}, "score_aggregate": {}}
 
-        # Add debug print
-        logger.info(f"Players loaded: {[p.name for p in self.players]}")
-
         # Initialize histories and scores
         self.initialize_histories_and_scores()
 
-        # Add debug print after initialization
-        logger.info(f"Players initialized: {[p.name for p in self.players]}")
-
         if custom_rewards:
             self.reward_matrix = {
                 "collude,collude": (custom_rewards[0], custom_rewards[0]),
@@ -167,8 +185,8 @@ Punishment > Sucker).
             "rounds_per_pairing": self.rounds_per_pairing,
         }
 
-        player_pairs = list(itertools.combinations(self.players, 2))
-        random.shuffle(player_pairs)
+        player_pairs = self.player_pairs()
+        self._rng.shuffle(player_pairs)
 
         for player1, player2 in player_pairs:
             self.play_pairing(player1, player2)
@@ -178,25 +196,27 @@ Punishment > Sucker).
         return {"points": dict(self.scores), "score_aggregate": dict(self.scores)}
 
     def get_game_state(self, player_name, opponent_name, round_number):
-        """Get the current game state for a player"""
-        histories_copy = {}
-        for p1, opponents in self.histories.items():
-            histories_copy[str(p1)] = {}
-            for p2, decisions in opponents.items():
-                histories_copy[str(p1)][str(p2)] = list(decisions)
-
+        """Get the current game state for a player.
+
+        Histories and scores are read-only views rather than copies, so a
+        state costs the same however many pairings have been played. Only
+        completed rounds are ever in them: both players of a round decide
+        before either decision is recorded.
+        """
+        player_name, opponent_name = str(player_name), str(opponent_name)
         state = {
             "round_number": round_number,
-            "player_name": str(player_name),
-            "opponent_name": str(opponent_name),
-            "opponent_history": list(
-                self.histories[str(opponent_name)].get(str(player_name), [])
+            "player_name": player_name,
+            "opponent_name": opponent_name,
+            "opponent_history": AppendOnlyView(
+                self.histories[opponent_name].get(player_name, _NO_HISTORY)
             ),
-            "my_history": list(
-                self.histories[str(player_name)].get(str(opponent_name), [])
+            "my_history": AppendOnlyView(
+                self.histories[player_name].get(opponent_name, _NO_HISTORY)
             ),
-            "all_history": histories_copy,
-            "scores": dict(self.scores),
+            "opponent_summary": dict(self.decision_counts[opponent_name]),
+            "all_history": ReadOnlyMapping(self.histories, _opponent_histories),
+            "scores": ReadOnlyMapping(self.scores),
         }
         return state
 
@@ -226,11 +246,14 @@ Punishment > Sucker).
 
     def play_pairing(self, player1, player2):
         """Play a series of rounds between two players"""
-        pairing_data = {
-            "player1": str(player1.name),
-            "player2": str(player2.name),
-            "rounds": [],
-        }
+        # The pairing's round-by-round record exists only for feedback runs
+        recorder = self.recorder
+        if recorder:
+            pairing_data = {
+                "player1": str(player1.name),
+                "player2": str(player2.name),
+                "rounds": [],
+            }
 
         p1_name = str(player1.name)
         p2_name = str(player2.name)
@@ -245,10 +268,10 @@ Punishment > Sucker).
             game_state1 = self.get_game_state(player1.name, player2.name, round_number)
             game_state2 = self.get_game_state(player2.name, player1.name, round_number)
 
-            random.seed()
-
             try:
-                decision1 = player1.make_decision(game_state1)
+                decision1 = self.profiler.time(
+                    player1.name, player1.make_decision, game_state1
+                )
             except Exception as e:
                 raise ValueError(f"Invalid decision by {player1.name}: {e}")
             if decision1 not in ["defect", "collude"]:
@@ -258,7 +281,9 @@ Punishment > Sucker).
                 )
 
             try:
-                decision2 = player2.make_decision(game_state2)
+                decision2 = self.profiler.time(
+                    player2.name, player2.make_decision, game_state2
+                )
             except Exception as e:
                 raise ValueError(f"Invalid decision by {player2.name}: {e}")
             if decision2 not in ["defect", "collude"]:
@@ -270,6 +295,8 @@ Punishment > Sucker).
             # Update histories
             self.histories[p1_name][p2_name].append(decision1)
             self.histories[p2_name][p1_name].append(decision2)
+            self.decision_counts[p1_name][decision1] += 1
+            self.decision_counts[p2_name][decision2] += 1
 
             # Calculate scores
             key = f"{decision1},{decision2}"
@@ -277,37 +304,38 @@ Punishment > Sucker).
             self.scores[p1_name] += score1
             self.scores[p2_name] += score2
 
-            round_data = {
-                "round_number": round_number,
-                "actions": {p1_name: decision1, p2_name: decision2},
-                "scores": {
-                    p1_name: self.scores[p1_name],
-                    p2_name: self.scores[p2_name],
-                },
-            }
-            pairing_data["rounds"].append(round_data)
+            if recorder:
+                pairing_data["rounds"].append(
+                    {
+                        "round_number": round_number,
+                        "actions": {p1_name: decision1, p2_name: decision2},
+                        "scores": {
+                            p1_name: self.scores[p1_name],
+                            p2_name: self.scores[p2_name],
+                        },
+                    }
+                )
 
             self.add_player_feedback(player1, round_number, player2.name)
             self.add_player_feedback(player2, round_number, player1.name)
 
-        self.add_feedback(pairing_data)
+        if recorder:
+            recorder.record("pairings", pairing_data)
 
     def reset(self):
         """Reset the game state"""
         super().reset()
-        self.histories = {str(player.name): {} for player in self.players}
+        self.initialize_histories_and_scores()
         self.game_feedback = {"pairings": []}
         self.player_feedback = {}
-        self.scores = {str(player.name): 0 for player in self.players}
 
     def run_single_game_with_feedback(self, custom_rewards=None):
         """Run a single game with feedback"""
         # Enable feedback for this run
-        self.verbose = True
         self.collect_player_feedback = True
 
         # Run the game
-        results = self.play_game(custom_rewards)
+        results = self._play_verbose(custom_rewards)
 
         return {
             "results": results,
@@ -328,10 +356,9 @@ Punishment > Sucker).
             for player, points in results["points"].items():
                 total_points[str(player)] += points
 
-            for player_name, opponents in self.histories.items():
-                for opponent_name, decisions in opponents.items():
-                    defections[str(player_name)] += decisions.count("defect")
-                    collusions[str(player_name)] += decisions.count("collude")
+            for player_name, counts in self.decision_counts.items():
+                defections[player_name] += counts["defect"]
+                collusions[player_name] += counts["collude"]
 
         return {
             "total_points": total_points,
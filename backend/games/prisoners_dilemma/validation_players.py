@@ -70,10 +70,12 @@ class RandomPlayer(Player):
         return random.choice(["collude", "defect"])
 
 
-players = [
-    AlwaysCooperate(),
-    AlwaysDefect(),
-    TitForTat(),
-    GradualPlayer(),
-    RandomPlayer(),
+player_factories = [
+    AlwaysCooperate,
+    AlwaysDefect,
+    TitForTat,
+    GradualPlayer,
+    RandomPlayer,
 ]
+
+players = [factory() for factory in player_factories]
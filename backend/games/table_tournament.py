@@ -0,0 +1,334 @@
+"""Tournament core shared by the table games (hearts, ohhell, thirteen).
+
+A table game plays ONE stateful tournament across play_game calls:
+
+- 4 to EXHAUSTIVE_MAX_PLAYERS players: every possible group of 4 plays one
+  game per play_game call (one exhaustive pass), until MAX_TOTAL_GAMES.
+- More players: semi-random tables of 4 (TableScheduler) until every player
+  has played RECENT_GAMES_WINDOW games or MAX_TOTAL_GAMES is hit. Rankings
+  count each player's most recent RECENT_GAMES_WINDOW games only — play_game
+  reports per-call deltas of that sliding-window total, so the aggregator's
+  running sum always equals the windowed total.
+
+TableGame implements all of that; a game supplies the table itself
+(_play_table_game, _placements, _resolve_rewards) and its own running stats
+through the _new_stats / _add_stats / _table_stats hooks. Recorded placements
+(BaseGame.record_placements) follow the same window: play_game reports the
+change in each player's histogram of its windowed games.
+"""
+
+import importlib
+import itertools
+from abc import abstractmethod
+from collections import deque
+
+from backend.games.base_game import BaseGame, spawn_validation_players
+from backend.games.placements import placement_points, span_key
+
+TABLE_SIZE = 4
+
+
+class TableScheduler:
+    """Semi-random tables of 4: greedy pair coverage, byes to the most-played.
+
+    Round-based version of docs/hearts_tournament_scheduler.py phase 1. When
+    every pair has met, the unmet pairs refill so later rounds keep mixing
+    opponents instead of collapsing into repeats.
+
+    Coverage is indexed per player (``unmet[p]``: the opponents p has not
+    met since the last refill), and within a round each pooled player's count
+    of unmet opponents still in the pool is kept up to date as tables fill,
+    so seating a table costs O(pool) instead of rescoring every pair.
+    """
+
+    def __init__(self, names, rng):
+        self.names = list(names)
+        self.rng = rng
+        self.count = {p: 0 for p in self.names}
+        self._refill()
+
+    def _refill(self):
+        self.unmet = {p: set(self.names) - {p} for p in self.names}
+        self.unmet_pairs = len(self.names) * (len(self.names) - 1) // 2
+
+    def _seat(self, p, pool, degree, new_pairs):
+        """Seat `p`: it leaves the pool, where each of its unmet opponents
+        loses a candidate partner and gains a new pair at p's table."""
+        del pool[p]
+        for q in self.unmet[p]:
+            if q in pool:
+                degree[q] -= 1
+                new_pairs[q] += 1
+
+    def next_round(self):
+        """One round of player-disjoint tables covering all but n % 4 players."""
+        if not self.unmet_pairs:
+            self._refill()
+        unmet = self.unmet
+        n_byes = len(self.names) % TABLE_SIZE
+        order = sorted(self.names, key=lambda p: (self.count[p], self.rng.random()))
+        pool = dict.fromkeys(order[: len(self.names) - n_byes])
+        # Random tie-breaks for this round, behind the fewest games played
+        tiebreak = {p: (-self.count[p], self.rng.random()) for p in pool}
+        # degree[p]: how many of p's unmet opponents are still in the pool
+        degree = {p: sum(1 for q in unmet[p] if q in pool) for p in pool}
+        tables = []
+        while pool:
+            # new_pairs[q]: unmet opponents q would meet at the table so far
+            new_pairs = dict.fromkeys(pool, 0)
+            seed_p = max(pool, key=lambda p: (degree[p], tiebreak[p]))
+            table = [seed_p]
+            self._seat(seed_p, pool, degree, new_pairs)
+            for _ in range(TABLE_SIZE - 1):
+                nxt = max(pool, key=lambda q: (new_pairs[q], tiebreak[q]))
+                table.append(nxt)
+                self._seat(nxt, pool, degree, new_pairs)
+            for p, q in itertools.combinations(table, 2):
+                if q in unmet[p]:
+                    unmet[p].discard(q)
+                    unmet[q].discard(p)
+                    self.unmet_pairs -= 1
+            for p in table:
+                self.count[p] += 1
+            tables.append(tuple(table))
+        return tables
+
+
+class RecentGames(deque):
+    """A player's placement points for their most recent games, with the
+    window's total kept up to date as games are added."""
+
+    def __init__(self, iterable=(), maxlen=None):
+        super().__init__(iterable, maxlen)
+        self.total = sum(self)
+
+    def append(self, points):
+        if len(self) == self.maxlen:
+            self.total -= self[0]
+        super().append(points)
+        self.total += points
+
+
+class TableGame(BaseGame):
+    """A game played as one stateful tournament of tables of 4 (see module
+    docstring). Subclasses implement the table and their running stats."""
+
+    EXHAUSTIVE_MAX_PLAYERS = 20
+    RECENT_GAMES_WINDOW = 500
+    SCHEDULER_ROUNDS_PER_CALL = 5
+    MAX_TOTAL_GAMES = 6000
+
+    # One stateful tournament spans every play_game call (see play_game),
+    # so a league run cannot be split across worker shards.
+    independent_games = False
+
+    # Per play_game: SCHEDULER_ROUNDS_PER_CALL rounds of N/4 tables, each
+    # costing O(N) to seat, and the scheduler's unmet-pair index is O(N^2).
+    player_scaling = {"time": 2, "memory": 2}
+
+    def __init__(self, league, verbose=False):
+        super().__init__(league, verbose)
+        self.game_feedback = self._empty_feedback()
+        self.player_feedback = {}
+        self._tournament = None
+
+    @abstractmethod
+    def _empty_feedback(self):
+        """The game_feedback payload before any game is recorded."""
+
+    # ------------------------------------------------------- game hooks
+
+    @abstractmethod
+    def _play_table_game(self, table, rng, verbose=False):
+        """Play one game at `table` (TABLE_SIZE players) with `rng`; returns
+        (outcome, winner, stats, records), records None unless `verbose`."""
+
+    @staticmethod
+    @abstractmethod
+    def _placements(outcome):
+        """Each player's span of placement slots (see placements) for the
+        outcome of one table game."""
+
+    @classmethod
+    def _placement_points(cls, outcome, rewards):
+        return placement_points(cls._placements(outcome), rewards)
+
+    def _new_stats(self, names):
+        """Per-player running stats kept in the tournament state."""
+        return {}
+
+    def _add_stats(self, state, table_names, stats):
+        """Fold one table game's `stats` into the running stats."""
+
+    def _table_stats(self, state):
+        """The game's own entries of the ``table`` payload."""
+        return {}
+
+    # ---------------------------------------------------------- tournament
+
+    def _roster(self):
+        """League players padded to a full table with validation players."""
+        roster = list(self.players)
+        if len(roster) < TABLE_SIZE:
+            game_name = self.__class__.__module__.split(".")[2]
+            module = importlib.import_module(
+                f"backend.games.{game_name}.validation_players"
+            )
+            taken_names = {str(p.name) for p in roster}
+            for vp in spawn_validation_players(module):
+                if len(roster) >= TABLE_SIZE:
+                    break
+                if str(vp.name) in taken_names:
+                    vp.name = f"{vp.name}_bot"
+                roster.append(vp)
+        return roster
+
+    def _ensure_tournament(self):
+        if self._tournament is not None:
+            return self._tournament
+        rng = self._rng
+        roster = self._roster()
+        names = [str(p.name) for p in roster]
+        state = {
+            "rng": rng,
+            "roster": roster,
+            "by_name": {str(p.name): p for p in roster},
+            "exhaustive": len(roster) <= self.EXHAUSTIVE_MAX_PLAYERS,
+            "scheduler": None if len(roster) <= self.EXHAUSTIVE_MAX_PLAYERS
+            else TableScheduler(names, rng),
+            "total_games": 0,
+            "games_played": {n: 0 for n in names},
+            # players yet to fill their window; the scheduler stops at zero
+            "short_of_window": len(names),
+            # sliding window of placement points per player (ranking basis)
+            "recent": {
+                n: RecentGames(maxlen=self.RECENT_GAMES_WINDOW) for n in names
+            },
+            "reported": {n: 0.0 for n in names},
+            # span keys of the windowed games, filled while recording placements
+            "recent_spans": {
+                n: deque(maxlen=self.RECENT_GAMES_WINDOW) for n in names
+            },
+            "games_won": {n: 0 for n in names},
+            **self._new_stats(names),
+        }
+        self._tournament = state
+        return state
+
+    def _next_tables(self, state):
+        """The batch of tables for one play_game call, or [] when done."""
+        names = list(state["by_name"].keys())
+        if state["exhaustive"]:
+            # Whole passes only: the first pass always runs (full coverage even
+            # if it alone exceeds the budget); later passes must fit.
+            tables = list(itertools.combinations(names, TABLE_SIZE))
+            played = state["total_games"]
+            if played and played + len(tables) > self.MAX_TOTAL_GAMES:
+                return []
+            state["rng"].shuffle(tables)
+            return tables
+        if state["total_games"] >= self.MAX_TOTAL_GAMES:
+            return []
+        if not state["short_of_window"]:
+            return []
+        tables = []
+        for _ in range(self.SCHEDULER_ROUNDS_PER_CALL):
+            tables.extend(state["scheduler"].next_round())
+        remaining = self.MAX_TOTAL_GAMES - state["total_games"]
+        return tables[:remaining]
+
+    def play_game(self, custom_rewards=None):
+        """Play one tournament batch; None when the tournament is complete."""
+        state = self._ensure_tournament()
+        rewards = self._resolve_rewards(custom_rewards)
+        tables = self._next_tables(state)
+        if not tables:
+            return None
+
+        # Change in each player's windowed histogram of placement spans
+        placements = {} if self.record_placements else None
+        for table_names in tables:
+            table = [state["by_name"][n] for n in table_names]
+            state["rng"].shuffle(table)
+            outcome, winner, stats, _ = self._play_table_game(
+                table, state["rng"], verbose=False
+            )
+            spans = self._placements(outcome)
+            placement = placement_points(spans, rewards)
+            state["total_games"] += 1
+            state["games_won"][winner] += 1
+            for n in table_names:
+                state["games_played"][n] += 1
+                if state["games_played"][n] == self.RECENT_GAMES_WINDOW:
+                    state["short_of_window"] -= 1
+                state["recent"][n].append(placement[n])
+                if placements is not None:
+                    self._record_span(state, placements, n, span_key(*spans[n]))
+            self._add_stats(state, table_names, stats)
+
+        # Report the change in each player's windowed total: the caller's
+        # running sum of these deltas always equals sum(recent games).
+        points = {}
+        for n, window in state["recent"].items():
+            windowed = round(window.total, 2)
+            points[n] = round(windowed - state["reported"][n], 2)
+            state["reported"][n] = windowed
+
+        results = {
+            "points": points,
+            "score_aggregate": dict(state["reported"]),
+            "table": {
+                "games_won": dict(state["games_won"]),
+                **self._table_stats(state),
+                "games_played": dict(state["games_played"]),
+            },
+        }
+        if placements is not None:
+            results["placements"] = {
+                n: {key: count for key, count in counts.items() if count}
+                for n, counts in placements.items()
+            }
+        return results
+
+    @staticmethod
+    def _record_span(state, placements, name, key):
+        """Slide `key` into `name`'s window of spans, noting the change."""
+        window = state["recent_spans"][name]
+        counts = placements.setdefault(name, {})
+        if len(window) == window.maxlen:
+            dropped = window[0]
+            counts[dropped] = counts.get(dropped, 0) - 1
+        window.append(key)
+        counts[key] = counts.get(key, 0) + 1
+
+    def run_simulations(self, num_simulations, league, custom_rewards=None):
+        """Validation-path entry point: run the tournament in one call."""
+        self._tournament = None
+        total_points = {}
+        table_stats = {}
+        for _ in range(max(1, num_simulations)):
+            result = self.play_game(custom_rewards)
+            if result is None:
+                break
+            for n, pts in result["points"].items():
+                total_points[n] = round(total_points.get(n, 0) + pts, 2)
+            table_stats = result["table"]
+        games_played = table_stats.pop("games_played", {})
+        return {
+            "total_points": total_points,
+            "num_simulations": max(games_played.values()) if games_played else 0,
+            "table": table_stats,
+        }
+
+    def reset(self):
+        """Reset per-call scores/feedback but keep the tournament running."""
+        tournament = self._tournament
+        super().reset()
+        self.game_feedback = self._empty_feedback()
+        self.player_feedback = {}
+        self._tournament = tournament
+
+    def remove_player(self, name):
+        """Drop `name` and restart the tournament without it."""
+        super().remove_player(name)
+        self._tournament = None
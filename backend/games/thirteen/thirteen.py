@@ -2,16 +2,10 @@
 order in which players empty their hands *is* the placement (first out = 1st).
 
 Tournament structure (driven by the simulation task calling play_game
-num_simulations times on one instance; None results are skipped):
-
-- 4 to EXHAUSTIVE_MAX_PLAYERS players: every possible group of 4 plays one
-  game per play_game call (one exhaustive pass), until MAX_TOTAL_GAMES.
-- More players: semi-random tables of 4 (greedy pair-coverage scheduler,
-  byes rotate to the most-played players) until every player has played
-  RECENT_GAMES_WINDOW games or MAX_TOTAL_GAMES is hit. Rankings count each
-  player's most recent RECENT_GAMES_WINDOW games only — play_game reports
-  per-call deltas of that sliding-window total, so the aggregator's running
-  sum always equals the windowed total.
+num_simulations times on one instance; None results are skipped): the shared
+table tournament of backend/games/table_tournament.py — every group of 4 for
+small leagues, scheduled tables of 4 with a sliding window of recent games
+for big ones.
 
 Scoring: placement points per game (default 4/2/1/0). Finish order is a strict
 ordering of the four seats, so there are no ties — the i-th player to shed all
@@ -26,12 +20,9 @@ Ruleset (a deliberately trimmed Tiến lên):
   thereafter whoever wins a pile (all others pass) leads a fresh combo.
 """
 
-import copy
 import itertools
-import random
-from collections import deque
 
-from backend.games.base_game import BaseGame
+from backend.games.table_tournament import TABLE_SIZE, TableGame
 
 # Rank order runs 3 (lowest) .. 2 (highest); suits break ties S < C < D < H.
 RANKS = ["3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A", "2"]
@@ -40,7 +31,6 @@ SUITS = ["S", "C", "D", "H"]
 SUIT_VALUE = {s: i for i, s in enumerate(SUITS)}  # S->0 .. H->3
 DECK = [r + s for s in SUITS for r in RANKS]
 
-TABLE_SIZE = 4
 HAND_SIZE = 13
 DEFAULT_REWARDS = [4, 2, 1, 0]  # placement points for 1st..4th to finish
 TWO = RANK_VALUE["2"]
@@ -116,68 +106,102 @@ def beats(cand, pile):
     return ckind == pkind and clen == plen and ckey > pkey
 
 
-class TableScheduler:
-    """Semi-random tables of 4: greedy pair coverage, byes to the most-played.
+CARD_KEY = {c: card_key(c) for c in DECK}
+
 
-    Round-based version of docs/hearts_tournament_scheduler.py phase 1. When
-    every pair has met, the uncovered set refills so later rounds keep mixing
-    opponents instead of collapsing into repeats.
+class HandIndex:
+    """A hand indexed by rank, generating its combos shape by shape.
+
+    ``groups[r]`` is the tuple of rank-r cards held, in suit order, so every
+    shape is read straight off the rank counts: a pair needs a group of two,
+    a straight a run of non-empty groups. ``above`` is the card_key a combo's
+    top card must beat (None for any); generation starts at its rank instead
+    of filtering the whole hand. remove() updates the index as cards leave
+    the hand.
     """
 
-    def __init__(self, names, rng):
-        self.names = list(names)
-        self.rng = rng
-        self.count = {p: 0 for p in self.names}
-        self.uncovered = set(itertools.combinations(sorted(self.names), 2))
-
-    def _pair(self, p, q):
-        return (p, q) if p < q else (q, p)
-
-    def _new_pairs(self, table, q):
-        return sum(1 for p in table if self._pair(p, q) in self.uncovered)
-
-    def _uncovered_degree(self, p, pool):
-        return sum(1 for q in pool if q != p and self._pair(p, q) in self.uncovered)
-
-    def next_round(self):
-        """One round of player-disjoint tables covering all but n % 4 players."""
-        if not self.uncovered:
-            self.uncovered = set(itertools.combinations(sorted(self.names), 2))
-        n_byes = len(self.names) % TABLE_SIZE
-        order = sorted(self.names, key=lambda p: (self.count[p], self.rng.random()))
-        pool = set(order[: len(self.names) - n_byes])
-        tables = []
-        while pool:
-            seed_p = max(
-                pool, key=lambda p: (self._uncovered_degree(p, pool), self.rng.random())
-            )
-            table = [seed_p]
-            pool.remove(seed_p)
-            for _ in range(TABLE_SIZE - 1):
-                nxt = max(
-                    pool,
-                    key=lambda q: (
-                        self._new_pairs(table, q),
-                        -self.count[q],
-                        self.rng.random(),
-                    ),
-                )
-                table.append(nxt)
-                pool.remove(nxt)
-            for p, q in itertools.combinations(table, 2):
-                self.uncovered.discard(self._pair(p, q))
-            for p in table:
-                self.count[p] += 1
-            tables.append(tuple(table))
-        return tables
-
-
-class ThirteenGame(BaseGame):
-    EXHAUSTIVE_MAX_PLAYERS = 20
-    RECENT_GAMES_WINDOW = 500
-    SCHEDULER_ROUNDS_PER_CALL = 5
-    MAX_TOTAL_GAMES = 6000
+    __slots__ = ("groups",)
+
+    def __init__(self, cards=()):
+        groups = [()] * (TWO + 1)
+        for card in sort_hand(cards):
+            groups[card_rank(card)] += (card,)
+        self.groups = groups
+
+    def remove(self, cards):
+        groups = self.groups
+        for card in cards:
+            rank = card_rank(card)
+            groups[rank] = tuple(c for c in groups[rank] if c != card)
+
+    def singles(self, above=None):
+        lowest = 3 if above is None else above[0]
+        return [
+            [c]
+            for cards in self.groups[lowest:]
+            for c in cards
+            if above is None or CARD_KEY[c] > above
+        ]
+
+    def sets(self, size, above=None):
+        """Same-rank combos of `size` cards: pairs, triples, bombs."""
+        out = []
+        lowest = 3 if above is None else above[0]
+        for cards in self.groups[lowest:]:
+            if len(cards) >= size:
+                for combo in itertools.combinations(cards, size):
+                    if above is None or CARD_KEY[combo[-1]] > above:
+                        out.append(list(combo))
+        return out
 
+    def straights(self, length=None, above=None):
+        """Straights of `length` (every length when None), shortest first."""
+        groups = self.groups
+        # run[r]: how many consecutive ranks from r up are held (2s excluded)
+        run = [0] * (TWO + 1)
+        for rank in range(TWO - 1, 2, -1):
+            run[rank] = run[rank + 1] + 1 if groups[rank] else 0
+        longest = max(run)
+        out = []
+        for size in range(3, longest + 1) if length is None else (length,):
+            for start in range(3, TWO - size + 1):
+                top = start + size - 1
+                if run[start] < size or (above is not None and top < above[0]):
+                    continue
+                for combo in itertools.product(*groups[start:top + 1]):
+                    if above is None or CARD_KEY[combo[-1]] > above:
+                        out.append(list(combo))
+        return out
+
+    def leads(self):
+        """Every combo that may open a fresh pile."""
+        return (
+            self.singles() + self.sets(2) + self.sets(3) + self.sets(4)
+            + self.straights()
+        )
+
+    def responses(self, pile):
+        """Every combo that beats `pile`, then the pass []."""
+        kind, length, top = classify(pile)
+        moves = []
+        if kind == "bomb":
+            moves += self.sets(4, top)  # only a higher bomb beats
+        else:
+            if kind in ("single", "pair") and _all_twos(pile):
+                moves += self.sets(4)  # bomb chops the 2s
+            if kind == "single":
+                moves += self.singles(top)
+            elif kind == "pair":
+                moves += self.sets(2, top)
+            elif kind == "triple":
+                moves += self.sets(3, top)
+            elif kind == "straight":
+                moves += self.straights(length, top)
+        moves.append([])  # pass is always legal when responding
+        return moves
+
+
+class ThirteenGame(TableGame):
     # Benchmarked: ~31ms per pass (each pass fans out into many sub-games)
     # keeps validation <1s.
     validation_simulations = 25
@@ -290,84 +314,28 @@ Placement points awarded per game by finishing order (first player to empty thei
 hand first). Default: 1st = **4**, 2nd = **2**, 3rd = **1**, 4th = **0**.
 """
 
-    def __init__(self, league, verbose=False):
-        super().__init__(league, verbose)
-        self.game_feedback = {"game": "thirteen", "plays": []}
-        self.player_feedback = {}
-        self._tournament = None
+    def _empty_feedback(self):
+        return {"game": "thirteen", "plays": []}
 
     # ------------------------------------------------------------- combos
 
-    def _rank_groups(self, hand):
-        groups = {}
-        for c in hand:
-            groups.setdefault(card_rank(c), []).append(c)
-        return groups
-
-    def _same_rank_combos(self, hand, size):
-        out = []
-        for cs in self._rank_groups(hand).values():
-            if len(cs) >= size:
-                for combo in itertools.combinations(sort_hand(cs), size):
-                    out.append(list(combo))
-        return out
-
-    def _straights(self, hand, length=None):
-        by_rank = self._rank_groups(hand)
-        present = sorted(r for r in by_rank if r != TWO)
-        if not present:
-            return []
-        lengths = [length] if length else range(3, len(present) + 1)
-        out = []
-        for L in lengths:
-            if L < 3:
-                continue
-            for start in present:
-                window = list(range(start, start + L))
-                if window[-1] >= TWO:
-                    break  # a straight can't reach the 2s
-                if all(r in by_rank for r in window):
-                    choices = [sort_hand(by_rank[r]) for r in window]
-                    for combo in itertools.product(*choices):
-                        out.append(sort_hand(list(combo)))
-        return out
-
-    @staticmethod
-    def _dedupe(combos):
-        seen = {}
-        for m in combos:
-            key = tuple(sort_hand(m))
-            if key not in seen:
-                seen[key] = list(key)
-        return list(seen.values())
-
     def _legal_leads(self, hand):
-        combos = [[c] for c in sort_hand(hand)]
-        for size in (2, 3, 4):
-            combos += self._same_rank_combos(hand, size)
-        combos += self._straights(hand)
-        return self._dedupe(combos)
+        return HandIndex(hand).leads()
 
     def _legal_responses(self, hand, pile):
-        kind, length, _ = classify(pile)
-        moves = []
-        if kind == "bomb":
-            moves += self._same_rank_combos(hand, 4)  # only a higher bomb beats
-        else:
-            if kind in ("single", "pair") and _all_twos(pile):
-                moves += self._same_rank_combos(hand, 4)  # bomb chops the 2s
-            if kind == "single":
-                moves += [[c] for c in hand]
-            elif kind == "pair":
-                moves += self._same_rank_combos(hand, 2)
-            elif kind == "triple":
-                moves += self._same_rank_combos(hand, 3)
-            elif kind == "straight":
-                moves += self._straights(hand, length)
-        moves = [m for m in moves if beats(m, pile)]
-        moves = self._dedupe(moves)
-        moves.append([])  # pass is always legal when responding
-        return moves
+        return HandIndex(hand).responses(pile)
+
+    @staticmethod
+    def _is_legal(move, hand, pile):
+        """Whether `move` is one of the legal moves from `hand` onto `pile`
+        ([] when leading), decided without generating them."""
+        if not move:
+            return bool(pile)  # passing is only offered when responding
+        if not all(isinstance(c, str) and c in hand for c in move):
+            return False
+        if pile:
+            return beats(move, pile)
+        return classify(move) is not None
 
     # -------------------------------------------------------------- engine
 
@@ -379,12 +347,15 @@ hand first). Default: 1st = **4**, 2nd = **2**, 3rd = **1**, 4th = **0**.
             return lines
         return None
 
-    def _ask_play(self, player, hand, legal, leading, pile, pile_owner,
+    def _ask_play(self, player, hand, index, leading, pile, pile_owner,
                   seat_names, hand_sizes, finished, passed):
+        # A plain list, built before the agent sees it: C code reading a list
+        # (list + list, json, str.join) never calls back into Python.
+        legal = index.leads() if leading else index.responses(pile)
         state = {
             "phase": "play",
             "hand": list(hand),
-            "legal_moves": [list(m) for m in legal],
+            "legal_moves": legal,
             "leading": leading,
             "pile": list(pile),
             "pile_owner": pile_owner,
@@ -394,19 +365,14 @@ hand first). Default: 1st = **4**, 2nd = **2**, 3rd = **1**, 4th = **0**.
             "passed": list(passed),
         }
         try:
-            move = list(player.make_decision(state))
+            move = list(self.profiler.time(player.name, player.make_decision, state))
         except Exception as e:
             raise ValueError(f"Invalid move by {player.name}: {e}")
-        legal_set = {tuple(sort_hand(m)) for m in legal}
-        try:
-            move_key = tuple(sort_hand(move))
-        except (KeyError, TypeError, IndexError):
-            move_key = None  # unparseable card codes are never legal
-        if move_key not in legal_set:
+        if not self._is_legal(move, hand, pile):
             raise ValueError(
                 f"Invalid move by {player.name}: {move} is not one of {legal}"
             )
-        return list(move_key)
+        return sort_hand(move)
 
     def _play_deal(self, table, rng, verbose):
         """Play one full deal. Returns (finish_order, winner, stats, record)."""
@@ -418,6 +384,7 @@ hand first). Default: 1st = **4**, 2nd = **2**, 3rd = **1**, 4th = **0**.
             seat_names[i]: sort_hand(deck[i * HAND_SIZE:(i + 1) * HAND_SIZE])
             for i in range(TABLE_SIZE)
         }
+        indexes = {n: HandIndex(cs) for n, cs in hands.items()}
         dealt = {n: list(cs) for n, cs in hands.items()} if verbose else None
 
         finish_order = []
@@ -444,13 +411,8 @@ hand first). Default: 1st = **4**, 2nd = **2**, 3rd = **1**, 4th = **0**.
                 continue
 
             leading = fresh
-            legal = (
-                self._legal_leads(hands[name])
-                if leading
-                else self._legal_responses(hands[name], pile)
-            )
             move = self._ask_play(
-                by_name[name], hands[name], legal, leading, pile, pile_owner,
+                by_name[name], hands[name], indexes[name], leading, pile, pile_owner,
                 seat_names, hand_sizes(), finish_order, sorted(passed),
             )
             fb = self._drain_feedback(by_name[name])
@@ -463,6 +425,7 @@ hand first). Default: 1st = **4**, 2nd = **2**, 3rd = **1**, 4th = **0**.
             else:
                 for c in move:
                     hands[name].remove(c)
+                indexes[name].remove(move)
                 if classify(move)[0] == "bomb":
                     bombs[name] += 1
                 pile = move
@@ -546,110 +509,25 @@ hand first). Default: 1st = **4**, 2nd = **2**, 3rd = **1**, 4th = **0**.
         return list(DEFAULT_REWARDS)
 
     @staticmethod
-    def _placement_points(finish_order, rewards):
-        """Placement points by finishing order; first player out takes slot 0."""
-        return {name: rewards[i] for i, name in enumerate(finish_order)}
+    def _placements(finish_order):
+        """Placement slots by finishing order; first player out takes slot 0."""
+        return {name: (i, i + 1) for i, name in enumerate(finish_order)}
 
     # ---------------------------------------------------------- tournament
 
-    def _roster(self):
-        """League players padded to a full table with validation players."""
-        roster = list(self.players)
-        if len(roster) < TABLE_SIZE:
-            module = __import__(
-                "backend.games.thirteen.validation_players", fromlist=["players"]
-            )
-            taken_names = {str(p.name) for p in roster}
-            for vp in copy.deepcopy(module.players):
-                if len(roster) >= TABLE_SIZE:
-                    break
-                if str(vp.name) in taken_names:
-                    vp.name = f"{vp.name}_bot"
-                roster.append(vp)
-        return roster
-
-    def _ensure_tournament(self):
-        if self._tournament is not None:
-            return self._tournament
-        rng = random.Random()
-        roster = self._roster()
-        names = [str(p.name) for p in roster]
-        state = {
-            "rng": rng,
-            "roster": roster,
-            "by_name": {str(p.name): p for p in roster},
-            "exhaustive": len(roster) <= self.EXHAUSTIVE_MAX_PLAYERS,
-            "scheduler": None if len(roster) <= self.EXHAUSTIVE_MAX_PLAYERS
-            else TableScheduler(names, rng),
-            "total_games": 0,
-            "games_played": {n: 0 for n in names},
-            # sliding window of placement points per player (ranking basis)
-            "recent": {n: deque(maxlen=self.RECENT_GAMES_WINDOW) for n in names},
-            "reported": {n: 0.0 for n in names},
-            "games_won": {n: 0 for n in names},
+    def _new_stats(self, names):
+        return {
             "finish_sum": {n: 0 for n in names},
             "bombs": {n: 0 for n in names},
         }
-        self._tournament = state
-        return state
-
-    def _next_tables(self, state):
-        """The batch of tables for one play_game call, or [] when done."""
-        names = list(state["by_name"].keys())
-        if state["exhaustive"]:
-            # Whole passes only: the first pass always runs (full coverage even
-            # if it alone exceeds the budget); later passes must fit.
-            tables = list(itertools.combinations(names, TABLE_SIZE))
-            played = state["total_games"]
-            if played and played + len(tables) > self.MAX_TOTAL_GAMES:
-                return []
-            state["rng"].shuffle(tables)
-            return tables
-        if state["total_games"] >= self.MAX_TOTAL_GAMES:
-            return []
-        if all(
-            g >= self.RECENT_GAMES_WINDOW for g in state["games_played"].values()
-        ):
-            return []
-        tables = []
-        for _ in range(self.SCHEDULER_ROUNDS_PER_CALL):
-            tables.extend(state["scheduler"].next_round())
-        remaining = self.MAX_TOTAL_GAMES - state["total_games"]
-        return tables[:remaining]
-
-    def play_game(self, custom_rewards=None):
-        """Play one tournament batch; None when the tournament is complete."""
-        state = self._ensure_tournament()
-        rewards = self._resolve_rewards(custom_rewards)
-        tables = self._next_tables(state)
-        if not tables:
-            return None
-
-        for table_names in tables:
-            table = [state["by_name"][n] for n in table_names]
-            state["rng"].shuffle(table)
-            finish_order, winner, stats, _ = self._play_table_game(
-                table, state["rng"], verbose=False
-            )
-            placement = self._placement_points(finish_order, rewards)
-            state["total_games"] += 1
-            state["games_won"][winner] += 1
-            for n in table_names:
-                state["games_played"][n] += 1
-                state["recent"][n].append(placement[n])
-                state["finish_sum"][n] += stats["finish_pos"][n]
-                state["bombs"][n] += stats["bombs"][n]
-
-        # Report the change in each player's windowed total: the caller's
-        # running sum of these deltas always equals sum(recent games).
-        points = {}
-        for n, window in state["recent"].items():
-            windowed = round(sum(window), 2)
-            points[n] = round(windowed - state["reported"][n], 2)
-            state["reported"][n] = windowed
-
-        table_stats = {
-            "games_won": dict(state["games_won"]),
+
+    def _add_stats(self, state, table_names, stats):
+        for n in table_names:
+            state["finish_sum"][n] += stats["finish_pos"][n]
+            state["bombs"][n] += stats["bombs"][n]
+
+    def _table_stats(self, state):
+        return {
             "avg_finish": {
                 n: round(state["finish_sum"][n] / state["games_played"][n], 2)
                 if state["games_played"][n]
@@ -657,40 +535,14 @@ hand first). Default: 1st = **4**, 2nd = **2**, 3rd = **1**, 4th = **0**.
                 for n in state["by_name"]
             },
             "bombs_played": dict(state["bombs"]),
-            "games_played": dict(state["games_played"]),
-        }
-        return {
-            "points": points,
-            "score_aggregate": dict(state["reported"]),
-            "table": table_stats,
-        }
-
-    def run_simulations(self, num_simulations, league, custom_rewards=None):
-        """Validation-path entry point: run the tournament in one call."""
-        self._tournament = None
-        total_points = {}
-        table_stats = {}
-        for _ in range(max(1, num_simulations)):
-            result = self.play_game(custom_rewards)
-            if result is None:
-                break
-            for n, pts in result["points"].items():
-                total_points[n] = round(total_points.get(n, 0) + pts, 2)
-            table_stats = result["table"]
-        games_played = table_stats.pop("games_played", {})
-        return {
-            "total_points": total_points,
-            "num_simulations": max(games_played.values()) if games_played else 0,
-            "table": table_stats,
         }
 
     # ------------------------------------------------------------- feedback
 
     def run_single_game_with_feedback(self, custom_rewards=None):
         """One 4-player deal with the full play-by-play feedback payload."""
-        self.verbose = True
         self.player_feedback = {}
-        rng = random.Random()
+        rng = self._rng
         roster = self._roster()
         table = rng.sample(roster, TABLE_SIZE) if len(roster) > TABLE_SIZE else list(roster)
         rng.shuffle(table)
@@ -719,11 +571,3 @@ hand first). Default: 1st = **4**, 2nd = **2**, 3rd = **1**, 4th = **0**.
             "feedback": self.game_feedback,
             "player_feedback": self.player_feedback,
         }
-
-    def reset(self):
-        """Reset per-call scores/feedback but keep the tournament running."""
-        tournament = self._tournament
-        super().reset()
-        self.game_feedback = {"game": "thirteen", "plays": []}
-        self.player_feedback = {}
-        self._tournament = tournament
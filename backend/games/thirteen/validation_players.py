@@ -123,10 +123,12 @@ class RandomBot(Player):
 
 # Order matters: _roster pads a short table with the first entries, and the
 # single-game preview samples this list — so lead with a good spread of skill.
-players = [
-    Controller(),
-    LowballShedder(),
-    Beater(),
-    Greedy(),
-    RandomBot(),
+player_factories = [
+    Controller,
+    LowballShedder,
+    Beater,
+    Greedy,
+    RandomBot,
 ]
+
+players = [factory() for factory in player_factories]
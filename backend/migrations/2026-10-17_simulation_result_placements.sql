@@ -0,0 +1,10 @@
+-- Add `simulationresult.placements`.
+--
+-- A placement game's run can now record each team's placement histogram so
+-- that /admin/rescore-simulation can apply other rewards to it without a
+-- re-run; it is stored with the result as JSON text. create_all never adds a
+-- column to an existing table, so a database created before this needs the
+-- statement below. On a fresh volume it is a no-op.
+--
+-- Idempotent: IF NOT EXISTS.
+ALTER TABLE public.simulationresult ADD COLUMN IF NOT EXISTS placements TEXT;
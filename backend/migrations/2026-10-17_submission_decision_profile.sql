@@ -0,0 +1,10 @@
+-- Add `submission.decision_profile`.
+--
+-- Validation runs now time every agent call; the passing run's per-player
+-- decision latency and engine time are stored with the submission as JSON
+-- text. create_all never adds a column to an existing table, so a database
+-- created before this needs the statement below. On a fresh volume it is a
+-- no-op.
+--
+-- Idempotent: IF NOT EXISTS.
+ALTER TABLE public.submission ADD COLUMN IF NOT EXISTS decision_profile TEXT;
@@ -2,7 +2,7 @@ import json
 import logging
 import secrets
 from datetime import datetime, timedelta
-from typing import Dict, Tuple, Union
+from typing import Dict, List, Tuple, Union
 
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, func, select
@@ -12,6 +12,7 @@ from backend.database.db_models import (
     AgentAPIKey,
     League,
     LeagueType,
+    SimulationJob,
     SimulationResult,
     SimulationResultItem,
     Team,
@@ -22,13 +23,16 @@ from backend.errors import (
     AgentTeamError,
     LeagueExistsError,
     LeagueNotFoundError,
+    PlacementsNotRecordedError,
     ProtectedLeagueError,
+    SimulationJobNotFoundError,
     SimulationResultNotFoundError,
     TeamError,
     TeamExistsError,
     TeamNotFoundError,
 )
 from backend.games.game_factory import GameFactory
+from backend.games.placements import rescore_run
 from backend.routes.admin.admin_models import LeagueSignUp
 from backend.time_utils import ensure_utc, utc_now
 from backend.utils import process_simulation_results
@@ -231,6 +235,9 @@ def save_simulation_results(
         custom_rewards=rewards_str,
         feedback_str=feedback_str,
         feedback_json=feedback_json,
+        placements=(
+            json.dumps(results["placements"]) if "placements" in results else None
+        ),
     )
     session.add(simulation_result)
     session.flush()
@@ -265,6 +272,39 @@ def save_simulation_results(
     return simulation_result
 
 
+def create_simulation_job(
+    session: Session,
+    league_id: int,
+    task_id: str,
+    progress_id: str,
+    num_simulations: int,
+    custom_rewards=None,
+    shards: int = 1,
+) -> SimulationJob:
+    """Record an enqueued simulation so its result is saved when it finishes"""
+    job = SimulationJob(
+        league_id=league_id,
+        task_id=task_id,
+        progress_id=progress_id,
+        num_simulations=num_simulations,
+        custom_rewards=(
+            json.dumps(custom_rewards) if custom_rewards is not None else None
+        ),
+        shards=shards,
+    )
+    session.add(job)
+    session.commit()
+    session.refresh(job)
+    return job
+
+
+def get_simulation_job(session: Session, job_id: int) -> SimulationJob:
+    job = session.get(SimulationJob, job_id)
+    if not job:
+        raise SimulationJobNotFoundError(f"Simulation job with ID {job_id} not found")
+    return job
+
+
 def get_all_league_results(session: Session, league_id: int) -> Dict:
     """Get all simulation results for a league"""
     league = get_league_by_id(session, league_id)
@@ -277,6 +317,39 @@ def get_all_league_results(session: Session, league_id: int) -> Dict:
     return {"results": sorted(results, key=lambda x: x["id"], reverse=True)}
 
 
+def rescore_simulation(
+    session: Session, league_id: int, sim_id: int, reward_schemes: List[List[int]]
+) -> Dict:
+    """A recorded simulation's total_points under each of `reward_schemes`"""
+    league = get_league_by_id(session, league_id)
+
+    simulation = session.get(SimulationResult, sim_id)
+    if not simulation or simulation.league_id != league.id:
+        raise SimulationResultNotFoundError(
+            f"Simulation result with ID {sim_id} not found in league '{league.name}'"
+        )
+    if simulation.placements is None:
+        raise PlacementsNotRecordedError(
+            f"Simulation result with ID {sim_id} did not record placements; "
+            "run it with record_placements to rescore it"
+        )
+
+    placements = json.loads(simulation.placements)
+    game_class = GameFactory.get_game_class(league.game)
+    return {
+        "id": simulation.id,
+        "league_name": league.name,
+        "rewards": json.loads(simulation.custom_rewards),
+        "rescored": [
+            {
+                "rewards": rewards,
+                "total_points": rescore_run(game_class, placements, rewards),
+            }
+            for rewards in reward_schemes
+        ],
+    }
+
+
 def publish_sim_results(
     session: Session,
     league_id: int,
@@ -3,6 +3,7 @@ from typing import List, Optional, Union
 
 from pydantic import BaseModel, Field, field_validator
 
+from backend.tasks.simulation_task import MAX_SIMULATION_SHARDS
 from backend.time_utils import interpret_as_sydney, utc_now
 from backend.utils import get_games_names
 
@@ -43,12 +44,47 @@ class TeamSignup(BaseModel):
         return v.strip()
 
 
+# Progress ids become valkey key suffixes: keep them short and plain.
+PROGRESS_ID_PATTERN = r"^[A-Za-z0-9_-]{1,64}$"
+
+# Upper bound on the reward vectors one run or one rescore request evaluates.
+MAX_REWARD_SCHEMES = 10
+
+
 class SimulationConfig(BaseModel):
     """Model for simulation configuration"""
 
     num_simulations: int = Field(gt=0, le=10000)
     league_id: int
     custom_rewards: Optional[List[int]] = None
+    # Split the run across this many worker tasks (see simulation_task's
+    # "Sharded runs"); 1 keeps the single-task path.
+    shards: int = Field(default=1, ge=1, le=MAX_SIMULATION_SHARDS)
+    # Client-chosen id for the live progress stream (/simulation-progress/{id})
+    # and /stop-simulation. Omitted -> the run publishes no progress.
+    progress_id: Optional[str] = Field(
+        default=None, pattern=PROGRESS_ID_PATTERN
+    )
+    # Stop as soon as every adjacent pair of the ranking is separated at this
+    # confidence; num_simulations becomes the upper bound.
+    until_stable: bool = False
+    confidence: float = Field(default=0.95, gt=0.5, lt=1)
+    # Replay a run exactly: seeds the engine RNG (and the agents' shared one).
+    # Omitted -> every run draws a fresh seed.
+    seed: Optional[int] = Field(default=None, ge=0, lt=2**64)
+    # Pairwise games only: replay just the pairings whose code changed since
+    # the last delta run and rank from the stored pairing matrix (see
+    # tasks.pairing_cache). Runs as one task; shards and until_stable do not
+    # apply.
+    delta: bool = False
+    # Placement games only: store each team's placement histogram with the
+    # result, so /admin/rescore-simulation can apply other rewards later
+    # (see games.placements). reward_schemes implies it and also returns the
+    # run's totals under each scheme.
+    record_placements: bool = False
+    reward_schemes: Optional[List[List[int]]] = Field(
+        default=None, min_length=1, max_length=MAX_REWARD_SCHEMES
+    )
 
     @field_validator("num_simulations")
     def validate_num_simulations(cls, v):
@@ -57,6 +93,22 @@ class SimulationConfig(BaseModel):
         return v
 
 
+class SimulationRescore(BaseModel):
+    """Model for rescoring a recorded simulation under other rewards"""
+
+    league_id: int
+    id: int
+    reward_schemes: List[List[int]] = Field(
+        min_length=1, max_length=MAX_REWARD_SCHEMES
+    )
+
+
+class SimulationStop(BaseModel):
+    """Model for stopping a progress-tracked simulation early"""
+
+    progress_id: str = Field(pattern=PROGRESS_ID_PATTERN)
+
+
 class TeamDelete(BaseModel):
     """Model for team deletion request"""
 
@@ -1,18 +1,25 @@
+import asyncio
 import json
 import logging
+import time
+import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
 
-from backend.database.db_models import UNASSIGNED_LEAGUE_NAME
+from backend.database.db_models import UNASSIGNED_LEAGUE_NAME, SimulationJobStatus
 from backend.database.db_session import get_db
 from backend.errors import ProtectedLeagueError
+from backend.games.game_factory import GameFactory
+from backend.games.placements import is_placement_game
 from backend.routes.auth.auth_core import require_admin
 from backend.routes.admin.admin_db import (
     assign_team_to_league,
     create_agent_team,
     create_api_key,
     create_league,
+    create_simulation_job,
     create_team,
     delete_league,
     delete_team,
@@ -22,7 +29,9 @@ from backend.routes.admin.admin_db import (
     get_all_teams,
     get_classroom_summaries,
     get_league_by_id,
+    get_simulation_job,
     publish_sim_results,
+    rescore_simulation,
     save_simulation_results,
     unassign_team,
     update_expiry_date,
@@ -37,7 +46,10 @@ from backend.routes.admin.admin_models import (
     LeagueInfoUpdate,
     LeagueResults,
     LeagueSignUp,
+    PROGRESS_ID_PATTERN,
     SimulationConfig,
+    SimulationRescore,
+    SimulationStop,
     TeamDelete,
     TeamIdRef,
     TeamLeagueAssignment,
@@ -45,7 +57,13 @@ from backend.routes.admin.admin_models import (
 )
 from backend.routes.user.user_db import get_latest_submissions_for_league
 from backend.tasks.celery_utils import poll_task_result
-from backend.tasks.simulation_task import run_simulation
+from backend.tasks.code_store import store_code_blobs
+from backend.tasks.simulation_progress import read_progress, request_stop
+from backend.tasks.simulation_task import (
+    SIMULATION_HARD_TIME_LIMIT,
+    enqueue_sharded_simulation,
+    run_simulation,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -104,33 +122,93 @@ async def get_home_endpoint(session: Session = Depends(get_db)):
     return {"classrooms": get_classroom_summaries(session)}
 
 
-@admin_router.post("/run-simulation")
-async def run_simulation_endpoint(
-    simulation_config: SimulationConfig,
-    session: Session = Depends(get_db),
-):
-    """Run a simulation for a league."""
-    league = get_league_by_id(session, simulation_config.league_id)
-
+def _league_for_simulation(session: Session, league_id: int):
+    league = get_league_by_id(session, league_id)
     if league.name == UNASSIGNED_LEAGUE_NAME:
         raise ProtectedLeagueError(
             f"Cannot run simulations on the '{UNASSIGNED_LEAGUE_NAME}' league"
         )
+    return league
+
 
-    # Read the submitted code here (the API holds the DB session) and pass it to
-    # the worker as a task arg, so the worker running untrusted agent code needs
-    # no database credential.
+def _enqueue_league_run(
+    session: Session, simulation_config: SimulationConfig, league, progress_id
+):
+    """Enqueue the league's run (sharded or not) and return its AsyncResult."""
+    # Read the submitted code here (the API holds the DB session) and hand the
+    # worker its content addresses in the code store, so the worker running
+    # untrusted agent code needs no database credential.
     submissions = get_latest_submissions_for_league(
         session, simulation_config.league_id
     )
 
-    async_result = run_simulation.delay(
+    game_class = GameFactory.get_game_class(league.game)
+    if (
+        simulation_config.record_placements or simulation_config.reward_schemes
+    ) and not is_placement_game(game_class):
+        raise HTTPException(
+            status_code=400,
+            detail=f"{league.game} does not score by placement, so its runs "
+            "cannot be rescored",
+        )
+    if simulation_config.delta:
+        if game_class.bot_baseline_stats is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Delta runs need a pairwise game, and {league.game} is not one",
+            )
+        return run_simulation.delay(
+            league_id=simulation_config.league_id,
+            game_name=league.game,
+            submission_refs=store_code_blobs(submissions),
+            num_simulations=simulation_config.num_simulations,
+            custom_rewards=simulation_config.custom_rewards,
+            player_feedback=True,
+            progress_id=progress_id,
+            seed=simulation_config.seed,
+            delta=True,
+        )
+    if simulation_config.shards > 1:
+        return enqueue_sharded_simulation(
+            league_id=simulation_config.league_id,
+            game_name=league.game,
+            submissions=submissions,
+            num_simulations=simulation_config.num_simulations,
+            custom_rewards=simulation_config.custom_rewards,
+            player_feedback=True,
+            shards=simulation_config.shards,
+            progress_id=progress_id,
+            until_stable=simulation_config.until_stable,
+            confidence=simulation_config.confidence,
+            seed=simulation_config.seed,
+            record_placements=simulation_config.record_placements,
+            reward_schemes=simulation_config.reward_schemes,
+        )
+    return run_simulation.delay(
         league_id=simulation_config.league_id,
         game_name=league.game,
-        submissions=submissions,
+        submission_refs=store_code_blobs(submissions),
         num_simulations=simulation_config.num_simulations,
         custom_rewards=simulation_config.custom_rewards,
         player_feedback=True,
+        progress_id=progress_id,
+        until_stable=simulation_config.until_stable,
+        confidence=simulation_config.confidence,
+        seed=simulation_config.seed,
+        record_placements=simulation_config.record_placements,
+        reward_schemes=simulation_config.reward_schemes,
+    )
+
+
+@admin_router.post("/run-simulation")
+async def run_simulation_endpoint(
+    simulation_config: SimulationConfig,
+    session: Session = Depends(get_db),
+):
+    """Run a simulation for a league."""
+    league = _league_for_simulation(session, simulation_config.league_id)
+    async_result = _enqueue_league_run(
+        session, simulation_config, league, simulation_config.progress_id
     )
     results = await poll_task_result(async_result, timeout=300)
 
@@ -167,10 +245,31 @@ async def run_simulation_endpoint(
             "requested_simulations", simulation_results["num_simulations"]
         ),
         "capped": simulation_results.get("capped", False),
+        # True when an admin stopped the run early via /stop-simulation.
+        "stopped": simulation_results.get("stopped", False),
+        # Per-team [low, high] interval on total_points at `confidence`;
+        # absent for the table games, whose batches are not independent draws.
+        "confidence_intervals": simulation_results.get("confidence_intervals"),
+        "confidence": simulation_results.get("confidence"),
+        "stable": simulation_results.get("stable"),
         "timestamp": sim_result.timestamp if sim_result else None,
         "rewards": simulation_config.custom_rewards,
         "table": simulation_results.get("table", {}),
         "strategies": simulation_results.get("strategies", {}),
+        # Per-team decision latency (count, total, p50/p99/max ms) plus the
+        # engine's own time, over the simulation games.
+        "decision_profile": simulation_results.get("decision_profile"),
+        # Teams dropped for breaking the per-decision time budget -> why.
+        "disqualified": simulation_results.get("disqualified", {}),
+        # Games those disqualifications broke off, not in num_simulations.
+        "discarded_games": simulation_results.get("discarded_games", 0),
+        # Delta runs: {pairings, replayed} — how many of the league's
+        # pairings had to be played rather than read from the cache.
+        "delta": simulation_results.get("delta"),
+        # With reward_schemes: [{rewards, total_points}] per scheme, from the
+        # same games.
+        "rescored": simulation_results.get("rescored"),
+        "rescorable": "placements" in simulation_results,
     }
 
     if feedback is not None:
@@ -181,6 +280,95 @@ async def run_simulation_endpoint(
     return response_data
 
 
+@admin_router.post("/enqueue-simulation")
+async def enqueue_simulation_endpoint(
+    simulation_config: SimulationConfig,
+    session: Session = Depends(get_db),
+):
+    """Queue a simulation and return at once. The API's job consumer saves the
+    result when it finishes; poll /simulation-job/{job_id} for its status."""
+    league = _league_for_simulation(session, simulation_config.league_id)
+    progress_id = simulation_config.progress_id or uuid.uuid4().hex
+    async_result = _enqueue_league_run(session, simulation_config, league, progress_id)
+    job = create_simulation_job(
+        session,
+        league.id,
+        task_id=async_result.id,
+        progress_id=progress_id,
+        num_simulations=simulation_config.num_simulations,
+        custom_rewards=simulation_config.custom_rewards,
+        # A delta run is always one task.
+        shards=1 if simulation_config.delta else simulation_config.shards,
+    )
+    return {"job_id": job.id, "progress_id": progress_id}
+
+
+@admin_router.get("/simulation-job/{job_id}")
+async def simulation_job_endpoint(job_id: int, session: Session = Depends(get_db)):
+    """Status of a queued simulation; live progress while it is running."""
+    job = get_simulation_job(session, job_id)
+    response = {
+        "job_id": job.id,
+        "league_id": job.league_id,
+        "status": job.status,
+        "num_simulations": job.num_simulations,
+        "custom_rewards": json.loads(job.custom_rewards) if job.custom_rewards else None,
+        "shards": job.shards,
+        "games_completed": job.games_completed,
+        "progress_id": job.progress_id,
+        "simulation_result_id": job.simulation_result_id,
+        "error": job.error,
+        "created_at": job.created_at,
+        "finished_at": job.finished_at,
+    }
+    if job.status in (SimulationJobStatus.QUEUED, SimulationJobStatus.RUNNING):
+        response["progress"] = read_progress(job.progress_id)
+    return response
+
+
+# How often the progress stream re-reads valkey, and how long it may stay open:
+# long enough for the slowest run to finish, then the stream closes itself.
+PROGRESS_POLL_SECONDS = 0.5
+PROGRESS_STREAM_MAX_SECONDS = SIMULATION_HARD_TIME_LIMIT + 60
+
+
+@admin_router.get("/simulation-progress/{progress_id}")
+async def simulation_progress_endpoint(
+    progress_id: str = Path(pattern=PROGRESS_ID_PATTERN),
+):
+    """Server-sent events: live progress of the run started with this
+    progress_id, one `data:` event per change, until the run finishes."""
+
+    async def events():
+        deadline = time.monotonic() + PROGRESS_STREAM_MAX_SECONDS
+        last = None
+        while time.monotonic() < deadline:
+            progress = read_progress(progress_id)
+            if progress is not None and progress != last:
+                last = progress
+                yield f"data: {json.dumps(progress)}\n\n"
+                if progress["state"] != "running":
+                    return
+            elif progress is None:
+                # Keeps proxies from closing the idle stream before the
+                # task's first publish.
+                yield ": waiting\n\n"
+            await asyncio.sleep(PROGRESS_POLL_SECONDS)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@admin_router.post("/stop-simulation")
+async def stop_simulation_endpoint(stop: SimulationStop):
+    """Stop a progress-tracked run early; it returns the games played so far."""
+    request_stop(stop.progress_id)
+    return {"message": "Stop requested"}
+
+
 @admin_router.post("/get-all-league-results")
 async def get_league_results_endpoint(
     league: LeagueIdRef,
@@ -202,6 +390,17 @@ async def publish_results_endpoint(
     return {"message": msg, **data}
 
 
+@admin_router.post("/rescore-simulation")
+async def rescore_simulation_endpoint(
+    rescore: SimulationRescore,
+    session: Session = Depends(get_db),
+):
+    """Apply other rewards to a simulation that recorded placements."""
+    return rescore_simulation(
+        session, rescore.league_id, rescore.id, rescore.reward_schemes
+    )
+
+
 @admin_router.post("/update-expiry-date")
 async def update_expiry_endpoint(
     expiry: ExpiryDate,
@@ -0,0 +1,153 @@
+"""Consumer that saves the results of asynchronous simulation jobs.
+
+/admin/enqueue-simulation returns as soon as the task is queued, so nobody is
+guaranteed to be waiting when the run finishes. Every API process runs this
+consumer from its lifespan: once a second it looks at the unresolved
+SimulationJob rows, mirrors their live progress, and saves the result of any
+finished task with save_simulation_results.
+
+Several gunicorn workers run the loop at once. Each job is claimed on its own
+with SELECT ... FOR UPDATE SKIP LOCKED and marked resolved in the same
+transaction that saves its result, so exactly one process saves it.
+
+Task state is read with AsyncResult.ready() — a plain result-backend GET, for
+the reasons given in tasks/celery_utils.py — never with .get().
+"""
+
+import asyncio
+import json
+import logging
+import time
+
+from sqlmodel import Session, select
+
+from backend.database.db_models import SimulationJob, SimulationJobStatus
+from backend.database.db_session import get_db_engine
+from backend.routes.admin.admin_db import save_simulation_results
+from backend.tasks.celery_app import celery_app
+from backend.tasks.simulation_progress import read_progress
+from backend.tasks.simulation_task import SIMULATION_HARD_TIME_LIMIT
+from backend.time_utils import utc_now
+
+logger = logging.getLogger(__name__)
+
+JOB_POLL_SECONDS = 1.0
+
+# A finished task's result only lives result_expires (300s) in valkey, and a
+# running one publishes progress at least once per game. A job whose task has
+# shown no sign of life for this long since it started lost it (worker
+# restart, expired result while every API process was down) and is failed
+# rather than left running. Silence only counts from the task's first publish:
+# the simulation queue runs one job at a time, so a job can wait behind
+# several full-length runs, and its message survives a worker restart until a
+# worker takes it.
+JOB_LOST_AFTER_SECONDS = SIMULATION_HARD_TIME_LIMIT + 600
+
+_UNRESOLVED = (SimulationJobStatus.QUEUED, SimulationJobStatus.RUNNING)
+
+
+def _finish(session: Session, job: SimulationJob, status, error=None) -> None:
+    job.status = status
+    job.error = error
+    job.finished_at = utc_now()
+    session.add(job)
+
+
+def _save_result(session: Session, job: SimulationJob, results: dict) -> None:
+    if results.get("status") == "error":
+        _finish(
+            session,
+            job,
+            SimulationJobStatus.FAILED,
+            results.get("message", "Simulation failed"),
+        )
+        session.commit()
+        return
+
+    simulation_results = results["simulation_results"]
+    feedback = results.get("feedback")
+    job.games_completed = simulation_results["num_simulations"]
+    # Marked done before the save so its commit resolves the job too: the row
+    # lock is released by that commit, and no other consumer may pick it up.
+    _finish(session, job, SimulationJobStatus.DONE)
+    sim_result = save_simulation_results(
+        session,
+        job.league_id,
+        simulation_results,
+        json.loads(job.custom_rewards) if job.custom_rewards else None,
+        feedback_str=(feedback if isinstance(feedback, str) else None),
+        feedback_json=(json.dumps(feedback) if isinstance(feedback, dict) else None),
+    )
+    job.simulation_result_id = sim_result.id
+    session.add(job)
+    session.commit()
+
+
+def _advance(session: Session, job: SimulationJob) -> None:
+    """Move one locked, unresolved job forward; commits."""
+    async_result = celery_app.AsyncResult(job.task_id)
+    if async_result.ready():
+        if async_result.successful():
+            _save_result(session, job, async_result.result)
+        else:
+            _finish(
+                session, job, SimulationJobStatus.FAILED, str(async_result.result)
+            )
+            session.commit()
+        return
+
+    progress = read_progress(job.progress_id)
+    # No progress yet: the task is still queued, however long the wait.
+    if progress is not None:
+        job.games_completed = progress["games_completed"]
+        job.status = SimulationJobStatus.RUNNING
+        if time.time() - progress["updated_at"] > JOB_LOST_AFTER_SECONDS:
+            _finish(
+                session,
+                job,
+                SimulationJobStatus.FAILED,
+                "Simulation task was lost before it reported a result",
+            )
+    session.add(job)
+    session.commit()
+
+
+def collect_finished_jobs(session: Session) -> int:
+    """One consumer pass over every unresolved job; returns how many it resolved."""
+    job_ids = session.exec(
+        select(SimulationJob.id).where(SimulationJob.status.in_(_UNRESOLVED))
+    ).all()
+    resolved = 0
+    for job_id in job_ids:
+        job = session.exec(
+            select(SimulationJob)
+            .where(SimulationJob.id == job_id)
+            .where(SimulationJob.status.in_(_UNRESOLVED))
+            .with_for_update(skip_locked=True)
+        ).one_or_none()
+        if job is None:
+            continue  # another process holds it, or it was resolved meanwhile
+        try:
+            _advance(session, job)
+        except Exception:
+            session.rollback()
+            logger.exception(f"Error advancing simulation job {job_id}")
+            continue
+        if job.status not in _UNRESOLVED:
+            resolved += 1
+    return resolved
+
+
+def _collect_once() -> None:
+    with Session(get_db_engine()) as session:
+        collect_finished_jobs(session)
+
+
+async def run_job_consumer(interval: float = JOB_POLL_SECONDS) -> None:
+    """Lifespan background loop; DB and valkey calls run off the event loop."""
+    while True:
+        try:
+            await asyncio.to_thread(_collect_once)
+        except Exception:
+            logger.exception("Simulation job consumer pass failed")
+        await asyncio.sleep(interval)
@@ -8,6 +8,7 @@ from backend.routes.agent.agent_models import SimulationRequest
 from backend.routes.auth.auth_core import require_agent
 from backend.routes.user.user_db import get_latest_submissions_for_league
 from backend.tasks.celery_utils import poll_task_result
+from backend.tasks.code_store import store_code_blobs
 from backend.tasks.simulation_task import run_simulation as run_simulation_task
 
 agent_router = APIRouter()
@@ -42,15 +43,16 @@ async def run_simulation(
 
     allow_simulation(current_user["team_id"])  # SimulationLimitExceededError -> 429
 
-    # Read the submitted code here (the API holds the DB session) and pass it to
-    # the worker as a task arg, so the worker running untrusted agent code needs
-    # no database credential.
+    # Read the submitted code here (the API holds the DB session) and hand the
+    # worker its content addresses in the code store, so the worker running
+    # untrusted agent code needs no database credential and repeat calls do
+    # not push the league's source through the broker again.
     submissions = get_latest_submissions_for_league(session, request.league_id)
 
     async_result = run_simulation_task.delay(
         league_id=request.league_id,
         game_name=request.game_name,
-        submissions=submissions,
+        submission_refs=store_code_blobs(submissions),
         num_simulations=request.num_simulations,
         custom_rewards=request.custom_rewards,
         player_feedback=request.player_feedback,
@@ -105,8 +105,9 @@ _CATEGORY_DESCRIPTION: dict[str, str] = {
     "success": "The submission ran successfully through the single game and all simulations.",
     "syntax_error": "The code failed to parse (Python SyntaxError).",
     "timeout": (
-        f"The agent did not finish within the {VALIDATION_TIMEOUT_SECONDS}s limit "
-        "— likely too slow or stuck in a loop."
+        f"The agent did not finish within the {VALIDATION_TIMEOUT_SECONDS}s limit, "
+        "or single decisions broke the per-decision time budget (the message "
+        "says which) — likely too slow or stuck in a loop."
     ),
     "unsafe_code": "The code used a forbidden import or function call and was rejected before running.",
     "init_error": "The game itself failed to initialise (not necessarily the student's fault).",
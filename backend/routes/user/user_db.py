@@ -1,3 +1,4 @@
+import json
 import logging
 from datetime import timedelta
 from typing import Dict, Optional
@@ -78,6 +79,7 @@ def save_submission(
     duration_ms: Optional[float] = None,
     hint_included: bool = False,
     ranking: Optional[int] = None,
+    decision_profile: Optional[dict] = None,
 ) -> int:
     """Record a validated attempt: metadata row plus linked code row."""
     now = utc_now()
@@ -91,7 +93,13 @@ def save_submission(
     session.add(meta)
     session.flush()
     db_submission = Submission(
-        code=code, timestamp=now, ranking=ranking, metadata_id=meta.id
+        code=code,
+        timestamp=now,
+        ranking=ranking,
+        decision_profile=(
+            json.dumps(decision_profile) if decision_profile is not None else None
+        ),
+        metadata_id=meta.id,
     )
     session.add(db_submission)
     session.commit()
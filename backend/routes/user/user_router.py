@@ -54,6 +54,7 @@ from backend.routes.user.user_models import (
     SubmissionCode,
     TeamPasswordReset,
 )
+from backend.tasks.validation_cache import get_cached_validation, store_validation
 from backend.tasks.validation_task import (
     await_validation_result,
     enqueue_validation,
@@ -151,6 +152,7 @@ async def submit_agent(
     # never reaches a worker. The "Agent code is not safe: " prefix is
     # matched by hint_context.classify_outcome — do not reword.
     is_safe, error_message = validate_code(submission.code)
+    cache_hit = False
     if not is_safe:
         validation_result = {
             "status": "error",
@@ -162,17 +164,29 @@ async def submit_agent(
             "stdout": None,
         }
     else:
-        logger.info(f"Enqueueing validation task for team {team_name}")
-        async_result = enqueue_validation(
-            code=submission.code,
-            game_name=team.league.game,
-            team_name=team_name,
+        # Byte-identical resubmissions (double clicks, retries, reverting to an
+        # older version) reuse the stored result instead of a worker slot.
+        validation_result = get_cached_validation(
+            submission.code, team.league.game, team_name
         )
-        # Polls the backend (no thread, no shared pubsub consumer) and maps
-        # every kill/timeout/worker-loss to a clean validation failure.
-        validation_result = await await_validation_result(async_result)
+        cache_hit = validation_result is not None
+        if not cache_hit:
+            logger.info(f"Enqueueing validation task for team {team_name}")
+            async_result = enqueue_validation(
+                code=submission.code,
+                game_name=team.league.game,
+                team_name=team_name,
+            )
+            # Polls the backend (no thread, no shared pubsub consumer) and maps
+            # every kill/timeout/worker-loss to a clean validation failure.
+            validation_result = await await_validation_result(async_result)
+            store_validation(
+                submission.code, team.league.game, team_name, None, validation_result
+            )
 
-    duration_ms = validation_result.get("duration_ms")
+    # A cache hit ran nothing: the stored duration belongs to the run that
+    # filled the cache, and would count that run's time twice in the stats.
+    duration_ms = None if cache_hit else validation_result.get("duration_ms")
     validation_failed = validation_result.get("status") == "error"
 
     hint: Hint | None = None
@@ -230,6 +244,9 @@ async def submit_agent(
         duration_ms=duration_ms,
         hint_included=False,
         ranking=_validation_ranking(validation_result, team_name),
+        decision_profile=(validation_result.get("simulation_results") or {}).get(
+            "decision_profile"
+        ),
     )
     return {
         "submission_id": submission_id,
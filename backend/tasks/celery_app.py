@@ -3,7 +3,12 @@ import os
 
 from celery import Celery
 from celery.concurrency.asynpool import AsynPool
-from celery.signals import worker_process_init, worker_ready
+from celery.signals import worker_init, worker_process_init, worker_ready
+
+from backend.tasks.result_serializer import (
+    SERIALIZER_NAME as RESULT_SERIALIZER,
+    register_result_serializer,
+)
 
 # With worker_max_tasks_per_child=1 every task kills its child, and a task that
 # arrives while all slots are dead sits in the worker until the pool-maintenance
@@ -39,6 +44,10 @@ _default_broker = (
 broker_url = os.environ.get("CELERY_BROKER_URL", _default_broker)
 result_backend = os.environ.get("CELERY_RESULT_BACKEND", broker_url)
 
+# Results are JSON, zlib-compressed when large (see result_serializer). Both the
+# workers and the API import this module, so both ends know the codec.
+register_result_serializer()
+
 celery_app = Celery(
     "agent_games",
     broker=broker_url,
@@ -51,8 +60,8 @@ celery_app = Celery(
 
 celery_app.conf.update(
     task_serializer="json",
-    result_serializer="json",
-    accept_content=["json"],
+    result_serializer=RESULT_SERIALIZER,
+    accept_content=["json", RESULT_SERIALIZER],
     task_routes={
         "validation.*": {"queue": "validation"},
         "simulation.*": {"queue": "simulation"},
@@ -72,6 +81,25 @@ celery_app.conf.update(
 )
 
 
+# The parent never ran any game code, so every one-task child used to import
+# the engine, player and validation_players modules (and configure the SQLModel
+# mappers on its first League()) all over again before the agent's first
+# decision. Do it once here, before the pool forks its first children and
+# before _freeze_parent_heap, so children inherit all of it copy-on-write.
+# The pairwise games' bot-vs-bot baselines are loaded here too, and rebuilt
+# if a deploy shipped them stale.
+@worker_init.connect
+def _preload_games(**kwargs):
+    from sqlalchemy.orm import configure_mappers
+
+    from backend.games import bot_baseline
+    from backend.games.game_factory import GameFactory
+
+    configure_mappers()
+    GameFactory.preload_all()
+    bot_baseline.ensure_all()
+
+
 # Fork-per-task makes fork cost the throughput ceiling on a 1-vCPU host: every
 # page the child touches is copy-on-write-faulted, and the cyclic GC is the
 # worst offender (a collection walks every tracked object, dirtying the whole
@@ -0,0 +1,97 @@
+"""Content-addressed store of submission source code, kept in valkey.
+
+Every simulation task used to carry the full {team_name: code} map in its
+message, so each /agent/simulate call (up to 10 a minute per team) and every
+shard of a sharded run pushed the whole league's source through the broker
+again — into a valkey capped at 150mb with noeviction. The API now stores each
+distinct source once under its sha256 and enqueues only a {team_name: digest}
+map; the worker resolves the digests with one MGET before loading players.
+
+Storing refreshes the TTL of blobs that are already there and only uploads the
+missing ones, so a league whose code has not changed re-sends nothing but the
+digests. The worker stays credential-free: it already holds the broker URL and
+reads nothing but code it is about to run anyway.
+"""
+
+import hashlib
+import logging
+from typing import Dict
+
+from redis import Redis
+
+from backend.tasks.celery_app import broker_url
+
+logger = logging.getLogger(__name__)
+
+# Refreshed on every enqueue that uses the blob; long enough to outlive a task
+# that waited in the queue and then ran to the simulation hard limit (630s).
+CODE_BLOB_TTL_SECONDS = 3600
+
+_redis: Redis | None = None
+
+
+def _get_redis() -> Redis:
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(broker_url)
+    return _redis
+
+
+class CodeBlobMissingError(LookupError):
+    """A task referenced code blobs that are no longer (or never were) stored."""
+
+    def __init__(self, team_names):
+        self.team_names = sorted(team_names)
+        super().__init__(
+            "Submission code expired before the run started: "
+            + ", ".join(self.team_names)
+        )
+
+
+def code_digest(code: str) -> str:
+    """Hex sha256 of the submitted code, the content address of a submission."""
+    return hashlib.sha256(code.encode()).hexdigest()
+
+
+def _blob_key(digest: str) -> str:
+    return f"code-blob:{digest}"
+
+
+def store_code_blobs(submissions: Dict[str, str]) -> Dict[str, str]:
+    """Store each distinct source once; returns the {team_name: digest} map.
+
+    One round trip refreshes the TTL of every referenced blob; a second
+    uploads only the blobs that were not there.
+    """
+    refs = {team: code_digest(code) for team, code in submissions.items()}
+    codes = {refs[team]: code for team, code in submissions.items()}
+    if not codes:
+        return refs
+    digests = list(codes)
+    redis = _get_redis()
+    with redis.pipeline(transaction=False) as pipe:
+        for digest in digests:
+            pipe.expire(_blob_key(digest), CODE_BLOB_TTL_SECONDS)
+        refreshed = pipe.execute()
+    missing = [digest for digest, hit in zip(digests, refreshed) if not hit]
+    if missing:
+        with redis.pipeline(transaction=False) as pipe:
+            for digest in missing:
+                pipe.set(_blob_key(digest), codes[digest], ex=CODE_BLOB_TTL_SECONDS)
+            pipe.execute()
+    return refs
+
+
+def load_code_blobs(refs: Dict[str, str]) -> Dict[str, str]:
+    """Resolve a {team_name: digest} map back to {team_name: code}.
+
+    Raises CodeBlobMissingError naming the teams whose blob has expired.
+    """
+    if not refs:
+        return {}
+    teams = list(refs)
+    blobs = _get_redis().mget([_blob_key(refs[team]) for team in teams])
+    missing = [team for team, blob in zip(teams, blobs) if blob is None]
+    if missing:
+        raise CodeBlobMissingError(missing)
+    return {team: blob.decode() for team, blob in zip(teams, blobs)}
@@ -0,0 +1,97 @@
+"""Per-decision time budgets for the agents in a worker task.
+
+The Celery limits bound a whole task (5s/6s for validation, 600s/630s for a
+simulation), so one pathological agent in a 40-team league could burn the
+entire run and it came back `capped` with no clue who was responsible. Every
+agent call already goes through DecisionProfiler.time; ``enforce`` gives that
+profiler a budget:
+
+- a decision over DECISION_BUDGET_MS is an overrun; a player with more than
+  DECISION_MAX_OVERRUNS of them is disqualified when the next one returns;
+- a decision still running at DECISION_HARD_LIMIT_MS is interrupted and its
+  player disqualified on the spot. A watchdog thread polls the call in flight
+  and signals the main thread (SIGPROF), whose handler raises
+  DecisionBudgetExceeded inside the agent's code.
+
+The clock is wall time: it is what the task budgets are spent in, and the
+profiler already reads it around every call — a CPU clock would add a syscall
+per decision. The limits are generous enough (a bot decides in microseconds)
+that sharing the core with another worker child does not trip them.
+
+A disqualification surfaces as DecisionBudgetExceeded, a BaseException that
+passes through the engines' and agents' ``except Exception``; the task drops
+the player and carries on (see simulation_task and validation_task).
+"""
+
+import logging
+import os
+import signal
+import threading
+import time
+from typing import Optional
+
+from backend.games.decision_profile import DecisionBudgetExceeded, DecisionProfiler
+
+logger = logging.getLogger(__name__)
+
+DECISION_BUDGET_MS = float(os.environ.get("DECISION_BUDGET_MS", "250"))
+DECISION_MAX_OVERRUNS = int(os.environ.get("DECISION_MAX_OVERRUNS", "3"))
+DECISION_HARD_LIMIT_MS = float(os.environ.get("DECISION_HARD_LIMIT_MS", "2000"))
+
+# How often the watchdog looks at the call in flight; a runaway decision is
+# interrupted at most this long after crossing the hard limit.
+WATCHDOG_INTERVAL_SECONDS = 0.05
+
+_WATCHDOG_SIGNAL = signal.SIGPROF
+
+# The profiler the watchdog polls. A task process plays one run at a time, so
+# one watchdog thread per process serves every run it plays.
+_watched: Optional[DecisionProfiler] = None
+_watchdog: Optional[threading.Thread] = None
+
+
+def _on_watchdog_signal(signum, frame):
+    profiler = _watched
+    name = profiler.overdue() if profiler is not None else None
+    # Re-checked here, in the main thread: the call the watchdog saw may have
+    # returned since, and a fresh call must not be blamed for it.
+    if name is not None:
+        reason = f"a single decision ran past the {profiler.hard_limit_ms:g} ms hard limit"
+        # Recorded here too: the exception may land in the profiler's own
+        # bookkeeping rather than in the agent.
+        profiler.disqualified[str(name)] = reason
+        raise DecisionBudgetExceeded(str(name), reason)
+
+
+def _watch(main_thread_id: int) -> None:
+    while True:
+        time.sleep(WATCHDOG_INTERVAL_SECONDS)
+        profiler = _watched
+        if profiler is not None and profiler.overdue() is not None:
+            signal.pthread_kill(main_thread_id, _WATCHDOG_SIGNAL)
+
+
+def enforce(profiler: DecisionProfiler) -> None:
+    """Put `profiler`'s game under the per-decision budget for the rest of the task.
+
+    The hard limit needs the signal handler, which only the main thread can
+    install; called from any other thread the budget is enforced on return
+    only.
+    """
+    global _watched, _watchdog
+    profiler.set_budget(
+        DECISION_BUDGET_MS, DECISION_HARD_LIMIT_MS, DECISION_MAX_OVERRUNS
+    )
+    _watched = profiler
+    if threading.current_thread() is not threading.main_thread():
+        logger.warning("Decision budget enforced without a hard limit (not main thread)")
+        return
+    if _watchdog is None:
+        signal.signal(_WATCHDOG_SIGNAL, _on_watchdog_signal)
+        _watchdog = threading.Thread(
+            target=_watch,
+            args=(threading.main_thread().ident,),
+            name="decision-watchdog",
+            daemon=True,
+        )
+        _watchdog.start()
@@ -0,0 +1,106 @@
+"""Per-pairing league results, kept in valkey, for delta re-simulations.
+
+In a pairwise game (BaseGame.bot_baseline_stats is set) a league run is a
+round robin of independent pairings, so when one team of 40 resubmits, 741
+of the 780 pairings would be replayed with the same code as last time. A
+delta run (SimulationConfig.delta) plays every pairing on its own for the
+requested number of passes (BaseGame.play_pairing_passes) and stores the
+result here; the next delta run replays only the pairings that have no
+record — O(n) pairings after a single resubmission instead of O(n^2) — and
+rebuilds the standings from the stored matrix (matrix_totals). That is only
+sound while agents see nothing beyond their own pairing; a game that shows
+them the whole field (prisoners' dilemma's all_history) is not pairwise,
+and delta runs of it are rejected.
+
+The key is both sides' team name and code digest plus everything else the
+record depends on: the game, the custom rewards, the pass count and the
+engine version (games.engine_source.engine_version), so a deploy that changes
+an engine never mixes records from the old code into a new ranking. The
+team name is there because agents are told their opponent's name.
+
+Like validation_cache, this talks to the broker's valkey with plain keys;
+every key carries a TTL, and a valkey error is logged and treated as a miss
+— the cache can only ever cost a replay.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from redis import Redis
+
+from backend.games.engine_source import engine_version
+from backend.tasks.celery_app import broker_url
+
+logger = logging.getLogger(__name__)
+
+# Long enough to span the days between two re-rankings of a league; a record
+# is refreshed every time a delta run reads it.
+PAIRING_CACHE_TTL_SECONDS = 14 * 24 * 3600
+
+_redis: Redis | None = None
+
+
+def _get_redis() -> Redis:
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(broker_url)
+    return _redis
+
+
+def pairing_key(
+    game_name: str,
+    custom_rewards: Optional[list],
+    passes: int,
+    side_a: Tuple[str, str],
+    side_b: Tuple[str, str],
+) -> str:
+    """Key of one pairing's record; each side is (team_name, code digest)."""
+    params = hashlib.sha256(
+        json.dumps([game_name, custom_rewards, passes]).encode()
+    ).hexdigest()[:16]
+    pair = hashlib.sha256(
+        json.dumps(sorted([list(side_a), list(side_b)])).encode()
+    ).hexdigest()
+    return f"pairing-cache:{engine_version(game_name)}:{params}:{pair}"
+
+
+def get_pairings(keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """The stored record for each key (None: not stored), refreshing the TTL
+    of those found."""
+    if not keys:
+        return []
+    try:
+        redis = _get_redis()
+        with redis.pipeline(transaction=False) as pipe:
+            pipe.mget(keys)
+            for key in keys:
+                pipe.expire(key, PAIRING_CACHE_TTL_SECONDS)
+            raw = pipe.execute()[0]
+    except Exception as e:
+        logger.warning(f"Pairing cache lookup failed: {e}")
+        return [None] * len(keys)
+    return [json.loads(value) if value else None for value in raw]
+
+
+def store_pairing(key: str, record: Dict[str, Any]) -> None:
+    try:
+        _get_redis().set(key, json.dumps(record), ex=PAIRING_CACHE_TTL_SECONDS)
+    except Exception as e:
+        logger.warning(f"Pairing cache store failed: {e}")
+
+
+def matrix_totals(
+    records: List[Dict[str, Dict[str, float]]],
+) -> Tuple[Dict[str, float], Dict[str, Dict[str, float]]]:
+    """Fold pairing records ({stat: {team: value}}) into the run's
+    total_points and its table of the other stats."""
+    totals: Dict[str, Dict[str, float]] = {"points": {}}
+    for record in records:
+        for stat, values in record.items():
+            total = totals.setdefault(stat, {})
+            for name, value in values.items():
+                total[name] = total.get(name, 0) + value
+    total_points = totals.pop("points")
+    return total_points, totals
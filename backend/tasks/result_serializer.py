@@ -0,0 +1,58 @@
+"""Compressed JSON serializer for Celery task results.
+
+A simulation run with player_feedback returns the whole verbose feedback game
+(Breakthrough turn lists, Hearts trick records), which can be megabytes of
+JSON sitting in the result backend — a valkey capped at 150mb with noeviction
+— for result_expires, while several runs finish concurrently. Results are
+therefore stored with this "json-zlib" serializer: the same kombu JSON
+encoding as before (so objects with __json__ and datetimes serialize exactly
+as they did), zlib-compressed once the encoded payload passes
+COMPRESS_THRESHOLD_BYTES. Small results stay plain JSON: compressing a few
+hundred bytes costs more CPU than it saves memory.
+
+A compressed payload is recognised by its zlib header byte (0x78, "x"), which
+no JSON document can start with, so the decoder also accepts plain JSON
+results written before this serializer was introduced.
+"""
+
+import zlib
+
+from kombu.serialization import register
+from kombu.utils import json
+
+SERIALIZER_NAME = "json-zlib"
+CONTENT_TYPE = "application/x-json-zlib"
+
+# Below this the payload is stored as plain JSON.
+COMPRESS_THRESHOLD_BYTES = 16 * 1024
+
+# Level 1 keeps almost all of the size win on repetitive feedback JSON at a
+# fraction of the default level's CPU cost.
+COMPRESS_LEVEL = 1
+
+_ZLIB_HEADER = 0x78
+
+
+def dumps(obj) -> bytes:
+    data = json.dumps(obj).encode("utf-8")
+    if len(data) > COMPRESS_THRESHOLD_BYTES:
+        return zlib.compress(data, COMPRESS_LEVEL)
+    return data
+
+
+def loads(data):
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if data[:1] == bytes((_ZLIB_HEADER,)):
+        data = zlib.decompress(data)
+    return json.loads(data)
+
+
+def register_result_serializer() -> None:
+    register(
+        SERIALIZER_NAME,
+        dumps,
+        loads,
+        content_type=CONTENT_TYPE,
+        content_encoding="binary",
+    )
@@ -0,0 +1,184 @@
+"""Live progress for running league simulations, kept in valkey.
+
+A league run can take up to the 10-minute budget and the admin used to see
+nothing until it returned. While it runs, the simulation task (or each shard of
+a sharded run) publishes a partial aggregate — games completed, running
+total_points, average cost per game and projected time to finish — under a
+caller-chosen ``progress_id``. The API reads it back for the admin progress
+stream and can raise a stop flag that the task honours at its next publish,
+returning the whole games played so far.
+
+Both sides talk to the broker's valkey directly (plain keys, no Celery
+machinery): the worker already has the broker URL and nothing here is secret.
+Every key carries a TTL so an abandoned run cannot pin memory in a
+noeviction valkey.
+"""
+
+import json
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from redis import Redis
+
+from backend.tasks.celery_app import broker_url
+
+logger = logging.getLogger(__name__)
+
+# Publish after this many games or this many seconds, whichever comes first.
+# The per-game check is two integer compares and a perf_counter read, so the
+# cost on fast games is negligible; the time bound keeps slow games visible.
+PROGRESS_EVERY_GAMES = 100
+PROGRESS_EVERY_SECONDS = 1.0
+
+# Outlives the longest run (hard limit 630s) with room for a slow reader.
+PROGRESS_TTL_SECONDS = 3600
+
+_redis: Redis | None = None
+
+
+def _get_redis() -> Redis:
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(broker_url)
+    return _redis
+
+
+def _progress_key(progress_id: str) -> str:
+    return f"simulation-progress:{progress_id}"
+
+
+def _stop_key(progress_id: str) -> str:
+    return f"simulation-stop:{progress_id}"
+
+
+class ProgressReporter:
+    """Worker-side publisher for one task (one shard) of a progress-tracked run.
+
+    Each shard writes its own field of the run's hash, so concurrent shards
+    never overwrite each other; read_progress folds them together. Publishing
+    is best-effort: a valkey hiccup is logged once and never fails the run.
+    """
+
+    def __init__(
+        self,
+        progress_id: str,
+        shard: int,
+        shard_count: int,
+        requested: int,
+        budget_seconds: float,
+    ):
+        self.progress_id = progress_id
+        self.shard = shard
+        self.shard_count = shard_count
+        self.requested = requested
+        self.budget_seconds = budget_seconds
+        self.total_points: Dict[str, float] = {}
+        self._last_games = 0
+        self._last_time = time.perf_counter()
+        self._failed = False
+
+    def add_result(self, result: Dict[str, Any]) -> None:
+        for player, points in result.get("points", {}).items():
+            self.total_points[player] = self.total_points.get(player, 0) + points
+
+    def due(self, games_done: int) -> bool:
+        return (
+            games_done - self._last_games >= PROGRESS_EVERY_GAMES
+            or time.perf_counter() - self._last_time >= PROGRESS_EVERY_SECONDS
+        )
+
+    def publish(
+        self, games_done: int, elapsed: float, sim_elapsed: float, state: str
+    ) -> None:
+        """Write this shard's snapshot. `elapsed` is the whole-task clock,
+        `sim_elapsed` the simulation loop's (the per-game average basis)."""
+        self._last_games = games_done
+        self._last_time = time.perf_counter()
+        avg = sim_elapsed / games_done if games_done else None
+        remaining = None
+        if avg is not None and state == "running":
+            remaining = min(
+                (self.requested - games_done) * avg,
+                max(0.0, self.budget_seconds - elapsed),
+            )
+        snapshot = {
+            "state": state,
+            "shard_count": self.shard_count,
+            "games_completed": games_done,
+            "requested_simulations": self.requested,
+            "total_points": self.total_points,
+            "avg_game_seconds": avg,
+            "elapsed_seconds": elapsed,
+            "projected_remaining_seconds": remaining,
+            "updated_at": time.time(),
+        }
+        try:
+            key = _progress_key(self.progress_id)
+            with _get_redis().pipeline() as pipe:
+                pipe.hset(key, str(self.shard), json.dumps(snapshot))
+                pipe.expire(key, PROGRESS_TTL_SECONDS)
+                pipe.execute()
+        except Exception as e:
+            if not self._failed:
+                logger.warning(f"Could not publish simulation progress: {e}")
+            self._failed = True
+
+    def stop_requested(self) -> bool:
+        try:
+            return bool(_get_redis().exists(_stop_key(self.progress_id)))
+        except Exception:
+            return False
+
+
+def request_stop(progress_id: str) -> None:
+    """Ask every task of the run to stop at its next progress publish."""
+    _get_redis().set(_stop_key(progress_id), 1, ex=PROGRESS_TTL_SECONDS)
+
+
+def read_progress(progress_id: str) -> Optional[Dict[str, Any]]:
+    """The run's combined progress, or None if nothing was published yet.
+
+    Shards are summed (games, points) and the run is as far from done as its
+    slowest shard. `state` is "running" until every shard has finished, then
+    "failed" if any shard errored, "stopped" if any was stopped early, else
+    "done".
+    """
+    raw = _get_redis().hgetall(_progress_key(progress_id))
+    if not raw:
+        return None
+    shards = [json.loads(value) for value in raw.values()]
+
+    total_points: Dict[str, float] = {}
+    for shard in shards:
+        for player, points in shard["total_points"].items():
+            total_points[player] = total_points.get(player, 0) + points
+
+    games = sum(s["games_completed"] for s in shards)
+    costs = [s["avg_game_seconds"] for s in shards if s["avg_game_seconds"]]
+    remaining = [
+        s["projected_remaining_seconds"]
+        for s in shards
+        if s["projected_remaining_seconds"] is not None
+    ]
+    states = {s["state"] for s in shards}
+    # A shard still waiting in the queue has not written its field yet.
+    if "running" in states or len(shards) < max(s["shard_count"] for s in shards):
+        state = "running"
+    elif "failed" in states:
+        state = "failed"
+    elif "stopped" in states:
+        state = "stopped"
+    else:
+        state = "done"
+
+    return {
+        "state": state,
+        "shards": len(shards),
+        "games_completed": games,
+        "requested_simulations": sum(s["requested_simulations"] for s in shards),
+        "total_points": total_points,
+        "avg_game_seconds": sum(costs) / len(costs) if costs else None,
+        "projected_remaining_seconds": max(remaining) if remaining else None,
+        "updated_at": max(s["updated_at"] for s in shards),
+    }
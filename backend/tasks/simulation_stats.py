@@ -0,0 +1,145 @@
+"""Streaming per-player statistics for league simulations.
+
+Every play_game call of an independent game (BaseGame.independent_games) is
+one draw of each player's points. RunningStats keeps Welford mean/variance
+accumulators per player, which put a confidence interval on each team's
+total_points, and per pair of players, which tell when the ranking has
+settled: a run in "until stable" mode stops as soon as every adjacent pair of the ranking is separated
+at the requested confidence level, instead of always playing num_simulations.
+
+Players sharing a game are not independent: one player's gain is usually
+another's loss, and that negative correlation makes the difference of two
+players' points vary more than their separate variances add up to. The
+pairwise test is therefore a paired one: two players are apart when the
+mean of their per-game point difference clears z standard errors of that
+difference's own variance. Accumulators are plain lists in plain dicts so a shard can ship
+them in its JSON result (state) and the merge step can combine them
+exactly (Chan et al.'s parallel update).
+"""
+
+import math
+from statistics import NormalDist
+from typing import Dict, List, Optional
+
+DEFAULT_CONFIDENCE = 0.95
+
+# "Until stable" never decides on fewer games than this: with a handful of
+# samples the variance estimate itself is too noisy to trust.
+STABILITY_MIN_GAMES = 30
+# Re-test the ranking every this many games; the test is O(players log players).
+STABILITY_CHECK_EVERY = 10
+
+
+def z_for_confidence(confidence: float) -> float:
+    """Two-sided normal critical value, e.g. 1.96 for 0.95."""
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def _add(a: List[float], x: float) -> None:
+    """Welford update of a [count, mean, M2] accumulator."""
+    a[0] += 1
+    delta = x - a[1]
+    a[1] += delta / a[0]
+    a[2] += delta * (x - a[1])
+
+
+def _merge(a: List[float], b: List[float]) -> None:
+    """Fold accumulator `b` into `a`."""
+    n_a, mean_a, m2_a = a
+    n_b, mean_b, m2_b = b
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    a[0] = n
+    a[1] = mean_a + delta * n_b / n
+    a[2] = m2_a + m2_b + delta * delta * n_a * n_b / n
+
+
+class RunningStats:
+    """Per-player [count, mean, M2] accumulators over per-game points, and
+    the same over each pair's per-game difference: ``pairs[a][b]`` (a < b)
+    accumulates a's points minus b's."""
+
+    def __init__(self, state: Optional[Dict[str, Dict]] = None):
+        state = state or {}
+        self.acc: Dict[str, List[float]] = {
+            player: list(values) for player, values in state.get("players", {}).items()
+        }
+        self.pairs: Dict[str, Dict[str, List[float]]] = {
+            a: {b: list(values) for b, values in row.items()}
+            for a, row in state.get("pairs", {}).items()
+        }
+
+    def state(self) -> Dict[str, Dict]:
+        """The accumulators as plain JSON data, for RunningStats(state)."""
+        return {"players": self.acc, "pairs": self.pairs}
+
+    def add(self, points: Dict[str, float]) -> None:
+        acc = self.acc
+        for player, x in points.items():
+            a = acc.get(player)
+            if a is None:
+                a = acc[player] = [0, 0.0, 0.0]
+            _add(a, x)
+        # O(players^2) per game, no more than the round robin that produced it.
+        players = sorted(points)
+        for i, a in enumerate(players):
+            row = self.pairs.setdefault(a, {})
+            x = points[a]
+            for b in players[i + 1:]:
+                d = row.get(b)
+                if d is None:
+                    d = row[b] = [0, 0.0, 0.0]
+                _add(d, x - points[b])
+
+    def merge(self, other: "RunningStats") -> None:
+        for player, values in other.acc.items():
+            a = self.acc.get(player)
+            if a is None:
+                self.acc[player] = list(values)
+            else:
+                _merge(a, values)
+        for a, other_row in other.pairs.items():
+            row = self.pairs.setdefault(a, {})
+            for b, values in other_row.items():
+                d = row.get(b)
+                if d is None:
+                    row[b] = list(values)
+                else:
+                    _merge(d, values)
+
+    def _variance(self, player: str) -> float:
+        n, _, m2 = self.acc[player]
+        return m2 / (n - 1) if n > 1 else 0.0
+
+    def _difference(self, hi: str, lo: str) -> List[float]:
+        """[count, mean, M2] of hi's points minus lo's, over their shared games."""
+        if hi < lo:
+            return self.pairs.get(hi, {}).get(lo, [0, 0.0, 0.0])
+        n, mean, m2 = self.pairs.get(lo, {}).get(hi, [0, 0.0, 0.0])
+        return [n, -mean, m2]
+
+    def ranking_separated(self, z: float) -> bool:
+        """True when every adjacent pair of the ranking (by mean) is apart by
+        more than z standard errors of their paired per-game difference.
+
+        A pair with zero standard error is settled either way: it is either
+        cleanly apart or an exact, deterministic tie more games cannot break.
+        """
+        ranked = sorted(self.acc, key=lambda p: self.acc[p][1], reverse=True)
+        for hi, lo in zip(ranked, ranked[1:]):
+            n, mean, m2 = self._difference(hi, lo)
+            if n < 2:
+                return False
+            se = math.sqrt(m2 / (n - 1) / n)
+            if se and mean <= z * se:
+                return False
+        return True
+
+    def confidence_intervals(self, z: float) -> Dict[str, List[float]]:
+        """[low, high] for each player's total points (n * mean)."""
+        intervals = {}
+        for player, (n, mean, _) in self.acc.items():
+            half = z * math.sqrt(n * self._variance(player))
+            total = n * mean
+            intervals[player] = [round(total - half, 2), round(total + half, 2)]
+        return intervals
@@ -8,17 +8,44 @@ nothing. Each task still runs in a fresh forked child
 (worker_max_tasks_per_child=1) purely for process isolation of agent code.
 """
 
+import itertools
 import logging
 import os
 import time
 from datetime import timedelta
 from typing import Any, Dict, List, Optional
 
+from celery import chord, group
 from celery.exceptions import SoftTimeLimitExceeded
+from celery.result import AsyncResult
 
 from backend.tasks.celery_app import celery_app
 from backend.database.db_models import League
+from backend.games.base_game import derive_seed
+from backend.games.decision_profile import DecisionBudgetExceeded, DecisionProfiler
 from backend.games.game_factory import GameFactory
+from backend.games.placements import is_placement_game, merge_placements, rescore_run
+from backend.tasks.code_store import (
+    CodeBlobMissingError,
+    code_digest,
+    load_code_blobs,
+    store_code_blobs,
+)
+from backend.tasks.decision_budget import enforce as enforce_decision_budget
+from backend.tasks.pairing_cache import (
+    get_pairings,
+    matrix_totals,
+    pairing_key,
+    store_pairing,
+)
+from backend.tasks.simulation_progress import ProgressReporter
+from backend.tasks.simulation_stats import (
+    DEFAULT_CONFIDENCE,
+    STABILITY_CHECK_EVERY,
+    STABILITY_MIN_GAMES,
+    RunningStats,
+    z_for_confidence,
+)
 from backend.time_utils import utc_now
 
 logger = logging.getLogger(__name__)
@@ -61,11 +88,33 @@ def aggregate_simulation_results(simulation_results, num_simulations):
     if simulation_results and "table" in simulation_results[-1]:
         table_data = simulation_results[-1]["table"]
 
-    return {
+    aggregated = {
         "total_points": total_points,
         "num_simulations": num_simulations,
         "table": table_data,
     }
+    placements = [
+        result["placements"]
+        for result in simulation_results
+        if result and "placements" in result
+    ]
+    if placements:
+        aggregated["placements"] = merge_placements(placements)
+    return aggregated
+
+
+def _add_rescored(game_class, aggregated_results, reward_schemes) -> None:
+    """Rescore a run that recorded placements under each of `reward_schemes`."""
+    if reward_schemes and "placements" in aggregated_results:
+        aggregated_results["rescored"] = [
+            {
+                "rewards": rewards,
+                "total_points": rescore_run(
+                    game_class, aggregated_results["placements"], rewards
+                ),
+            }
+            for rewards in reward_schemes
+        ]
 
 
 def _load_submitted_players(game, submissions: Optional[Dict[str, str]]) -> None:
@@ -92,32 +141,224 @@ def _load_submitted_players(game, submissions: Optional[Dict[str, str]]) -> None
     logger.info(f"Total league players loaded: {len(game.players)}")
 
 
-@celery_app.task(
-    name="simulation.run",
-    # 10-minute ceiling. The task's own budget (SIMULATION_TIME_BUDGET_SECONDS)
-    # stops it cleanly before this fires; the soft limit is only a backstop for
-    # a single pathologically slow game, and even then SoftTimeLimitExceeded is
-    # caught below so completed simulations are still returned.
-    soft_time_limit=SIMULATION_SOFT_TIME_LIMIT,
-    time_limit=SIMULATION_HARD_TIME_LIMIT,
-)
-def run_simulation(
+def _disqualify(game, exc: DecisionBudgetExceeded) -> None:
+    """Drop the agent `exc` names from the run; the run itself carries on."""
+    logger.warning(f"Disqualified {exc.player_name}: {exc.reason}")
+    game.remove_player(exc.player_name)
+
+
+def _run_feedback_game(game, custom_rewards):
+    """The feedback game, replayed without any agent it disqualifies."""
+    while True:
+        try:
+            return game.run_single_game_with_feedback(custom_rewards)
+        except DecisionBudgetExceeded as e:
+            _disqualify(game, e)
+            if not game.players:
+                raise ValueError("every player was disqualified") from e
+            game.reset()
+
+
+def _error_result(message: str, num_simulations: int) -> Dict[str, Any]:
+    return {
+        "status": "error",
+        "message": message,
+        "simulation_results": {
+            "total_points": {},
+            "num_simulations": num_simulations,
+            "table": {},
+        },
+    }
+
+
+def _success_result(
+    game, aggregated_results, feedback_result, player_feedback
+) -> Dict[str, Any]:
+    """The success result of a run, with the game's strategies and the
+    profiler's decision latency added to `aggregated_results`."""
+    # Only validation players declare a strategy, so this is empty whenever
+    # real league submissions replaced them.
+    aggregated_results["strategies"] = game.get_player_strategies()
+    profiler = getattr(game, "profiler", None)
+    if profiler is not None:
+        aggregated_results["decision_profile"] = profiler.summary()
+        # Raw histograms, merged across shards like `stats`.
+        aggregated_results["decision_profile_state"] = profiler.state()
+        aggregated_results["disqualified"] = dict(profiler.disqualified)
+
+    return {
+        "status": "success",
+        "feedback": feedback_result["feedback"],
+        "player_feedback": (
+            feedback_result["player_feedback"]
+            if player_feedback
+            else "No player feedback"
+        ),
+        "simulation_results": aggregated_results,
+    }
+
+
+# Code digest of the players a run keeps from the game itself (no league
+# submissions): their source is covered by the engine version in the key.
+VALIDATION_PLAYER_DIGEST = "validation-player"
+
+
+def _execute_delta(
+    game,
+    game_name: str,
+    submission_refs: Dict[str, str],
+    num_simulations: int,
+    custom_rewards: Optional[List[int]],
+    budget_seconds: float,
+    task_start: float,
+    progress_id: Optional[str],
+) -> Dict[str, Any]:
+    """Play a pairwise game's league as a matrix of pairings (see
+    pairing_cache); returns the run's aggregated results, or an error result.
+
+    Each pairing is `num_simulations` passes of its two players alone, seeded
+    from the run seed and the pairing, and only pairings with no stored
+    record are played. The budget and an admin stop are checked between
+    pairings; a run cut short by either stores the pairings it finished, so
+    running it again carries on from there. An agent disqualified on the
+    per-decision budget is dropped with all of its pairings.
+    """
+    run_seed = game._seed
+    profiler = getattr(game, "profiler", None)
+    if profiler is not None:
+        profiler.reset()
+
+    def side(player):
+        name = str(player.name)
+        return name, submission_refs.get(name, VALIDATION_PLAYER_DIGEST)
+
+    pairs = list(itertools.combinations(game.players, 2))
+    keys = [
+        pairing_key(game_name, custom_rewards, num_simulations, side(a), side(b))
+        for a, b in pairs
+    ]
+    records = dict(zip(keys, get_pairings(keys)))
+    missing = [(key, pair) for key, pair in zip(keys, pairs) if records[key] is None]
+
+    reporter = None
+    if progress_id:
+        reporter = ProgressReporter(progress_id, 0, 1, len(missing), budget_seconds)
+        reporter.publish(0, time.perf_counter() - task_start, 0.0, "running")
+    sim_start = time.perf_counter()
+    replayed = 0
+    cut_short = None
+    for key, pair in missing:
+        if any(player not in game.players for player in pair):
+            continue  # one of them was disqualified
+        now = time.perf_counter()
+        if replayed:
+            avg_per_pairing = (now - sim_start) / replayed
+            if now - task_start + avg_per_pairing >= budget_seconds:
+                cut_short = "reached its time budget"
+                break
+        game.seed_rng(derive_seed(run_seed, "pairing", key))
+        try:
+            record = game.play_pairing_passes(pair, num_simulations, custom_rewards)
+        except DecisionBudgetExceeded as e:
+            _disqualify(game, e)
+            continue
+        records[key] = record
+        store_pairing(key, record)
+        replayed += 1
+        if reporter is not None and reporter.due(replayed):
+            now = time.perf_counter()
+            reporter.publish(replayed, now - task_start, now - sim_start, "running")
+            if reporter.stop_requested():
+                cut_short = "was stopped by an admin"
+                break
+
+    if reporter is not None:
+        now = time.perf_counter()
+        reporter.publish(
+            replayed,
+            now - task_start,
+            now - sim_start,
+            "stopped" if cut_short else "done",
+        )
+    if cut_short:
+        return _error_result(
+            f"Delta run {cut_short} after replaying {replayed} of "
+            f"{len(missing)} changed pairings; those are stored, so running "
+            "it again carries on from there",
+            num_simulations,
+        )
+
+    names = {str(player.name) for player in game.players}
+    kept = [
+        records[key]
+        for key, (a, b) in zip(keys, pairs)
+        if str(a.name) in names and str(b.name) in names
+    ]
+    total_points, table = matrix_totals(kept)
+    return {
+        "total_points": total_points,
+        "num_simulations": num_simulations,
+        "table": table,
+        "requested_simulations": num_simulations,
+        "capped": False,
+        "stopped": False,
+        "delta": {"pairings": len(kept), "replayed": replayed},
+    }
+
+
+def _execute_simulation(
     league_id: int,
     game_name: str,
-    submissions: Optional[Dict[str, str]] = None,
-    num_simulations: int = 100,
-    custom_rewards: Optional[List[int]] = None,
-    player_feedback: bool = False,
+    submissions: Optional[Dict[str, str]],
+    num_simulations: int,
+    custom_rewards: Optional[List[int]],
+    player_feedback: bool,
+    budget_seconds: float,
+    progress_id: Optional[str] = None,
+    shard: int = 0,
+    shard_count: int = 1,
+    until_stable: bool = False,
+    confidence: float = DEFAULT_CONFIDENCE,
+    seed: Optional[int] = None,
+    submission_refs: Optional[Dict[str, str]] = None,
+    delta: bool = False,
+    record_placements: bool = False,
+    reward_schemes: Optional[List[List[float]]] = None,
 ) -> Dict[str, Any]:
-    """Run simulations and return {status, feedback, player_feedback, simulation_results}.
+    """Body shared by the whole-run task and each shard of a sharded run.
 
-    `submissions` is the {team_name: code} map fetched by the API before enqueue;
-    when empty the game's built-in validation players are used instead.
+    Returns {status, feedback, player_feedback, simulation_results}; the loop
+    stops launching games once `budget_seconds` (measured from entry) would be
+    crossed. With a `progress_id` it also publishes live progress (see
+    simulation_progress) and honours an admin stop request. With
+    `until_stable` it also stops once the ranking is separated at
+    `confidence` (see simulation_stats). A `seed` makes the engine's RNG
+    (BaseGame.seed_rng) reproducible; None draws a fresh one.
+    `submission_refs` ({team_name: digest}, see code_store) takes the place
+    of `submissions` when given. `delta` plays a pairwise game as a matrix of
+    stored pairings instead (see _execute_delta). `record_placements` has a
+    placement game report its placement histogram (see games.placements),
+    and `reward_schemes` adds the run's totals under each of those rewards.
+
+    Agents run under a per-decision budget (see decision_budget); one that
+    breaks it is dropped from the run, the game it broke is discarded and the
+    run continues without it. Its points from completed games stand, and
+    `disqualified` in the results says who and why. `num_simulations` counts
+    only the games in total_points; `discarded_games` counts the others.
     """
     # Anchor the 10-minute budget at task entry so the feedback game, player
     # loading and everything else count against it — not just the loop.
     task_start = time.perf_counter()
 
+    def fail(message: str) -> Dict[str, Any]:
+        # Every early return still ends this task's progress, or the admin
+        # stream (and a sharded run's merged state) would wait on it forever.
+        if progress_id:
+            ProgressReporter(
+                progress_id, shard, shard_count, num_simulations, budget_seconds
+            ).publish(0, time.perf_counter() - task_start, 0.0, "failed")
+        return _error_result(message, num_simulations)
+
     league = League(
         id=league_id,
         name="simulation_league",
@@ -127,20 +368,32 @@ def run_simulation(
     )
 
     game_class = GameFactory.get_game_class(game_name)
+    if delta and game_class.bot_baseline_stats is None:
+        return fail(f"Delta runs need a pairwise game, and {game_name} is not one")
     game = game_class(league)
+    if seed is not None:
+        game.seed_rng(seed)
+
+    if submission_refs is not None:
+        try:
+            submissions = load_code_blobs(submission_refs)
+        except CodeBlobMissingError as e:
+            return fail(str(e))
+    else:
+        submission_refs = {
+            team: code_digest(code) for team, code in (submissions or {}).items()
+        }
 
     _load_submitted_players(game, submissions)
 
     if not game.players:
-        return {
-            "status": "error",
-            "message": "No players loaded for simulation",
-            "simulation_results": {
-                "total_points": {},
-                "num_simulations": num_simulations,
-                "table": {},
-            },
-        }
+        return fail("No players loaded for simulation")
+
+    # Per-player decision latency, and the per-decision budget that pins a
+    # slow run on the agent responsible.
+    profiler = getattr(game, "profiler", None)
+    if profiler is not None:
+        enforce_decision_budget(profiler)
 
     feedback_result = {
         "feedback": "No feedback",
@@ -149,25 +402,48 @@ def run_simulation(
 
     if player_feedback:
         try:
-            feedback_result = game.run_single_game_with_feedback(custom_rewards)
+            feedback_result = _run_feedback_game(game, custom_rewards)
         except Exception as e:
             logger.error(f"Error running feedback game: {str(e)}")
-            return {
-                "status": "error",
-                "message": f"Error running feedback game: {str(e)}",
-                "simulation_results": {
-                    "total_points": {},
-                    "num_simulations": num_simulations,
-                    "table": {},
-                },
-            }
+            return fail(f"Error running feedback game: {str(e)}")
+
+    if delta:
+        try:
+            aggregated_results = _execute_delta(
+                game,
+                game_name,
+                submission_refs,
+                num_simulations,
+                custom_rewards,
+                budget_seconds,
+                task_start,
+                progress_id,
+            )
+        except SoftTimeLimitExceeded:
+            return fail(
+                "Delta run hit the soft time limit; the pairings it finished "
+                "are stored, so running it again carries on from there"
+            )
+        except Exception as e:
+            logger.error(f"Error running delta simulation: {str(e)}")
+            return fail(f"Error running simulations: {str(e)}")
+        if aggregated_results.get("status") == "error":
+            return aggregated_results
+        return _success_result(
+            game, aggregated_results, feedback_result, player_feedback
+        )
+
+    # Set after the feedback game, whose results are not aggregated.
+    game.record_placements = (
+        bool(record_placements or reward_schemes) and is_placement_game(game_class)
+    )
 
     # --- Time-bounded simulation loop -------------------------------------
     # A user can ask for up to 10000 runs; for a game whose single play_game
     # takes seconds that is hours of work. Instead of letting the request run
     # unbounded (only for Celery to kill it and return nothing), we run games
     # one at a time and stop launching new ones once the elapsed time plus the
-    # running-average cost of a game would cross SIMULATION_TIME_BUDGET_SECONDS.
+    # running-average cost of a game would cross the budget.
     #
     # The guard is checked BEFORE each game starts and never interrupts one in
     # progress, so every result in the batch is a whole game — the aggregate is
@@ -179,7 +455,23 @@ def run_simulation(
     simulation_results = []
     runs_attempted = 0
     budget_reached = False
+    stopped = False
+    stable = False
+    # Per-game points are only samples when play_game calls are independent;
+    # the table games report windowed deltas of one running tournament.
+    stats = RunningStats() if getattr(game, "independent_games", True) else None
+    z = z_for_confidence(confidence)
+    reporter = None
+    if progress_id:
+        reporter = ProgressReporter(
+            progress_id, shard, shard_count, requested_simulations, budget_seconds
+        )
+        reporter.publish(0, time.perf_counter() - task_start, 0.0, "running")
+    # Latency is profiled over the simulation games only (the verbose feedback
+    # game would inflate the engine's share).
     try:
+        if profiler is not None:
+            profiler.reset()
         sim_start = time.perf_counter()
 
         for _ in range(num_simulations):
@@ -190,21 +482,68 @@ def run_simulation(
             # over simulation games only; total_elapsed is the whole-task clock.
             if runs_attempted:
                 avg_per_game = (now - sim_start) / runs_attempted
-                if total_elapsed + avg_per_game >= SIMULATION_TIME_BUDGET_SECONDS:
+                if total_elapsed + avg_per_game >= budget_seconds:
                     budget_reached = True
                     logger.warning(
                         "Simulation budget (%ds) reached for league %s (%s): "
                         "ran %d of %d requested (avg %.3fs/game)",
-                        SIMULATION_TIME_BUDGET_SECONDS, league_id, game_name,
+                        budget_seconds, league_id, game_name,
                         runs_attempted, requested_simulations, avg_per_game,
                     )
                     break
 
             game.reset()
-            result = game.play_game(custom_rewards)
+            try:
+                result = game.play_game(custom_rewards)
+            except DecisionBudgetExceeded as e:
+                # The game it broke off is dropped like any partial game.
+                result = None
+                _disqualify(game, e)
+                if not getattr(game, "independent_games", True):
+                    # A table game restarts its tournament without the
+                    # player; the old tournament's deltas no longer add up.
+                    simulation_results.clear()
+                    if reporter is not None:
+                        reporter.total_points.clear()
             runs_attempted += 1
+            if not game.players:
+                break
             if result is not None:
                 simulation_results.append(result)
+                if stats is not None:
+                    stats.add(result["points"])
+
+            if (
+                until_stable
+                and stats is not None
+                and runs_attempted >= STABILITY_MIN_GAMES
+                and runs_attempted % STABILITY_CHECK_EVERY == 0
+                and stats.ranking_separated(z)
+            ):
+                stable = True
+                logger.info(
+                    "Ranking for league %s stable at %.0f%% after %d games",
+                    league_id, confidence * 100, runs_attempted,
+                )
+                break
+
+            if reporter is not None:
+                if result is not None:
+                    reporter.add_result(result)
+                if reporter.due(runs_attempted):
+                    now = time.perf_counter()
+                    reporter.publish(
+                        runs_attempted, now - task_start, now - sim_start, "running"
+                    )
+                    # Checked only at publish points: one EXISTS per second
+                    # (or per PROGRESS_EVERY_GAMES games), never per game.
+                    if reporter.stop_requested():
+                        stopped = True
+                        logger.info(
+                            "Simulation for league %s stopped by admin after %d games",
+                            league_id, runs_attempted,
+                        )
+                        break
     except SoftTimeLimitExceeded:
         # Backstop only: the budget above should have stopped us first. A game
         # in progress when this fires was never appended, so simulation_results
@@ -217,32 +556,310 @@ def run_simulation(
         )
     except Exception as e:
         logger.error(f"Error running simulations: {str(e)}")
-        return {
-            "status": "error",
-            "message": f"Error running simulations: {str(e)}",
-            "simulation_results": {
-                "total_points": {},
-                "num_simulations": requested_simulations,
-                "table": {},
-            },
-        }
+        if reporter is not None:
+            reporter.publish(runs_attempted, 0.0, 0.0, "failed")
+        return _error_result(
+            f"Error running simulations: {str(e)}", requested_simulations
+        )
 
+    if reporter is not None:
+        now = time.perf_counter()
+        reporter.publish(
+            runs_attempted,
+            now - task_start,
+            now - sim_start,
+            "stopped" if stopped else "done",
+        )
+
+    # Games discarded after a disqualification cost time but are not part of
+    # total_points, so they are reported apart from num_simulations.
     aggregated_results = aggregate_simulation_results(
-        simulation_results, runs_attempted
+        simulation_results, len(simulation_results)
     )
+    aggregated_results["discarded_games"] = runs_attempted - len(simulation_results)
     aggregated_results["requested_simulations"] = requested_simulations
     aggregated_results["capped"] = budget_reached
-    # Only validation players declare a strategy, so this is empty whenever
-    # real league submissions replaced them.
-    aggregated_results["strategies"] = game.get_player_strategies()
+    aggregated_results["stopped"] = stopped
+    if stats is not None:
+        aggregated_results["confidence"] = confidence
+        aggregated_results["confidence_intervals"] = stats.confidence_intervals(z)
+        aggregated_results["stable"] = stable or stats.ranking_separated(z)
+        # Raw accumulators, so a sharded run's merge step can combine them.
+        aggregated_results["stats"] = stats.state()
+    _add_rescored(game_class, aggregated_results, reward_schemes)
+    return _success_result(game, aggregated_results, feedback_result, player_feedback)
+
+
+@celery_app.task(
+    name="simulation.run",
+    # 10-minute ceiling. The task's own budget (SIMULATION_TIME_BUDGET_SECONDS)
+    # stops it cleanly before this fires; the soft limit is only a backstop for
+    # a single pathologically slow game, and even then SoftTimeLimitExceeded is
+    # caught below so completed simulations are still returned.
+    soft_time_limit=SIMULATION_SOFT_TIME_LIMIT,
+    time_limit=SIMULATION_HARD_TIME_LIMIT,
+)
+def run_simulation(
+    league_id: int,
+    game_name: str,
+    submissions: Optional[Dict[str, str]] = None,
+    num_simulations: int = 100,
+    custom_rewards: Optional[List[int]] = None,
+    player_feedback: bool = False,
+    progress_id: Optional[str] = None,
+    until_stable: bool = False,
+    confidence: float = DEFAULT_CONFIDENCE,
+    seed: Optional[int] = None,
+    submission_refs: Optional[Dict[str, str]] = None,
+    delta: bool = False,
+    record_placements: bool = False,
+    reward_schemes: Optional[List[List[float]]] = None,
+) -> Dict[str, Any]:
+    """Run simulations and return {status, feedback, player_feedback, simulation_results}.
+
+    `submissions` is the {team_name: code} map fetched by the API before enqueue;
+    when empty the game's built-in validation players are used instead. The
+    API enqueues `submission_refs` ({team_name: digest}, see code_store)
+    instead, so the message does not carry the source.
+    `progress_id` turns on live progress publishing under that id.
+    `until_stable` stops early once the ranking is settled at `confidence`;
+    num_simulations is then only the upper bound. `seed` replays a run
+    exactly (given agents that are deterministic for a seeded `random`).
+    `delta` replays only the pairings whose code changed (see pairing_cache).
+    `record_placements` and `reward_schemes` make a placement game's run
+    rescorable and rescore it (see _execute_simulation).
+    """
+    return _execute_simulation(
+        league_id,
+        game_name,
+        submissions,
+        num_simulations,
+        custom_rewards,
+        player_feedback,
+        SIMULATION_TIME_BUDGET_SECONDS,
+        progress_id=progress_id,
+        until_stable=until_stable,
+        confidence=confidence,
+        seed=seed,
+        submission_refs=submission_refs,
+        delta=delta,
+        record_placements=record_placements,
+        reward_schemes=reward_schemes,
+    )
+
 
+# --- Sharded runs -------------------------------------------------------------
+# A large run on a single worker child is bounded by one core. For games whose
+# play_game calls are independent (BaseGame.independent_games) the API can
+# instead split num_simulations across several shard tasks on the simulation
+# queue — each a separate forked child with its own RNG stream — and fold them
+# back together in a chord callback. Shards may run in parallel (more worker
+# concurrency or more simulation workers) or back to back on one slot, so each
+# shard's budget is also clipped to a run-wide wall-clock deadline fixed at
+# enqueue time: a sharded run never takes longer than an unsharded one.
+
+# Upper bound on shards per run; SimulationConfig validates against it.
+MAX_SIMULATION_SHARDS = 8
+
+
+def split_simulations(num_simulations: int, shards: int) -> List[int]:
+    """Split num_simulations into at most `shards` near-equal, non-empty parts."""
+    shards = max(1, min(shards, num_simulations))
+    base, extra = divmod(num_simulations, shards)
+    return [base + (1 if i < extra else 0) for i in range(shards)]
+
+
+@celery_app.task(
+    name="simulation.shard",
+    soft_time_limit=SIMULATION_SOFT_TIME_LIMIT,
+    time_limit=SIMULATION_HARD_TIME_LIMIT,
+)
+def run_simulation_shard(
+    league_id: int,
+    game_name: str,
+    submissions: Optional[Dict[str, str]] = None,
+    num_simulations: int = 100,
+    custom_rewards: Optional[List[int]] = None,
+    player_feedback: bool = False,
+    seed: Optional[int] = None,
+    deadline: Optional[float] = None,
+    progress_id: Optional[str] = None,
+    shard: int = 0,
+    shard_count: int = 1,
+    until_stable: bool = False,
+    confidence: float = DEFAULT_CONFIDENCE,
+    submission_refs: Optional[Dict[str, str]] = None,
+    record_placements: bool = False,
+) -> Dict[str, Any]:
+    """One slice of a sharded run; same result shape as run_simulation.
+
+    `seed` gives the shard its own RNG stream. `deadline` is the run-wide
+    wall-clock (epoch seconds) cut-off; the shard's budget is whichever of
+    it and SIMULATION_TIME_BUDGET_SECONDS comes first. The merge, not the
+    shard, rescores the recorded placements.
+    """
+    budget = SIMULATION_TIME_BUDGET_SECONDS
+    if deadline is not None:
+        budget = min(budget, max(0.0, deadline - time.time()))
+    return _execute_simulation(
+        league_id,
+        game_name,
+        submissions,
+        num_simulations,
+        custom_rewards,
+        player_feedback,
+        budget,
+        progress_id=progress_id,
+        shard=shard,
+        shard_count=shard_count,
+        until_stable=until_stable,
+        confidence=confidence,
+        seed=seed,
+        submission_refs=submission_refs,
+        record_placements=record_placements,
+    )
+
+
+@celery_app.task(name="simulation.merge")
+def merge_simulation_shards(
+    shard_results: List[Dict[str, Any]],
+    game_name: str,
+    reward_schemes: Optional[List[List[float]]] = None,
+) -> Dict[str, Any]:
+    """Chord callback: fold shard results into one run_simulation-shaped result.
+
+    Points are summed with aggregate_simulation_results; tables go through the
+    game's merge_tables, placement histograms are added up and rescored under
+    `reward_schemes`. Feedback comes from the first shard, the only one that
+    plays the feedback game. Any failed shard fails the whole run.
+    """
+    requested = sum(
+        r["simulation_results"].get(
+            "requested_simulations", r["simulation_results"]["num_simulations"]
+        )
+        for r in shard_results
+    )
+    for result in shard_results:
+        if result.get("status") == "error":
+            return _error_result(result.get("message", "Shard failed"), requested)
+
+    shard_sims = [r["simulation_results"] for r in shard_results]
+    merged = aggregate_simulation_results(
+        [{"points": s["total_points"]} for s in shard_sims],
+        sum(s["num_simulations"] for s in shard_sims),
+    )
+    game_class = GameFactory.get_game_class(game_name)
+    merged["table"] = game_class.merge_tables(
+        [s.get("table", {}) for s in shard_sims]
+    )
+    if any("placements" in s for s in shard_sims):
+        merged["placements"] = merge_placements(
+            s.get("placements", {}) for s in shard_sims
+        )
+        _add_rescored(game_class, merged, reward_schemes)
+    merged["discarded_games"] = sum(s.get("discarded_games", 0) for s in shard_sims)
+    merged["requested_simulations"] = requested
+    merged["capped"] = any(s.get("capped", False) for s in shard_sims)
+    merged["stopped"] = any(s.get("stopped", False) for s in shard_sims)
+    merged["strategies"] = shard_sims[0].get("strategies", {})
+    if all("stats" in s for s in shard_sims):
+        stats = RunningStats()
+        for s in shard_sims:
+            stats.merge(RunningStats(s["stats"]))
+        confidence = shard_sims[0]["confidence"]
+        z = z_for_confidence(confidence)
+        merged["confidence"] = confidence
+        merged["confidence_intervals"] = stats.confidence_intervals(z)
+        merged["stable"] = stats.ranking_separated(z)
+        merged["stats"] = stats.state()
+    if all("decision_profile_state" in s for s in shard_sims):
+        profiler = DecisionProfiler.merged(
+            s["decision_profile_state"] for s in shard_sims
+        )
+        merged["decision_profile"] = profiler.summary()
+        merged["decision_profile_state"] = profiler.state()
+    merged["disqualified"] = {
+        name: reason
+        for s in shard_sims
+        for name, reason in s.get("disqualified", {}).items()
+    }
+
+    first = shard_results[0]
     return {
         "status": "success",
-        "feedback": feedback_result["feedback"],
-        "player_feedback": (
-            feedback_result["player_feedback"]
-            if player_feedback
-            else "No player feedback"
-        ),
-        "simulation_results": aggregated_results,
+        "feedback": first.get("feedback", "No feedback"),
+        "player_feedback": first.get("player_feedback", "No player feedback"),
+        "simulation_results": merged,
     }
+
+
+def enqueue_sharded_simulation(
+    league_id: int,
+    game_name: str,
+    submissions: Optional[Dict[str, str]],
+    num_simulations: int,
+    custom_rewards: Optional[List[int]],
+    player_feedback: bool,
+    shards: int,
+    progress_id: Optional[str] = None,
+    until_stable: bool = False,
+    confidence: float = DEFAULT_CONFIDENCE,
+    seed: Optional[int] = None,
+    record_placements: bool = False,
+    reward_schemes: Optional[List[List[float]]] = None,
+) -> AsyncResult:
+    """Enqueue a run split into `shards` parts; returns the merge task's result.
+
+    Games whose play_game calls are not independent run unsharded (a plain
+    simulation.run), as does any run too small to split. The submissions are
+    put in the code store once and every task gets only their digests. With a
+    `seed` each shard gets a stream derived from it, so the same seed and
+    shard count replay the same run.
+    """
+    game_class = GameFactory.get_game_class(game_name)
+    parts = split_simulations(num_simulations, shards)
+    submission_refs = store_code_blobs(submissions or {})
+    if len(parts) == 1 or not game_class.independent_games:
+        return run_simulation.apply_async(
+            kwargs=dict(
+                league_id=league_id,
+                game_name=game_name,
+                submission_refs=submission_refs,
+                num_simulations=num_simulations,
+                custom_rewards=custom_rewards,
+                player_feedback=player_feedback,
+                progress_id=progress_id,
+                until_stable=until_stable,
+                confidence=confidence,
+                seed=seed,
+                record_placements=record_placements,
+                reward_schemes=reward_schemes,
+            )
+        )
+
+    deadline = time.time() + SIMULATION_TIME_BUDGET_SECONDS
+    header = group(
+        run_simulation_shard.s(
+            league_id=league_id,
+            game_name=game_name,
+            submission_refs=submission_refs,
+            num_simulations=count,
+            custom_rewards=custom_rewards,
+            # Only the first shard plays the (single) feedback game.
+            player_feedback=player_feedback and index == 0,
+            seed=None if seed is None else derive_seed(seed, "shard", index),
+            deadline=deadline,
+            progress_id=progress_id,
+            shard=index,
+            shard_count=len(parts),
+            # Each shard stops on its own evidence; the merge re-tests the
+            # pooled accumulators.
+            until_stable=until_stable,
+            confidence=confidence,
+            record_placements=bool(record_placements or reward_schemes),
+        )
+        for index, count in enumerate(parts)
+    )
+    return chord(header)(
+        merge_simulation_shards.s(game_name=game_name, reward_schemes=reward_schemes)
+    )
@@ -0,0 +1,90 @@
+"""Content-addressed cache of validation results, kept in valkey.
+
+Students resubmit byte-identical code all the time — a double click, a retry
+after a 429, switching back to an older version — and every one of those used
+to cost a full validation run on worker-validation (up to 6s of a slot). The
+API now looks the submission up here before enqueueing and only runs the
+validation on a miss.
+
+The key is sha256(code) plus everything else the result depends on: the game,
+the custom rewards, the team name (the run scores and reports the agent under
+it) and the engine version (games.engine_source) — a digest of the game's
+source files and the engine code they share, so a deploy that changes an
+engine, its player base class, its validation bots or a shared module never
+serves a result computed by the old code.
+
+Only successful runs are stored. A failure is the student's cue to change the
+code, and a timeout depends on how loaded the worker was, not on the code
+alone. Like simulation_progress, this talks to the broker's valkey with plain
+keys; every key carries a TTL, and a valkey error is logged and treated as a
+miss — the cache must never fail a submission.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from redis import Redis
+
+from backend.games.engine_source import engine_version
+from backend.tasks.celery_app import broker_url
+from backend.tasks.code_store import code_digest
+
+logger = logging.getLogger(__name__)
+
+# Long enough to cover a class session of resubmissions; the engine version in
+# the key, not the TTL, is what guards against stale results.
+VALIDATION_CACHE_TTL_SECONDS = 3600
+
+_redis: Redis | None = None
+
+
+def _get_redis() -> Redis:
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(broker_url)
+    return _redis
+
+
+def _cache_key(
+    code: str, game_name: str, team_name: str, custom_rewards: Optional[list]
+) -> str:
+    params = hashlib.sha256(
+        json.dumps([game_name, team_name, custom_rewards]).encode()
+    ).hexdigest()[:16]
+    return (
+        f"validation-cache:{engine_version(game_name)}:{params}:{code_digest(code)}"
+    )
+
+
+def get_cached_validation(
+    code: str, game_name: str, team_name: str, custom_rewards: Optional[list] = None
+) -> Optional[Dict[str, Any]]:
+    """The stored ValidationResponse for this exact submission, or None."""
+    try:
+        raw = _get_redis().get(_cache_key(code, game_name, team_name, custom_rewards))
+    except Exception as e:
+        logger.warning(f"Validation cache lookup failed: {e}")
+        return None
+    return json.loads(raw) if raw else None
+
+
+def store_validation(
+    code: str,
+    game_name: str,
+    team_name: str,
+    custom_rewards: Optional[list],
+    result: Dict[str, Any],
+) -> None:
+    """Remember a successful ValidationResponse; anything else is ignored."""
+    if result.get("status") != "success":
+        return
+    try:
+        _get_redis().set(
+            _cache_key(code, game_name, team_name, custom_rewards),
+            json.dumps(result),
+            ex=VALIDATION_CACHE_TTL_SECONDS,
+        )
+    except Exception as e:
+        logger.warning(f"Validation cache store failed: {e}")
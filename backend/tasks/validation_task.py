@@ -23,9 +23,11 @@ from celery.exceptions import SoftTimeLimitExceeded, TimeLimitExceeded
 
 from backend.database.db_models import League
 from backend.games.base_game import PlayerConstructionError
+from backend.games.decision_profile import DecisionBudgetExceeded
 from backend.games.game_factory import GameFactory
 from backend.tasks.celery_app import celery_app
 from backend.tasks.celery_utils import poll_task_result
+from backend.tasks.decision_budget import enforce as enforce_decision_budget
 from backend.time_utils import utc_now
 
 # Universal hard cap for agent validation (single game + simulations).
@@ -162,11 +164,26 @@ def run_validation(
             game_class = GameFactory.get_game_class(game_name)
             game_instance = game_class(test_league)
             game_instance.add_player(code, team_name)
+            profiler = getattr(game_instance, "profiler", None)
+            if profiler is not None:
+                # Fails a slow agent on its own decisions, with a traceback
+                # of where it was, well before the whole-task timeout.
+                enforce_decision_budget(profiler)
             t0 = time.perf_counter()
             feedback_result = game_instance.run_single_game_with_feedback(
                 custom_rewards
             )
             game_instance.reset()
+            # Profile the simulation games only, as simulation_task does: the
+            # verbose feedback game would inflate the engine's share.
+            if profiler is not None:
+                profiler.reset()
+            # Pairwise games stand a cached bot-vs-bot pass in for the bots'
+            # matches against each other (see bot_baseline), so only the
+            # submission's pairings are played. The cache is built with the
+            # default rewards, so custom ones always play everyone.
+            if not custom_rewards:
+                game_instance.use_bot_baseline([team_name])
             # Each game declares its own validation pass count, benchmarked
             # so the whole load stays under one second.
             simulation_results = game_instance.run_simulations(
@@ -175,6 +192,10 @@ def run_validation(
             simulation_results["strategies"] = (
                 game_instance.get_player_strategies()
             )
+            # Per-player decision latency and the engine's own share, so a
+            # student can see a slow agent long before it hits the timeout.
+            if profiler is not None:
+                simulation_results["decision_profile"] = profiler.summary()
             result = {
                 "status": "success",
                 "feedback": feedback_result.get("feedback"),
@@ -187,6 +208,17 @@ def run_validation(
             "message": f"Failed to create player for team {team_name}: {e}",
             "traceback": e.traceback_str,
         }
+    except DecisionBudgetExceeded as e:
+        if e.player_name == team_name:
+            # Same prefix as the task timeout, so hints classify it alike.
+            result = {
+                "status": "error",
+                "message": f"Your agent consumes too much time - {e.reason}.",
+                "traceback": tb.format_exc(),
+            }
+        else:
+            # A built-in bot overran, which says nothing about the submission.
+            result = {"status": "error", "message": f"Error during validation: {e}"}
     except SoftTimeLimitExceeded:
         # Only reached when nothing swallowed the exception. An agent with a
         # bare `except Exception` eats this too — those runs spin on until the
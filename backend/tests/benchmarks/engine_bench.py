@@ -0,0 +1,346 @@
+"""Engine benchmark harness: every game in config.GAMES against its own
+validation players.
+
+Per game it measures, in a fresh interpreter (so peak RSS is the game's own):
+
+- games_per_sec: play_game calls per second, the unit the league simulation
+  loop runs (a table game's call is a batch of tables);
+- decisions_per_sec: agent calls per second over those games;
+- engine_us_per_decision: wall time not spent inside agents, per decision —
+  building each decision's state, checking the move, bookkeeping. The
+  bots decide in microseconds, so this is where engine regressions show;
+- peak_rss_mb: the interpreter's peak resident set size;
+- the validation load (feedback game + run_simulations passes, exactly as
+  validation_task runs it) and the `validation_simulations` value that fits
+  VALIDATION_BUDGET_SECONDS;
+- the per-validation startup: building the game, which spawns its
+  validation bots (startup_ms), and spawning those bots from their
+  factories against deep-copying them (bot_spawn_us, bot_deepcopy_us).
+
+Throughput is compared against the committed baseline (engine_baseline.json)
+after normalising by a fixed pure-Python reference workload, so a slower or
+faster host does not read as a regression. Run it explicitly:
+
+    python -m backend.tests.benchmarks.engine_bench              # report
+    python -m backend.tests.benchmarks.engine_bench --update     # rewrite baseline
+    RUN_BENCHMARKS=1 pytest backend/tests/benchmarks             # gate
+
+BENCHMARK_SECONDS sets the measuring time per game (default 1.0) and
+BENCHMARK_REGRESSION_THRESHOLD the tolerated slowdown (default 0.3).
+"""
+
+import argparse
+import copy
+import importlib
+import json
+import math
+import os
+import resource
+import subprocess
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+BASELINE_PATH = Path(__file__).with_name("engine_baseline.json")
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+BENCHMARK_SECONDS = float(os.environ.get("BENCHMARK_SECONDS", "1.0"))
+REGRESSION_THRESHOLD = float(os.environ.get("BENCHMARK_REGRESSION_THRESHOLD", "0.3"))
+
+# What a whole validation load (feedback game + simulations) may take; see
+# BaseGame.validation_simulations.
+VALIDATION_BUDGET_SECONDS = 1.0
+
+# The seeded games of the first pass are replayed this many times in all,
+# from a fresh game with the same seed, and each game keeps its fastest
+# time: a shared host can switch speed several times a second, and the
+# per-game minimum is what every pass would have measured on a quiet one.
+MEASURE_REPEATS = 5
+
+# The first pass plays at least this many games, however long that takes:
+# hearts plays only a few per second, and one or two games measure their own
+# length more than the engine's speed.
+MIN_GAMES = 3
+
+# Best-of repeats for the startup timings, which take microseconds each.
+STARTUP_REPEATS = 50
+
+# Fixed seed: every run plays the same deals, rolls and pairings.
+BENCHMARK_SEED = 0
+
+
+REFERENCE_ITERATIONS = 5_000
+
+
+def _reference_chunk() -> None:
+    """A fixed dict/list workload of REFERENCE_ITERATIONS iterations."""
+    table: Dict[int, List[int]] = {}
+    for i in range(REFERENCE_ITERATIONS):
+        table.setdefault(i % 97, []).append(i)
+        if len(table[i % 97]) > 8:
+            table[i % 97] = table[i % 97][-4:]
+
+
+def _new_game(game_name: str):
+    from backend.database.db_models import League
+    from backend.games.game_factory import GameFactory
+    from backend.time_utils import utc_now
+
+    league = League(
+        name="benchmark_league",
+        created_date=utc_now(),
+        expiry_date=utc_now() + timedelta(days=1),
+        game=game_name,
+    )
+    game_class = GameFactory.get_game_class(game_name)
+    game = game_class(league)
+    game.seed_rng(BENCHMARK_SEED)
+    return game_class, league, game
+
+
+def _measure_simulations(game_name: str, seconds: float) -> Dict[str, Any]:
+    """The league loop (reset + play_game): the first pass plays for
+    `seconds / MEASURE_REPEATS` (at least MIN_GAMES games), the other passes
+    replay the same seeded games, and every game counts at its fastest pass,
+    like timeit's best-of. A reference chunk runs after every game and is
+    kept the same way, so the reference_score the throughput is divided by
+    saw the same host speeds as the games did."""
+    game_times: Optional[List[float]] = None
+    reference_times: Optional[List[float]] = None
+    fastest_pass = math.inf
+    for _ in range(MEASURE_REPEATS):
+        _, _, game = _new_game(game_name)
+        game.profiler.reset()
+        times: List[float] = []
+        references: List[float] = []
+        start = time.perf_counter()
+
+        def more() -> bool:
+            if game_times is not None:
+                return len(times) < len(game_times)
+            return (
+                len(times) < MIN_GAMES
+                or time.perf_counter() - start < seconds / MEASURE_REPEATS
+            )
+
+        while more():
+            game.reset()
+            game_start = time.perf_counter()
+            if game.play_game() is None:
+                break  # a table game's tournament is complete
+            times.append(time.perf_counter() - game_start)
+            reference_start = time.perf_counter()
+            _reference_chunk()
+            references.append(time.perf_counter() - reference_start)
+        if game_times is None:
+            game_times, reference_times = times, references
+        else:
+            game_times = [min(a, b) for a, b in zip(game_times, times)]
+            reference_times = [min(a, b) for a, b in zip(reference_times, references)]
+        if sum(times) < fastest_pass:
+            fastest_pass = sum(times)
+            profile = game.profiler.summary()
+    # Every pass replays the same seeded games, so the fastest pass made the
+    # decisions of all of them.
+    decisions = sum(p["count"] for p in profile["players"].values())
+    elapsed = sum(game_times)
+    return {
+        "players": len(game.players),
+        "games": len(game_times),
+        "reference_score": REFERENCE_ITERATIONS * len(reference_times) / sum(reference_times),
+        "games_per_sec": round(len(game_times) / elapsed, 2),
+        "decisions_per_sec": round(decisions / elapsed),
+        "engine_us_per_decision": (
+            round(profile["engine_ms"] * 1000 / decisions, 3) if decisions else None
+        ),
+    }
+
+
+def _measure_validation(game_name: str) -> Dict[str, Any]:
+    """Time validation_task's load, and the pass count that fits the budget."""
+    game_class, league, game = _new_game(game_name)
+    start = time.perf_counter()
+    game.run_single_game_with_feedback()
+    feedback_s = time.perf_counter() - start
+
+    configured = game_class.validation_simulations
+    game.reset()
+    start = time.perf_counter()
+    game.run_simulations(configured, league)
+    passes_s = time.perf_counter() - start
+    per_pass_s = passes_s / configured
+
+    suggested = max(1, int((VALIDATION_BUDGET_SECONDS - feedback_s) / per_pass_s))
+    return {
+        "feedback_ms": round(feedback_s * 1000, 2),
+        "validation_pass_ms": round(per_pass_s * 1000, 3),
+        "validation_ms": round((feedback_s + passes_s) * 1000, 1),
+        "validation_simulations": configured,
+        "suggested_validation_simulations": suggested,
+    }
+
+
+def _best_of(repeats: int, fn) -> float:
+    best = math.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _measure_startup(game_name: str, repeats: int = STARTUP_REPEATS) -> Dict[str, Any]:
+    """What every validation pays before its first game: constructing the
+    game, and within that spawning the validation bots — compared with the
+    deep copy of module-level instances it replaces."""
+    from backend.games.base_game import spawn_validation_players
+
+    game_class, league, _ = _new_game(game_name)
+    module = importlib.import_module(f"backend.games.{game_name}.validation_players")
+    bots = spawn_validation_players(module)
+    return {
+        "startup_ms": round(_best_of(repeats, lambda: game_class(league)) * 1000, 3),
+        "bot_spawn_us": round(
+            _best_of(repeats, lambda: spawn_validation_players(module)) * 1e6, 1
+        ),
+        "bot_deepcopy_us": round(
+            _best_of(repeats, lambda: copy.deepcopy(bots)) * 1e6, 1
+        ),
+    }
+
+
+def measure_game(game_name: str, seconds: float = BENCHMARK_SECONDS) -> Dict[str, Any]:
+    """All metrics for one game, measured in this process."""
+    result = {"game": game_name}
+    result.update(_measure_simulations(game_name, seconds))
+    result.update(_measure_validation(game_name))
+    result.update(_measure_startup(game_name))
+    result["reference_score"] = round(result["reference_score"])
+    result["peak_rss_mb"] = round(_peak_rss_kib() / 1024, 1)
+    return result
+
+
+def _peak_rss_kib() -> int:
+    """This interpreter's peak RSS. Linux carries ru_maxrss over fork and
+    exec, so a child of a big process (pytest) would report its parent's;
+    VmHWM belongs to the current address space only."""
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def run_all(
+    games: Optional[List[str]] = None, seconds: float = BENCHMARK_SECONDS
+) -> Dict[str, Any]:
+    """Measure every game, each in its own interpreter."""
+    from backend.config import GAMES
+
+    results = {}
+    for game_name in games or GAMES:
+        proc = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "backend.tests.benchmarks.engine_bench",
+                "--game",
+                game_name,
+                "--seconds",
+                str(seconds),
+            ],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        results[game_name] = json.loads(proc.stdout.strip().splitlines()[-1])
+    return {"games": results}
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = REGRESSION_THRESHOLD,
+) -> List[str]:
+    """Regressions of `current` against `baseline`, one message each.
+
+    Throughput is compared per unit of the game's reference_score; peak RSS
+    as is. Games missing from the baseline are not compared.
+    """
+    regressions = []
+    for name, now in current["games"].items():
+        then = baseline["games"].get(name)
+        if then is None:
+            continue
+        speed = now["reference_score"] / then["reference_score"]
+        for key in ("games_per_sec", "decisions_per_sec"):
+            expected = then[key] * speed
+            if now[key] < expected * (1 - threshold):
+                regressions.append(
+                    f"{name}: {key} {now[key]} is {1 - now[key] / expected:.0%} "
+                    f"below the baseline's {expected:.1f} (host-adjusted)"
+                )
+        if now["peak_rss_mb"] > then["peak_rss_mb"] * (1 + threshold):
+            regressions.append(
+                f"{name}: peak_rss_mb {now['peak_rss_mb']} is over the "
+                f"baseline's {then['peak_rss_mb']} by more than {threshold:.0%}"
+            )
+    return regressions
+
+
+def format_report(current: Dict[str, Any]) -> str:
+    header = (
+        f"{'game':<18}{'ref/s':>10}{'players':>8}{'games/s':>10}{'decisions/s':>13}"
+        f"{'engine us/dec':>15}{'rss MB':>8}{'valid. ms':>11}"
+        f"{'valid. sims':>13}{'suggested':>11}{'startup ms':>12}"
+        f"{'spawn us':>10}{'deepcopy us':>13}"
+    )
+    lines = [header]
+    for name, r in current["games"].items():
+        lines.append(
+            f"{name:<18}{r['reference_score']:>10}{r['players']:>8}{r['games_per_sec']:>10}"
+            f"{r['decisions_per_sec']:>13}{r['engine_us_per_decision']:>15}"
+            f"{r['peak_rss_mb']:>8}{r['validation_ms']:>11}"
+            f"{r['validation_simulations']:>13}"
+            f"{r['suggested_validation_simulations']:>11}"
+            f"{r.get('startup_ms', '-'):>12}{r.get('bot_spawn_us', '-'):>10}"
+            f"{r.get('bot_deepcopy_us', '-'):>13}"
+        )
+    return "\n".join(lines)
+
+
+def load_baseline() -> Dict[str, Any]:
+    return json.loads(BASELINE_PATH.read_text())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--game", help="measure one game in this process, print JSON")
+    parser.add_argument("--seconds", type=float, default=BENCHMARK_SECONDS)
+    parser.add_argument("--update", action="store_true", help="rewrite the baseline")
+    args = parser.parse_args(argv)
+
+    if args.game:
+        print(json.dumps(measure_game(args.game, args.seconds)))
+        return 0
+
+    current = run_all(seconds=args.seconds)
+    print(format_report(current))
+    if args.update:
+        BASELINE_PATH.write_text(json.dumps(current, indent=2, sort_keys=True) + "\n")
+        print(f"baseline written to {BASELINE_PATH}")
+        return 0
+    regressions = compare(current, load_baseline())
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+"""Player-count scaling harness: how one simulation's cost grows with the
+size of the league.
+
+Every game in config.GAMES is played with PLAYER_COUNTS synthetic players —
+copies of its validation bots under fresh names — each game in a fresh
+interpreter. Per player count it measures:
+
+- ms_per_simulation: one play_game call (for a table game, a batch of
+  tables);
+- peak_kib: peak traced memory (tracemalloc) over the first play_game call
+  of a fresh run, so it includes the per-run state the engine builds.
+
+A least-squares fit of log(cost) against log(players) gives the observed
+exponent k of O(N^k) for each, which must stay within SCALING_TOLERANCE of
+its declared ``player_scaling``. Run it explicitly:
+
+    python -m backend.tests.benchmarks.scaling_bench             # report
+    python -m backend.tests.benchmarks.scaling_bench --game hearts
+    RUN_BENCHMARKS=1 pytest backend/tests/benchmarks             # gate
+
+SCALING_SECONDS sets the measuring time per player count (default 0.5; one
+simulation is always played), SCALING_PLAYER_COUNTS the counts ("4,8,16").
+Every game is seeded with engine_bench's BENCHMARK_SEED, and each count is
+timed SCALING_REPEATS times over the same seeded games, keeping the fastest
+like engine_bench, so neither the mix of games nor a slow spell on the host
+moves the fit.
+Once a simulation takes longer than SCALING_MAX_SECONDS the larger counts
+are skipped, and so is tracemalloc (several times slower) at that count.
+"""
+
+import argparse
+import copy
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Sequence
+
+from backend.tests.benchmarks.engine_bench import (
+    BENCHMARK_SEED,
+    PROJECT_ROOT,
+    _new_game,
+)
+
+PLAYER_COUNTS = tuple(
+    int(n) for n in os.environ.get("SCALING_PLAYER_COUNTS", "4,8,16,32,64").split(",")
+)
+SCALING_SECONDS = float(os.environ.get("SCALING_SECONDS", "0.5"))
+SCALING_MAX_SECONDS = float(os.environ.get("SCALING_MAX_SECONDS", "5.0"))
+SCALING_REPEATS = int(os.environ.get("SCALING_REPEATS", "3"))
+
+# Slack on the declared exponent. Small leagues are flattened by fixed
+# per-simulation overhead, and the mix of bot matchups (and so the length of
+# the games) shifts with the player count.
+SCALING_TOLERANCE = float(os.environ.get("SCALING_TOLERANCE", "0.5"))
+
+
+def synthetic_players(bots: Sequence[Any], count: int) -> List[Any]:
+    """`count` players cycling through `bots`, each a fresh copy with a
+    unique name."""
+    players = []
+    for i in range(count):
+        bot = bots[i % len(bots)]
+        player = copy.deepcopy(bot)
+        player.name = f"{bot.name}_{i}"
+        players.append(player)
+    return players
+
+
+def fit_exponent(points: Sequence[tuple]) -> Optional[float]:
+    """Least-squares slope of log(cost) over log(players): the k of O(N^k).
+
+    `points` are (players, cost) pairs; None with fewer than two."""
+    points = [(math.log(n), math.log(cost)) for n, cost in points if cost > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if not spread:
+        return None
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+    return round(slope, 2)
+
+
+def _new_league_game(game_name: str, count: int):
+    _, _, game = _new_game(game_name)
+    game.players = synthetic_players(game.players, count)
+    if not game.independent_games:
+        # Measure the table scheduler big leagues run on at every size; the
+        # exhaustive mode of small leagues plays all C(N, 4) tables per call.
+        game.EXHAUSTIVE_MAX_PLAYERS = 0
+    # Reseeded once the league is in place, so every fresh run of a count
+    # plays the same games.
+    game.seed_rng(BENCHMARK_SEED)
+    game.reset()
+    return game
+
+
+def _time_simulations(
+    game_name: str, count: int, seconds: float, calls: Optional[int] = None
+) -> tuple:
+    """(seconds per simulation, play_game calls made) with `count` players,
+    over exactly `calls` play_game calls, or when None over at least one and
+    `seconds` of them."""
+    game = _new_league_game(game_name, count)
+    made = 0
+    start = time.perf_counter()
+    while (
+        made < calls
+        if calls is not None
+        else not made or time.perf_counter() - start < seconds
+    ):
+        game.reset()
+        if game.play_game() is None:
+            break  # a table game's tournament is complete
+        made += 1
+    return (time.perf_counter() - start) / made, made
+
+
+def _peak_memory(game_name: str, count: int) -> int:
+    """Peak bytes allocated over the first simulation of a fresh run."""
+    game = _new_league_game(game_name, count)
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        game.play_game()
+        return tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+
+def measure_game(
+    game_name: str,
+    counts: Sequence[int] = PLAYER_COUNTS,
+    seconds: float = SCALING_SECONDS,
+) -> Dict[str, Any]:
+    """Cost per simulation at each player count, and the fitted exponents."""
+    # Warm-up: first-call imports and caches would otherwise be charged to
+    # the smallest league.
+    _time_simulations(game_name, min(counts), 0)
+
+    sizes = []
+    for count in sorted(counts):
+        per_simulation, calls = _time_simulations(game_name, count, seconds)
+        if per_simulation <= SCALING_MAX_SECONDS:
+            # The repeats replay the same seeded games as the first timing.
+            timings = [per_simulation] + [
+                _time_simulations(game_name, count, seconds, calls)[0]
+                for _ in range(SCALING_REPEATS - 1)
+            ]
+            per_simulation = min(timings)
+        size = {"players": count, "ms_per_simulation": round(per_simulation * 1000, 4)}
+        if per_simulation <= SCALING_MAX_SECONDS:
+            size["peak_kib"] = round(_peak_memory(game_name, count) / 1024, 1)
+        sizes.append(size)
+        if per_simulation > SCALING_MAX_SECONDS:
+            break
+
+    from backend.games.game_factory import GameFactory
+
+    return {
+        "game": game_name,
+        "sizes": sizes,
+        "time_exponent": fit_exponent(
+            [(s["players"], s["ms_per_simulation"]) for s in sizes]
+        ),
+        "memory_exponent": fit_exponent(
+            [(s["players"], s["peak_kib"]) for s in sizes if "peak_kib" in s]
+        ),
+        "declared": dict(GameFactory.get_game_class(game_name).player_scaling),
+    }
+
+
+def run_all(
+    games: Optional[List[str]] = None,
+    counts: Sequence[int] = PLAYER_COUNTS,
+    seconds: float = SCALING_SECONDS,
+) -> Dict[str, Any]:
+    """Measure every game, each in its own interpreter."""
+    from backend.config import GAMES
+
+    results = {}
+    for game_name in games or GAMES:
+        proc = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "backend.tests.benchmarks.scaling_bench",
+                "--game",
+                game_name,
+                "--counts",
+                ",".join(str(n) for n in counts),
+                "--seconds",
+                str(seconds),
+            ],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        results[game_name] = json.loads(proc.stdout.strip().splitlines()[-1])
+    return {"games": results}
+
+
+def check_bounds(
+    current: Dict[str, Any], tolerance: float = SCALING_TOLERANCE
+) -> List[str]:
+    """Games whose observed exponent exceeds the declared one by more than
+    `tolerance`, one message each."""
+    violations = []
+    for name, result in current["games"].items():
+        for metric in ("time", "memory"):
+            observed = result[f"{metric}_exponent"]
+            declared = result["declared"][metric]
+            if observed is not None and observed > declared + tolerance:
+                violations.append(
+                    f"{name}: {metric} grows as O(N^{observed}), over its "
+                    f"declared O(N^{declared}) (tolerance {tolerance})"
+                )
+    return violations
+
+
+def format_report(current: Dict[str, Any]) -> str:
+    counts = sorted(
+        {s["players"] for r in current["games"].values() for s in r["sizes"]}
+    )
+    header = f"{'game':<18}{'':<8}" + "".join(f"{f'N={n}':>11}" for n in counts)
+    header += f"{'k':>7}{'bound':>7}"
+    lines = [header]
+    for name, result in current["games"].items():
+        by_count = {s["players"]: s for s in result["sizes"]}
+        for metric, key, label in (
+            ("time", "ms_per_simulation", "ms"),
+            ("memory", "peak_kib", "KiB"),
+        ):
+            cells = "".join(
+                f"{by_count[n][key] if key in by_count.get(n, {}) else '-':>11}"
+                for n in counts
+            )
+            observed = result[f"{metric}_exponent"]
+            lines.append(
+                f"{name if metric == 'time' else '':<18}{label:<8}{cells}"
+                f"{observed if observed is not None else '-':>7}"
+                f"{result['declared'][metric]:>7}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--game", help="measure one game in this process, print JSON")
+    parser.add_argument(
+        "--counts",
+        type=lambda value: [int(n) for n in value.split(",")],
+        default=list(PLAYER_COUNTS),
+    )
+    parser.add_argument("--seconds", type=float, default=SCALING_SECONDS)
+    args = parser.parse_args(argv)
+
+    if args.game:
+        print(json.dumps(measure_game(args.game, args.counts, args.seconds)))
+        return 0
+
+    current = run_all(counts=args.counts, seconds=args.seconds)
+    print(format_report(current))
+    violations = check_bounds(current)
+    for message in violations:
+        print(f"OVER BOUND {message}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Engine benchmarks (see engine_bench).
+
+The harness itself is smoke-tested on every run; the full benchmark against
+the committed baseline takes about 30s and runs only with RUN_BENCHMARKS=1:
+
+    RUN_BENCHMARKS=1 pytest backend/tests/benchmarks -s
+"""
+
+import copy
+import os
+
+import pytest
+
+from backend.config import GAMES
+from backend.tests.benchmarks import engine_bench
+
+
+def test_measure_game_reports_every_metric():
+    result = engine_bench.measure_game("greedy_pig", seconds=0.05)
+    assert result["games"] > 0
+    assert result["decisions_per_sec"] > 0
+    assert result["engine_us_per_decision"] > 0
+    assert result["peak_rss_mb"] > 0
+    assert result["suggested_validation_simulations"] >= 1
+    assert result["startup_ms"] > 0
+    assert 0 < result["bot_spawn_us"] < result["bot_deepcopy_us"]
+
+
+def test_baseline_covers_every_game():
+    assert set(engine_bench.load_baseline()["games"]) == set(GAMES)
+
+
+def test_compare_is_host_adjusted():
+    baseline = engine_bench.load_baseline()
+    # Same engine on a host twice as slow: not a regression.
+    slower_host = copy.deepcopy(baseline)
+    for metrics in slower_host["games"].values():
+        metrics["reference_score"] /= 2
+        metrics["games_per_sec"] /= 2
+        metrics["decisions_per_sec"] /= 2
+    assert engine_bench.compare(slower_host, baseline) == []
+
+    # Half the throughput on the same host is.
+    regressed = copy.deepcopy(baseline)
+    regressed["games"]["greedy_pig"]["games_per_sec"] /= 2
+    (message,) = engine_bench.compare(regressed, baseline)
+    assert message.startswith("greedy_pig: games_per_sec")
+
+
+@pytest.mark.skipif(
+    not os.environ.get("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run"
+)
+def test_engines_match_baseline():
+    current = engine_bench.run_all()
+    print()
+    print(engine_bench.format_report(current))
+    assert engine_bench.compare(current, engine_bench.load_baseline()) == []
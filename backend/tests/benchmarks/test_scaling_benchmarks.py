@@ -0,0 +1,74 @@
+"""Player-count scaling benchmarks (see scaling_bench).
+
+The harness itself is smoke-tested on every run; the full sweep over
+4..64 players takes about a minute and runs only with RUN_BENCHMARKS=1:
+
+    RUN_BENCHMARKS=1 pytest backend/tests/benchmarks -s
+"""
+
+import os
+
+import pytest
+
+from backend.tests.benchmarks import scaling_bench
+
+
+def test_fit_exponent_recovers_the_power():
+    assert scaling_bench.fit_exponent([(n, 3 * n**2) for n in (4, 8, 16)]) == 2.0
+    assert scaling_bench.fit_exponent([(n, 5.0) for n in (4, 8, 16)]) == 0.0
+    assert scaling_bench.fit_exponent([(4, 1.0)]) is None
+
+
+def test_synthetic_players_are_distinct_copies():
+    class Bot:
+        def __init__(self, name):
+            self.name = name
+
+    bots = [Bot("a"), Bot("b")]
+    players = scaling_bench.synthetic_players(bots, 5)
+    assert [p.name for p in players] == ["a_0", "b_1", "a_2", "b_3", "a_4"]
+    assert not {id(p) for p in players} & {id(b) for b in bots}
+
+
+def test_every_timing_replays_the_same_seeded_games():
+    runs = []
+    for _ in range(2):
+        game = scaling_bench._new_league_game("breakthrough", 4)
+        runs.append([game.play_game()["points"] for _ in range(3)])
+    assert runs[0] == runs[1]
+    assert scaling_bench._time_simulations("breakthrough", 4, 0, calls=3)[1] == 3
+
+
+@pytest.mark.parametrize("game_name", ["greedy_pig", "hearts"])
+def test_measure_game_fits_both_exponents(game_name):
+    result = scaling_bench.measure_game(game_name, counts=(4, 8), seconds=0)
+    assert [s["players"] for s in result["sizes"]] == [4, 8]
+    assert all(s["ms_per_simulation"] > 0 for s in result["sizes"])
+    assert all(s["peak_kib"] > 0 for s in result["sizes"])
+    assert result["time_exponent"] is not None
+    assert result["memory_exponent"] is not None
+    assert set(result["declared"]) == {"time", "memory"}
+
+
+def test_check_bounds_flags_exponents_over_the_declared_bound():
+    result = {
+        "sizes": [],
+        "time_exponent": 2.9,
+        "memory_exponent": 1.2,
+        "declared": {"time": 2, "memory": 1},
+    }
+    assert scaling_bench.check_bounds({"games": {"pd": result}}, tolerance=0.5) == [
+        "pd: time grows as O(N^2.9), over its declared O(N^2) (tolerance 0.5)"
+    ]
+    result["time_exponent"] = 2.4
+    assert scaling_bench.check_bounds({"games": {"pd": result}}, tolerance=0.5) == []
+
+
+@pytest.mark.skipif(
+    not os.environ.get("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run"
+)
+def test_games_scale_within_their_declared_bounds():
+    current = scaling_bench.run_all()
+    print()
+    print(scaling_bench.format_report(current))
+    assert scaling_bench.check_bounds(current) == []
@@ -79,6 +79,7 @@ def celery_workers():
 _ENUM_TYPES = (
     "teamtype",
     "leaguetype",
+    "simulationjobstatus",
 )
 
 
@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import MagicMock
 
 from backend.games.arena_champions.arena_champions import ArenaChampionsGame, BattleResult
+from backend.games.decision_profile import DecisionProfiler
 
 
 class MockLeague:
@@ -67,6 +68,8 @@ def game():
     g.game_feedback = {"game": "arena_champions", "battles": []}
     g.player_feedback = {}
     g.battle_history = {}
+    g.seed_rng()
+    g.profiler = DecisionProfiler()
     return g
 
 
@@ -127,8 +130,7 @@ def test_validate_player_attributes_sum_exceeds(game, two_players):
 def test_calculate_damage_dodge_miss(game, two_players):
     """Test dodge that fails — damage is applied with penalty."""
     p1, p2 = two_players
-    import random
-    random.seed(0)  # Seed to get consistent dodge fail
+    game.seed_rng(0)  # Seed to get consistent dodge fail
     damage, msg = game.calculate_damage(p1, p2, "attack", "dodge")
     # Either dodged or dodge failed — both are valid
     assert damage >= 0
@@ -179,6 +181,7 @@ def test_calculate_damage_no_valid_defense(game, two_players):
 
 def test_execute_combat(game, two_players):
     p1, p2 = two_players
+    game.verbose = True
     winner, result = game.execute_combat(p1, p2)
     assert winner in ["Fighter1", "Fighter2"]
     assert result.winner == winner
@@ -186,6 +189,21 @@ def test_execute_combat(game, two_players):
     assert result.final_health is not None
 
 
+def test_execute_combat_records_no_turns_when_not_verbose(game, two_players):
+    p1, p2 = two_players
+    p1.add_feedback("thinking")
+    game.seed_rng(5)
+    winner, result = game.execute_combat(p1, p2)
+    assert result.turns == []
+    assert p1.feedback == []
+
+    game.verbose = True
+    game.seed_rng(5)
+    verbose_winner, verbose_result = game.execute_combat(p1, p2)
+    assert verbose_winner == winner
+    assert verbose_result.final_health == result.final_health
+
+
 def test_get_player_action_invalid_action(game, two_players):
     """Player returning wrong action for role aborts the battle."""
     p1, p2 = two_players
@@ -246,6 +264,12 @@ def test_reset(game, two_players):
     assert game.game_feedback == {"game": "arena_champions", "battles": []}
 
 
+def test_play_game_builds_no_battle_feedback_when_not_verbose(game, two_players):
+    game.initialize_characters()
+    game.play_game()
+    assert game.game_feedback == {"game": "arena_champions", "battles": []}
+
+
 def test_run_single_game_with_feedback(game, two_players):
     game.initialize_characters()
     result = game.run_single_game_with_feedback()
@@ -1,14 +1,30 @@
 """Tests covering uncovered paths in base_game.py:
 - add_feedback with dict/string game_feedback
+- the feedback recorder in verbose and non-verbose games
 - add_player with valid/invalid code
 - reset with dict/string game_feedback
 - load_validation_players error paths
+- spawn_validation_players factories and the legacy players list
+- the read-only views engines hand agents
 """
 
+import copy
+import pickle
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
 import pytest
-from backend.games.base_game import BaseGame, PlayerConstructionError
+from backend.config import GAMES
+from backend.games.base_game import (
+    NULL_RECORDER,
+    AppendOnlyView,
+    BaseGame,
+    PlayerConstructionError,
+    ReadOnlyMapping,
+    plain_data,
+    spawn_validation_players,
+)
+from backend.games.game_factory import GameFactory
 
 
 class MockLeague:
@@ -64,6 +80,27 @@ def test_add_feedback_not_verbose(game):
     assert game.game_feedback == []
 
 
+def test_recorder_appends_events_while_verbose(game):
+    game.verbose = True
+    game.game_feedback = {"matches": []}
+    recorder = game.recorder
+    assert recorder
+    recorder.record("matches", {"winner": "a"})
+    recorder.record_with("matches", lambda name: {"winner": name}, "b")
+    assert game.game_feedback["matches"] == [{"winner": "a"}, {"winner": "b"}]
+
+
+def test_recorder_is_a_falsy_no_op_when_not_verbose(game):
+    game.game_feedback = {"matches": []}
+    build = MagicMock()
+    assert game.recorder is NULL_RECORDER
+    assert not game.recorder
+    game.recorder.record("matches", "ignored")
+    game.recorder.record_with("matches", build, 1)
+    build.assert_not_called()
+    assert game.game_feedback == {"matches": []}
+
+
 def test_add_player_valid_code():
     """Use PrisonersDilemmaGame so add_player can resolve the player module."""
     from backend.games.prisoners_dilemma.prisoners_dilemma import PrisonersDilemmaGame
@@ -153,12 +190,42 @@ def test_run_single_game_with_feedback(game):
     # Mock play_game since BaseGame doesn't implement it
     game.play_game = lambda custom_rewards=None: {"points": {}, "table": {}}
     result = game.run_single_game_with_feedback()
-    assert game.verbose is True
+    assert game.verbose is False
     assert "results" in result
     assert "feedback" in result
     assert "player_feedback" in result
 
 
+def test_feedback_game_is_verbose_only_while_it_plays(game):
+    seen = []
+    game.play_game = lambda custom_rewards=None: seen.append(game.verbose) or {}
+    game.run_single_game_with_feedback()
+    assert seen == [True]
+
+    def crash(custom_rewards=None):
+        raise RuntimeError("agent crashed")
+
+    game.play_game = crash
+    with pytest.raises(RuntimeError):
+        game.run_single_game_with_feedback()
+    assert game.verbose is False
+
+
+@pytest.mark.parametrize("game_name", GAMES)
+def test_games_after_the_feedback_game_record_nothing(game_name):
+    """Validation and simulations play the feedback game first, then
+    thousands of games that must not build feedback."""
+    game = GameFactory.get_game_class(game_name)(None)
+    game.seed_rng(0)
+    game.run_single_game_with_feedback()
+    game.reset()
+    game.play_game()
+    assert game.recorder is NULL_RECORDER
+    assert not any(
+        section for section in game.game_feedback.values() if isinstance(section, list)
+    )
+
+
 def test_load_validation_players_no_players_list():
     """When validation_players module has no 'players' attribute."""
     with patch("importlib.import_module") as mock_import:
@@ -182,3 +249,77 @@ def test_load_validation_players_import_error():
         game.load_validation_players()
         assert game.players == []
         assert game.scores == {}
+
+
+def test_seed_rng_is_reproducible(game):
+    game.seed_rng(42)
+    first = [game._rng.random() for _ in range(5)]
+    game.seed_rng(42)
+    assert [game._rng.random() for _ in range(5)] == first
+
+
+def test_engine_rng_ignores_module_random(game):
+    """Agents reseeding the shared `random` module cannot steer the engine."""
+    import random
+
+    game.seed_rng(7)
+    expected = game._rng.random()
+    game.seed_rng(7)
+    random.seed(0)
+    assert game._rng.random() == expected
+
+
+def test_spawn_rng_streams_are_independent(game):
+    game.seed_rng(42)
+    a = game.spawn_rng("deal", 0).random()
+    assert game.spawn_rng("deal", 0).random() == a
+    assert game.spawn_rng("deal", 1).random() != a
+
+
+class _Bot:
+    def __init__(self, name="bot", level=1):
+        self.name = name
+        self.level = level
+        self.seen = []
+
+
+def test_spawn_validation_players_builds_fresh_bots_from_factories():
+    module = SimpleNamespace(
+        player_factories=[_Bot, (_Bot, ("b",)), (_Bot, ("c",), {"level": 3})]
+    )
+    first = spawn_validation_players(module)
+    assert [(p.name, p.level) for p in first] == [("bot", 1), ("b", 1), ("c", 3)]
+    first[0].seen.append("x")
+    assert spawn_validation_players(module)[0].seen == []
+
+
+def test_spawn_validation_players_deep_copies_a_legacy_list():
+    legacy = [_Bot("old")]
+    (bot,) = spawn_validation_players(SimpleNamespace(players=legacy))
+    assert bot.name == "old" and bot is not legacy[0]
+    bot.seen.append("x")
+    assert legacy[0].seen == []
+
+
+def test_append_only_view_keeps_its_length_and_copies_to_a_list():
+    items = ["a", "b"]
+    view = AppendOnlyView(items)
+    items.append("c")
+    assert view == ["a", "b"] and len(view) == 2 and list(view) == ["a", "b"]
+    assert view[-1] == "b" and view[1:] == ["b"]
+    with pytest.raises(IndexError):
+        view[2]
+    for plain in (copy.deepcopy(view), pickle.loads(pickle.dumps(view)), view + []):
+        assert type(plain) is list and plain == ["a", "b"]
+
+
+def test_read_only_mapping_is_live_and_copies_to_a_dict():
+    scores = {"a": [1]}
+    view = ReadOnlyMapping(scores, AppendOnlyView)
+    scores["b"] = [2]
+    assert dict(view) == {"a": [1], "b": [2]}
+    assert isinstance(view["a"], AppendOnlyView)
+    with pytest.raises(TypeError):
+        view["a"] = [3]
+    assert plain_data({"scores": view}) == {"scores": {"a": [1], "b": [2]}}
+    assert type(copy.deepcopy(view)) is dict
@@ -0,0 +1,148 @@
+import random
+from datetime import timedelta
+
+import pytest
+
+from backend.database.db_models import League
+from backend.games import bot_baseline, engine_source
+from backend.games.breakthrough.breakthrough import BreakthroughGame
+from backend.games.breakthrough.validation_players import Rusher
+from backend.games.game_factory import GameFactory
+from backend.games.prisoners_dilemma.player import Player as PDPlayer
+from backend.games.prisoners_dilemma.prisoners_dilemma import PrisonersDilemmaGame
+from backend.time_utils import utc_now
+
+
+@pytest.fixture
+def league():
+    return League(
+        name="test_league",
+        created_date=utc_now(),
+        expiry_date=utc_now() + timedelta(days=1),
+        game="breakthrough",
+    )
+
+
+@pytest.fixture
+def bt_baseline(monkeypatch):
+    baseline = bot_baseline.build(BreakthroughGame, passes=4)
+    monkeypatch.setitem(bot_baseline._loaded, "breakthrough", baseline)
+    return baseline
+
+
+def _with_student(game, student):
+    student.name = "Student"
+    game.players.append(student)
+    game.scores["Student"] = 0
+    return game
+
+
+class FieldWatcher(PDPlayer):
+    """Colludes one on one, defects as soon as all_history shows a crowd."""
+
+    def make_decision(self, game_state):
+        return "defect" if len(game_state["all_history"]) > 2 else "collude"
+
+
+@pytest.mark.parametrize("game_name", bot_baseline.pairwise_games())
+def test_committed_baselines_match_their_engines(game_name):
+    """Rebuild with `python -m backend.games.bot_baseline` after changing a
+    pairwise game's engine, player or validation_players module."""
+    game_class = GameFactory.get_game_class(game_name)
+    baseline = bot_baseline._read(game_class)
+    assert baseline is not None, f"{game_name}: bot_baseline.json is missing or stale"
+    game = game_class(None)
+    assert baseline["bots"] == sorted(str(p.name) for p in game.players)
+
+
+def test_build_records_the_distribution_of_passes(bt_baseline):
+    assert bt_baseline["stats"] == [
+        "points",
+        "matches_played",
+        "wins",
+        "catches",
+        "breakthroughs",
+    ]
+    assert bt_baseline["passes"] == 4
+    assert sum(count for count, _ in bt_baseline["samples"]) == 4
+    sample = bot_baseline.draw(bt_baseline, random.Random(0))
+    assert set(sample["points"]) == set(bt_baseline["bots"])
+    # Each bot meets 5 opponents twice per pass, once in each role.
+    for bot in bt_baseline["bots"]:
+        assert sample["matches_played"][bot] == 10
+
+
+@pytest.mark.parametrize(
+    "changed", ["breakthrough/validation_players.py", "base_game.py"]
+)
+def test_stale_baseline_is_ignored(tmp_path, monkeypatch, bt_baseline, changed):
+    game_dir = tmp_path / "games" / "breakthrough"
+    game_dir.mkdir(parents=True)
+    for source in [
+        "base_game.py",
+        "breakthrough/breakthrough.py",
+        "breakthrough/player.py",
+        "breakthrough/validation_players.py",
+    ]:
+        (tmp_path / "games" / source).write_text("# engine")
+    monkeypatch.setattr(bot_baseline, "_game_dir", lambda game_class: game_dir)
+    monkeypatch.setattr(engine_source, "ROOT_DIR", str(tmp_path))
+    engine_source.engine_version.cache_clear()
+    try:
+        bot_baseline.write(BreakthroughGame, bt_baseline)
+        assert bot_baseline._read(BreakthroughGame) is None
+
+        version = bot_baseline.engine_version(BreakthroughGame)
+        bt_baseline = dict(bt_baseline, engine_version=version)
+        bot_baseline.write(BreakthroughGame, bt_baseline)
+        assert bot_baseline._read(BreakthroughGame) == bt_baseline
+
+        (tmp_path / "games" / changed).write_text("# changed engine")
+        engine_source.engine_version.cache_clear()
+        assert bot_baseline._read(BreakthroughGame) is None
+    finally:
+        engine_source.engine_version.cache_clear()
+
+
+def test_focused_run_plays_only_the_submissions_pairings(league, bt_baseline):
+    game = _with_student(BreakthroughGame(league), Rusher())
+    assert game.use_bot_baseline(["Student"])
+    pairs = game.player_pairs()
+    assert len(pairs) == len(bt_baseline["bots"])
+    assert all("Student" in (str(a.name), str(b.name)) for a, b in pairs)
+
+    game.reset()
+    result = game.run_simulations(3, league)
+    # Every bot still reports a full round robin's worth of matches.
+    for name in bt_baseline["bots"] + ["Student"]:
+        assert result["table"]["games_played"][name] == 3 * 6 * 2
+
+
+def test_baseline_needs_exactly_its_own_bots(league, bt_baseline):
+    game = _with_student(BreakthroughGame(league), Rusher())
+    assert not game.use_bot_baseline(["Student", "Rusher"])
+    game.players = game.players[1:]
+    assert not game.use_bot_baseline(["Student"])
+    assert len(game.player_pairs()) == 15
+
+
+def test_games_without_independent_pairings_never_use_a_baseline():
+    game = GameFactory.get_game_class("greedy_pig")(None)
+    assert not game.use_bot_baseline([game.players[0].name])
+
+
+def test_agents_that_see_the_whole_field_play_every_bot(league):
+    """A prisoners' dilemma agent reads all_history and scores for the whole
+    league, so a pairing against a bot plays out differently with the other
+    bots in the game: validation must play them all."""
+    assert PrisonersDilemmaGame.bot_baseline_stats is None
+    assert "prisoners_dilemma" not in bot_baseline.pairwise_games()
+
+    game = _with_student(PrisonersDilemmaGame(league), FieldWatcher())
+    assert not game.use_bot_baseline(["Student"])
+    assert len(game.player_pairs()) == 15
+
+    game.reset()
+    game.play_game()
+    # It sees the crowd in every pairing, as it will in its league.
+    assert game.decision_counts["Student"] == {"collude": 0, "defect": 25}
@@ -1,3 +1,4 @@
+import copy
 from datetime import datetime, timedelta
 
 import pytest
@@ -279,6 +280,80 @@ def test_traces_and_state_shape(small_game):
     assert len(seen["my_trace"]) > 1  # trail grew as the attacker moved
 
 
+
+def test_traces_are_read_only_snapshots_with_visited_sets(small_game):
+    states = []
+
+    class Recorder(Player):
+        def make_decision(self, game_state):
+            states.append(game_state)
+            return "N" if game_state["turn"] % 2 else "S"  # revisits cells
+
+    attacker = Recorder()
+    attacker.name = "A"
+    defender = Scripted(["STAY"], name="D")
+    small_game.play_match(
+        attacker, defender, small_game._validate_rewards(None), start_positions=((0, 5), (5, 0))
+    )
+    first, last = states[0], states[-1]
+    assert first["my_trace"] == [(0, 5)]  # later moves do not show through
+    assert last["my_trace"][:3] == [(0, 5), (0, 6), (0, 5)]
+    assert set(last["my_visited"]) == {(0, 5), (0, 6)} == set(last["my_trace"])
+    assert (0, 6) in last["my_visited"] and (0, 6) not in first["my_visited"]
+    assert [0, 6] not in last["my_visited"]
+    with pytest.raises(TypeError):
+        last["my_trace"][0] = (9, 9)
+    assert type(copy.deepcopy(last["my_trace"])) is list
+    assert type(last["my_trace"].copy()) is list
+    assert first["my_trace"] * 2 == 2 * first["my_trace"] == [(0, 5), (0, 5)]
+    assert [(1, 1)] + first["my_trace"] == [(1, 1), (0, 5)]
+    assert type(copy.copy(last["opp_visited"])) is set
+
+
+ECHO_TRACE_CODE = """
+from games.breakthrough.player import Player
+
+class CustomPlayer(Player):
+    def make_decision(self, game_state):
+        trace = game_state["my_trace"]
+        self.add_feedback(trace)
+        self.add_feedback(trace.copy() + game_state["opp_trace"] * 2)
+        self.add_feedback({"visited": game_state["my_visited"]})
+        return "STAY"
+"""
+
+
+def test_trace_echoed_into_feedback_is_plain_json(db_session):
+    """Views an agent echoes into its feedback reach the result as plain
+    lists, fixed at the turn it echoed them."""
+    from kombu.utils.json import dumps, loads
+
+    from backend.tasks.simulation_task import run_simulation
+
+    result = run_simulation(
+        league_id=1,
+        game_name="breakthrough",
+        submissions={"Echo": ECHO_TRACE_CODE, "Other": ECHO_TRACE_CODE},
+        num_simulations=1,
+        player_feedback=True,
+    )
+    assert result["status"] == "success"
+    trace, joined, visited = loads(dumps(result))["player_feedback"]["Echo"][:3]
+    assert len(trace) == 1
+    # Its own start cell, then the opponent's twice.
+    assert joined[:1] == trace and joined[1] == joined[2] != trace[0]
+    assert visited == {"visited": trace}
+
+
+def test_mine_avoider_reads_the_visited_set():
+    from backend.games.breakthrough.validation_players import MineAvoider
+
+    avoider = MineAvoider()
+    state = {"opp_mines": 0, "opp_visited": {(51, 5)}, "opp_trace": []}
+    assert avoider._risky((51, 5), state)
+    assert not avoider._risky((50, 5), state)
+
+
 # ---------------------------------------------------------------------------
 # Mines
 # ---------------------------------------------------------------------------
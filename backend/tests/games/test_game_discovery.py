@@ -172,3 +172,23 @@ def test_factory_ignores_imported_basegame_subclasses(temp_game_folder):
     )
     with pytest.raises(ValueError, match="No BaseGame subclass"):
         GameFactory.get_game_class("dummy_reexport_xyz")
+
+
+# ---------------------------------------------------------------------------
+# GameFactory.preload_all — worker-parent warm-up before fork
+# ---------------------------------------------------------------------------
+
+
+def test_preload_all_imports_every_game():
+    assert GameFactory.preload_all() == list(GAMES)
+    for name in GAMES:
+        assert f"backend.games.{name}.player" in sys.modules
+        assert f"backend.games.{name}.validation_players" in sys.modules
+        assert name in GameFactory._cache
+
+
+def test_preload_all_skips_a_broken_game(temp_game_folder):
+    temp_game_folder("dummy_broken_preload_xyz", "raise RuntimeError('boom')\n")
+    loaded = GameFactory.preload_all()
+    assert "dummy_broken_preload_xyz" not in loaded
+    assert loaded == list(GAMES)
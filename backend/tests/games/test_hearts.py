@@ -7,12 +7,15 @@ from backend.database.db_models import League
 from backend.games.hearts.hearts import (
     DECK,
     DEFAULT_REWARDS,
+    SUITS,
     HeartsGame,
-    TableScheduler,
     card_points,
+    card_set,
     card_suit,
+    set_cards,
     sort_hand,
 )
+from backend.games.table_tournament import TableScheduler
 from backend.games.hearts.player import Player
 from backend.time_utils import utc_now
 
@@ -64,33 +67,91 @@ def test_game_initialization(test_league):
     assert game.game_feedback == {"game": "hearts", "hands": []}
 
 
+def _legal(game, hand, led, first_trick, hearts_broken):
+    led_suit = SUITS.index(card_suit(led)) if led else None
+    return set_cards(
+        game._legal_moves(card_set(hand), led_suit, first_trick, hearts_broken)
+    )
+
+
 def test_legal_moves_first_trick_must_lead_2c(test_league):
     game = HeartsGame(test_league)
     hand = ["2C", "AH", "QS", "5D"]
-    assert game._legal_moves(hand, [], True, False) == ["2C"]
+    assert _legal(game, hand, None, True, False) == ["2C"]
 
 
 def test_legal_moves_follow_suit(test_league):
     game = HeartsGame(test_league)
     hand = ["5C", "AH", "QS"]
-    trick = [{"player": "x", "card": "2C"}]
-    assert game._legal_moves(hand, trick, False, False) == ["5C"]
+    assert _legal(game, hand, "2C", False, False) == ["5C"]
 
 
 def test_legal_moves_no_points_on_first_trick_when_void(test_league):
     game = HeartsGame(test_league)
     hand = ["AH", "QS", "5D"]
-    trick = [{"player": "x", "card": "2C"}]
-    assert game._legal_moves(hand, trick, True, False) == ["5D"]
+    assert _legal(game, hand, "2C", True, False) == ["5D"]
 
 
 def test_legal_moves_hearts_not_led_until_broken(test_league):
     game = HeartsGame(test_league)
     hand = ["AH", "5D"]
-    assert game._legal_moves(hand, [], False, False) == ["5D"]
-    assert set(game._legal_moves(hand, [], False, True)) == {"AH", "5D"}
+    assert _legal(game, hand, None, False, False) == ["5D"]
+    assert set(_legal(game, hand, None, False, True)) == {"AH", "5D"}
     # only hearts left: may lead them even unbroken
-    assert game._legal_moves(["AH", "2H"], [], False, False) == ["AH", "2H"]
+    assert _legal(game, ["AH", "2H"], None, False, False) == ["2H", "AH"]
+
+
+def test_card_sets_round_trip_in_hand_order():
+    hand = ["AH", "2C", "QS", "10D", "3C"]
+    assert set_cards(card_set(hand)) == sort_hand(hand)
+    assert set_cards(card_set(DECK)) == DECK
+
+
+class Inspector(LowCard):
+    """Plays like LowCard and checks the card lists it is handed."""
+
+    def make_decision(self, game_state):
+        if game_state["phase"] == "play":
+            played = game_state["cards_played"]
+            remaining = game_state["cards_remaining"]
+            assert len(played) == len(set(played))
+            assert sorted(played + remaining) == sorted(DECK)
+            assert set(game_state["hand"]) <= set(remaining)
+            for play in game_state["trick"]:
+                assert play["card"] in played
+            self.views = getattr(self, "views", 0) + 1
+        return super().make_decision(game_state)
+
+
+def test_played_and_remaining_cards_partition_the_deck(test_league):
+    game = HeartsGame(test_league)
+    game.players = []
+    _add_players(game, 4, Inspector)
+    game._play_table_game(game.players, random.Random(3))
+    assert all(p.views >= 13 for p in game.players)
+
+
+def test_lazy_state_entries_read_like_plain_values(test_league):
+    """cards_played/cards_remaining are built on first read, however read."""
+    seen = []
+
+    class Recorder(LowCard):
+        def make_decision(self, game_state):
+            if game_state["phase"] == "play" and not seen:
+                seen.append(game_state)
+            return super().make_decision(game_state)
+
+    game = HeartsGame(test_league)
+    game.players = []
+    _add_players(game, 4, Recorder)
+    game._play_table_game(game.players, random.Random(0))
+
+    state = seen[0]
+    plain = dict(state)
+    assert plain["cards_played"] == []
+    assert len(plain["cards_remaining"]) == 52
+    assert "cards_remaining" in repr(state) and "object at" not in repr(state)
+    assert state == plain and state.copy() == plain
 
 
 def test_placement_points_ties_share_mean():
@@ -228,6 +289,19 @@ def test_run_simulations_shape(test_league):
         assert set(results["table"][key].keys()) == {p.name for p in game.players}
 
 
+def test_remove_player_restarts_tournament_without_them(test_league):
+    game = HeartsGame(test_league)
+    game.players = []
+    _add_players(game, 6)
+    game.play_game()
+    game.remove_player("LowCard_0")
+    result = game.play_game()
+    assert "LowCard_0" not in result["points"]
+    assert set(result["table"]["games_played"]) == {
+        f"LowCard_{i}" for i in range(1, 6)
+    }
+
+
 # --------------------------------------------------------------- feedback
 
 
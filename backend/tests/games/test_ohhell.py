@@ -10,10 +10,10 @@ from backend.games.ohhell.ohhell import (
     DEFAULT_REWARDS,
     OhHellGame,
     TABLE_SIZE,
-    TableScheduler,
     card_suit,
     sort_hand,
 )
+from backend.games.table_tournament import TableScheduler
 from backend.games.ohhell.player import Player
 from backend.time_utils import utc_now
 
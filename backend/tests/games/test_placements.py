@@ -0,0 +1,71 @@
+import pytest
+
+from backend.games.game_factory import GameFactory
+from backend.games.placements import (
+    add_placements,
+    merge_placements,
+    placement_points,
+    rescore,
+    rescore_run,
+    span_key,
+    tied_spans,
+)
+
+PLACEMENT_GAMES = ["greedy_pig", "hearts", "ohhell", "thirteen"]
+OTHER_REWARDS = {
+    "greedy_pig": [5, 3, 1, 0, 0, 0, 0],
+    "hearts": [10, 3, 1, 0],
+    "ohhell": [1, 1, 0, 0],
+    "thirteen": [7, 5, 2, 1],
+}
+
+
+def test_ties_share_a_span_and_split_its_rewards():
+    spans = tied_spans({"a": 9, "b": 7, "c": 7, "d": 1}, highest_first=True)
+    assert spans == {"a": (0, 1), "b": (1, 3), "c": (1, 3), "d": (3, 4)}
+    assert placement_points(spans, [4, 2, 1]) == {"a": 4, "b": 1.5, "c": 1.5, "d": 0}
+    assert [span_key(*spans[n]) for n in "abd"] == ["0", "1-2", "3"]
+
+
+def test_rescore_sums_each_span_under_the_rewards():
+    histogram = {"a": {"0": 3, "1-2": 2}, "b": {"3": 1}}
+    assert rescore(histogram, [4, 2, 1, 0]) == {"a": 15, "b": 0}
+    assert rescore(histogram, [1, 1, 1]) == {"a": 5, "b": 0}
+
+
+def test_window_changes_add_up_and_drop_empty_entries():
+    histogram = merge_placements([{"a": {"0": 2}}, {"a": {"0": -2, "1": 1}}])
+    assert histogram == {"a": {"1": 1}}
+    assert add_placements(histogram, {"b": {"2": 1}}) == {"a": {"1": 1}, "b": {"2": 1}}
+
+
+def _recorded_run(game_name, custom_rewards, passes=4):
+    game = GameFactory.get_game_class(game_name)(None)
+    game.seed_rng(7)
+    game.record_placements = True
+    # A short window, so the table games also slide games out of it.
+    game.RECENT_GAMES_WINDOW = 30
+    totals, histograms = {}, []
+    for _ in range(passes):
+        game.reset()
+        results = game.play_game(custom_rewards)
+        for name, points in results["points"].items():
+            totals[name] = totals.get(name, 0) + points
+        histograms.append(results["placements"])
+    return totals, merge_placements(histograms)
+
+
+@pytest.mark.parametrize("game_name", PLACEMENT_GAMES)
+def test_rescoring_a_recorded_run_matches_playing_it_with_those_rewards(game_name):
+    game_class = GameFactory.get_game_class(game_name)
+    _, histogram = _recorded_run(game_name, None)
+    other_totals, _ = _recorded_run(game_name, OTHER_REWARDS[game_name])
+
+    rescored = rescore_run(game_class, histogram, OTHER_REWARDS[game_name])
+    assert rescored == pytest.approx(other_totals)
+    assert rescored != rescore_run(game_class, histogram, None)
+
+
+def test_runs_record_nothing_unless_asked():
+    game = GameFactory.get_game_class("greedy_pig")(None)
+    assert "placements" not in game.play_game()
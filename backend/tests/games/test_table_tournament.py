@@ -0,0 +1,45 @@
+import itertools
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from backend.games.table_tournament import RecentGames, TableGame, TableScheduler
+
+
+def test_recent_games_total_follows_the_window():
+    window = RecentGames([1.0, 2.0], maxlen=3)
+    assert window.total == 3.0
+    for points in (4.0, 8.0, 16.0):
+        window.append(points)
+        assert window.total == sum(window)
+    assert list(window) == [4.0, 8.0, 16.0]
+
+
+def test_scheduler_covers_every_pair_before_refilling():
+    names = [f"p{i}" for i in range(24)]
+    sched = TableScheduler(names, random.Random(3))
+    met = set()
+    while sched.unmet_pairs:
+        for table in sched.next_round():
+            met.update(frozenset(pair) for pair in itertools.combinations(table, 2))
+        assert len(met) == len(names) * (len(names) - 1) // 2 - sched.unmet_pairs
+    assert all(not opponents for opponents in sched.unmet.values())
+
+
+def test_scheduler_is_reproducible_from_its_seed():
+    names = [f"p{i}" for i in range(30)]
+    first, second = (TableScheduler(names, random.Random(11)) for _ in range(2))
+    assert [first.next_round() for _ in range(3)] == [
+        second.next_round() for _ in range(3)
+    ]
+
+
+def test_table_game_hooks_are_abstract():
+    class Unfinished(TableGame):
+        def _empty_feedback(self):
+            return {}
+
+    assert Unfinished.__abstractmethods__ == {"_play_table_game", "_placements"}
+    with pytest.raises(TypeError, match="_placements"):
+        Unfinished(SimpleNamespace(id=1, name="league", game="hearts"))
@@ -1,3 +1,4 @@
+import json
 import random
 from datetime import timedelta
 
@@ -5,12 +6,13 @@ import pytest
 
 from backend.database.db_models import League
 from backend.games.thirteen.player import Player
+from backend.games.table_tournament import TableScheduler
 from backend.games.thirteen.thirteen import (
     DECK,
     DEFAULT_REWARDS,
+    HandIndex,
     RANK_VALUE,
     TABLE_SIZE,
-    TableScheduler,
     ThirteenGame,
     beats,
     card_key,
@@ -171,6 +173,57 @@ def test_legal_responses_bomb_answers_two(test_league):
     assert sort_hand(["6S", "6C", "6D", "6H"]) in [sort_hand(m) for m in moves if m]
 
 
+
+def test_hand_index_generates_only_beating_combos():
+    index = HandIndex(["4S", "4C", "4H", "9S", "9D", "10C", "JS", "QH", "2D"])
+    assert index.sets(2, above=card_key("9C")) == [["9S", "9D"]]
+    assert index.sets(3) == [["4S", "4C", "4H"]]
+    assert index.singles(above=card_key("QH")) == [["2D"]]
+    assert index.straights(3, above=card_key("10S")) == [
+        ["9S", "10C", "JS"], ["9D", "10C", "JS"], ["10C", "JS", "QH"],
+    ]
+    assert index.straights(4) == [["9S", "10C", "JS", "QH"], ["9D", "10C", "JS", "QH"]]
+
+
+def test_hand_index_follows_removals():
+    hand = sort_hand(DECK[:13])
+    index = HandIndex(hand)
+    index.remove(["5S", "9S"])
+    remaining = [c for c in hand if c not in ("5S", "9S")]
+    assert index.leads() == HandIndex(remaining).leads()
+    assert index.responses(["3C", "4C", "5C"]) == [
+        ["6S", "7S", "8S"], ["10S", "JS", "QS"], ["JS", "QS", "KS"],
+        ["QS", "KS", "AS"], [],
+    ]
+
+
+class Peeker(Player):
+    """Records what C-level consumers see of the legal_moves it was handed."""
+
+    def __init__(self):
+        super().__init__()
+        self.seen = []
+
+    def make_decision(self, game_state):
+        legal = game_state["legal_moves"]
+        self.seen.append((list(legal), [] + legal, json.loads(json.dumps(legal))))
+        return legal[0]
+
+
+def test_legal_moves_are_a_plain_list(test_league):
+    game = ThirteenGame(test_league)
+    game.players = []
+    _add_players(game, 3)
+    _add_players(game, 1, Peeker)
+    peeker = game.players[-1]
+    game._play_table_game(game.players, random.Random(0), verbose=False)
+
+    assert peeker.seen
+    for legal, concatenated, decoded in peeker.seen:
+        assert legal and concatenated == legal == decoded
+        assert all(classify(m) is not None for m in legal if m)
+
+
 # ------------------------------------------------------------- table games
 
 
@@ -7,6 +7,7 @@ from sqlmodel import Session, select
 
 from backend.tests.conftest import add_submission
 from backend.database.db_models import UNASSIGNED_LEAGUE_NAME, League, SimulationResult, Team
+from backend.routes.admin.admin_db import save_simulation_results
 from backend.routes.auth.auth_core import create_access_token
 from backend.time_utils import utc_now
 
@@ -178,6 +179,161 @@ def test_run_simulation_worker_error_surfaces_and_stores_nothing(
     assert after == before
 
 
+def test_run_simulation_sharded_uses_shard_chord(client, simulation_setup, db_session):
+    """shards > 1 routes the run through enqueue_sharded_simulation."""
+    league, team, _, headers = simulation_setup
+
+    with patch(
+        "backend.routes.admin.admin_router.enqueue_sharded_simulation"
+    ) as mock_enqueue:
+        mock_async = mock_enqueue.return_value
+        mock_async.ready.return_value = True
+        mock_async.successful.return_value = True
+        mock_async.result = {
+            "status": "success",
+            "simulation_results": {
+                "total_points": {team.name: 40},
+                "num_simulations": 12,
+                "table": {},
+            },
+            "feedback": "Test feedback",
+            "player_feedback": {},
+        }
+
+        response = client.post(
+            "/admin/run-simulation",
+            headers=headers,
+            json={"league_id": league.id, "num_simulations": 12, "shards": 4},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["num_simulations"] == 12
+    assert mock_enqueue.call_args.kwargs["shards"] == 4
+
+
+def test_run_simulation_delta_runs_as_one_task(client, simulation_setup, db_session):
+    """A delta run reads the pairing cache in one task, whatever `shards` says."""
+    league, team, _, headers = simulation_setup
+    league.game = "breakthrough"
+    db_session.add(league)
+    db_session.commit()
+
+    with patch(
+        "backend.routes.admin.admin_router.enqueue_sharded_simulation"
+    ) as mock_enqueue, patch(
+        "backend.routes.admin.admin_router.run_simulation"
+    ) as mock_task:
+        mock_async = mock_task.delay.return_value
+        mock_async.ready.return_value = True
+        mock_async.successful.return_value = True
+        mock_async.result = {
+            "status": "success",
+            "simulation_results": {
+                "total_points": {team.name: 40},
+                "num_simulations": 12,
+                "table": {},
+                "delta": {"pairings": 3, "replayed": 2},
+            },
+            "feedback": "Test feedback",
+            "player_feedback": {},
+        }
+
+        response = client.post(
+            "/admin/run-simulation",
+            headers=headers,
+            json={
+                "league_id": league.id,
+                "num_simulations": 12,
+                "shards": 4,
+                "delta": True,
+            },
+        )
+
+    assert response.status_code == 200
+    assert response.json()["delta"] == {"pairings": 3, "replayed": 2}
+    assert mock_task.delay.call_args.kwargs["delta"] is True
+    mock_enqueue.assert_not_called()
+
+
+@pytest.mark.parametrize("game", ["greedy_pig", "prisoners_dilemma"])
+def test_run_simulation_delta_rejects_non_pairwise_game(
+    client, simulation_setup, db_session, game
+):
+    league, _, _, headers = simulation_setup
+    league.game = game
+    db_session.add(league)
+    db_session.commit()
+
+    response = client.post(
+        "/admin/run-simulation",
+        headers=headers,
+        json={"league_id": league.id, "num_simulations": 10, "delta": True},
+    )
+    assert response.status_code == 400
+    assert "pairwise" in response.json()["detail"]
+
+
+def test_rescore_simulation_applies_other_rewards(
+    client, simulation_setup, db_session
+):
+    league, team, _, headers = simulation_setup
+    league.game = "greedy_pig"
+    db_session.add(league)
+    db_session.commit()
+    recorded = save_simulation_results(
+        db_session,
+        league.id,
+        {
+            "total_points": {team.name: 20},
+            "num_simulations": 3,
+            "table": {},
+            "placements": {team.name: {"0": 2, "1-2": 1}},
+        },
+    )
+    unrecorded = save_simulation_results(
+        db_session,
+        league.id,
+        {"total_points": {team.name: 20}, "num_simulations": 3, "table": {}},
+    )
+
+    response = client.post(
+        "/admin/rescore-simulation",
+        headers=headers,
+        json={
+            "league_id": league.id,
+            "id": recorded.id,
+            "reward_schemes": [[10, 0, 0], [4, 2, 1]],
+        },
+    )
+    assert response.status_code == 200
+    rescored = response.json()["rescored"]
+    assert rescored[0] == {"rewards": [10, 0, 0], "total_points": {team.name: 20}}
+    assert rescored[1]["total_points"] == {team.name: 9.5}
+
+    response = client.post(
+        "/admin/rescore-simulation",
+        headers=headers,
+        json={"league_id": league.id, "id": unrecorded.id, "reward_schemes": [[1]]},
+    )
+    assert response.status_code == 400
+    assert "record_placements" in response.json()["detail"]
+
+
+def test_run_simulation_rejects_placements_for_other_games(client, simulation_setup):
+    league, _, _, headers = simulation_setup
+    response = client.post(
+        "/admin/run-simulation",
+        headers=headers,
+        json={
+            "league_id": league.id,
+            "num_simulations": 10,
+            "reward_schemes": [[4, 2, 1, 0]],
+        },
+    )
+    assert response.status_code == 400
+    assert "placement" in response.json()["detail"]
+
+
 def test_run_simulation_rejects_unassigned_league(
     client, simulation_setup, db_session
 ):
@@ -223,4 +379,73 @@ def test_run_simulation_failures(client, simulation_setup, db_session):
         "/admin/run-simulation",
         json={"league_id": league.id, "num_simulations": 10},
     )
-    assert response.status_code == 401
\ No newline at end of file
+    assert response.status_code == 401
+
+def test_simulation_progress_stream_and_stop(client, simulation_setup):
+    """The SSE stream relays the published progress and closes once the run
+    has finished; /stop-simulation raises the flag the task polls."""
+    import uuid
+
+    from backend.tasks.simulation_progress import ProgressReporter
+
+    _, _, _, headers = simulation_setup
+    progress_id = uuid.uuid4().hex
+
+    response = client.post(
+        "/admin/stop-simulation",
+        headers=headers,
+        json={"progress_id": progress_id},
+    )
+    assert response.status_code == 200
+    reporter = ProgressReporter(progress_id, 0, 1, requested=3, budget_seconds=60)
+    assert reporter.stop_requested()
+
+    reporter.add_result({"points": {"a": 2}})
+    reporter.publish(3, elapsed=1.0, sim_elapsed=1.0, state="done")
+
+    with client.stream(
+        "GET", f"/admin/simulation-progress/{progress_id}", headers=headers
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        body = "".join(response.iter_text())
+
+    event = json.loads(body.removeprefix("data: ").strip())
+    assert event["state"] == "done"
+    assert event["total_points"] == {"a": 2}
+
+
+def test_simulation_progress_stream_closes_on_early_failure(client, simulation_setup):
+    """A run that fails before playing a game still ends its stream."""
+    import uuid
+
+    from backend.tasks.simulation_task import run_simulation
+
+    _, _, _, headers = simulation_setup
+    progress_id = uuid.uuid4().hex
+    result = run_simulation(
+        league_id=1,
+        game_name="greedy_pig",
+        num_simulations=5,
+        progress_id=progress_id,
+        delta=True,
+    )
+    assert result["status"] == "error"
+
+    with client.stream(
+        "GET", f"/admin/simulation-progress/{progress_id}", headers=headers
+    ) as response:
+        body = "".join(response.iter_text())
+
+    event = json.loads(body.removeprefix("data: ").strip())
+    assert event["state"] == "failed"
+
+
+def test_simulation_progress_rejects_bad_id(client, simulation_setup):
+    _, _, _, headers = simulation_setup
+    response = client.post(
+        "/admin/stop-simulation",
+        headers=headers,
+        json={"progress_id": "bad id!"},
+    )
+    assert response.status_code == 422
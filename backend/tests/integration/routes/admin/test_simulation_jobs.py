@@ -0,0 +1,181 @@
+"""Asynchronous simulation jobs: enqueue, status, and the saving consumer."""
+
+import time
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from sqlmodel import select
+
+from backend.database.db_models import (
+    SimulationJob,
+    SimulationJobStatus,
+    SimulationResult,
+    Team,
+)
+from backend.routes.admin.simulation_jobs import collect_finished_jobs
+from backend.time_utils import utc_now
+
+
+def _finished(result):
+    async_result = MagicMock()
+    async_result.ready.return_value = True
+    async_result.successful.return_value = True
+    async_result.result = result
+    return async_result
+
+
+def _enqueue(client, headers, league_id, **extra):
+    with patch("backend.routes.admin.admin_router.run_simulation") as mock_task:
+        mock_task.delay.return_value.id = "task-123"
+        response = client.post(
+            "/admin/enqueue-simulation",
+            headers=headers,
+            json={"league_id": league_id, "num_simulations": 10, **extra},
+        )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_enqueue_returns_job_immediately(client, admin_headers, test_league, db_session):
+    data = _enqueue(client, admin_headers, test_league.id, custom_rewards=[5, 1])
+
+    job = db_session.get(SimulationJob, data["job_id"])
+    assert job.task_id == "task-123"
+    assert job.status == SimulationJobStatus.QUEUED
+    assert job.progress_id == data["progress_id"]
+
+    response = client.get(f"/admin/simulation-job/{data['job_id']}", headers=admin_headers)
+    assert response.status_code == 200
+    status = response.json()
+    assert status["status"] == "queued"
+    assert status["custom_rewards"] == [5, 1]
+    assert status["progress"] is None  # nothing published yet
+
+
+def test_simulation_job_not_found(client, admin_headers):
+    response = client.get("/admin/simulation-job/999999", headers=admin_headers)
+    assert response.status_code == 404
+
+
+def test_consumer_saves_finished_job(client, admin_headers, test_league, db_session):
+    team = Team(
+        name="job_team", school_name="School", password_hash="hash",
+        league_id=test_league.id,
+    )
+    db_session.add(team)
+    db_session.commit()
+    data = _enqueue(client, admin_headers, test_league.id)
+    result = {
+        "status": "success",
+        "feedback": {"game": "prisoners_dilemma"},
+        "player_feedback": {},
+        "simulation_results": {
+            "total_points": {team.name: 42},
+            "num_simulations": 10,
+            "table": {},
+        },
+    }
+
+    with patch(
+        "backend.routes.admin.simulation_jobs.celery_app.AsyncResult",
+        return_value=_finished(result),
+    ):
+        assert collect_finished_jobs(db_session) == 1
+        # A second pass finds nothing left to resolve: saved exactly once.
+        assert collect_finished_jobs(db_session) == 0
+
+    job = db_session.get(SimulationJob, data["job_id"])
+    assert job.status == SimulationJobStatus.DONE
+    assert job.games_completed == 10
+    assert job.finished_at is not None
+    saved = db_session.get(SimulationResult, job.simulation_result_id)
+    assert saved.num_simulations == 10
+    assert saved.simulation_results[0].score == 42
+
+
+def test_consumer_marks_error_result_failed(client, admin_headers, test_league, db_session):
+    data = _enqueue(client, admin_headers, test_league.id)
+    before = len(db_session.exec(select(SimulationResult)).all())
+    result = {
+        "status": "error",
+        "message": "No players loaded for simulation",
+        "simulation_results": {"total_points": {}, "num_simulations": 10, "table": {}},
+    }
+
+    with patch(
+        "backend.routes.admin.simulation_jobs.celery_app.AsyncResult",
+        return_value=_finished(result),
+    ):
+        collect_finished_jobs(db_session)
+
+    job = db_session.get(SimulationJob, data["job_id"])
+    assert job.status == SimulationJobStatus.FAILED
+    assert job.error == "No players loaded for simulation"
+    assert len(db_session.exec(select(SimulationResult)).all()) == before
+
+
+def _pending():
+    pending = MagicMock()
+    pending.ready.return_value = False
+    return pending
+
+
+def test_consumer_fails_lost_job(client, admin_headers, test_league, db_session):
+    data = _enqueue(client, admin_headers, test_league.id)
+    job = db_session.get(SimulationJob, data["job_id"])
+    silent = {"games_completed": 3, "updated_at": time.time() - 2 * 3600}
+
+    with patch(
+        "backend.routes.admin.simulation_jobs.celery_app.AsyncResult",
+        return_value=_pending(),
+    ), patch(
+        "backend.routes.admin.simulation_jobs.read_progress", return_value=silent
+    ):
+        collect_finished_jobs(db_session)
+
+    db_session.refresh(job)
+    assert job.status == SimulationJobStatus.FAILED
+    assert "lost" in job.error
+
+
+def test_consumer_keeps_long_queued_job(client, admin_headers, test_league, db_session):
+    """A job waiting behind other runs has published nothing; it is not lost."""
+    data = _enqueue(client, admin_headers, test_league.id)
+    job = db_session.get(SimulationJob, data["job_id"])
+    job.created_at = utc_now() - timedelta(hours=2)
+    db_session.add(job)
+    db_session.commit()
+
+    with patch(
+        "backend.routes.admin.simulation_jobs.celery_app.AsyncResult",
+        return_value=_pending(),
+    ):
+        assert collect_finished_jobs(db_session) == 0
+
+    db_session.refresh(job)
+    assert job.status == SimulationJobStatus.QUEUED
+    assert job.error is None
+
+
+def test_job_runs_on_worker_and_is_saved(
+    celery_workers, client, admin_headers, test_league, db_session
+):
+    """End to end: a real task, collected by the consumer with no waiting client."""
+    response = client.post(
+        "/admin/enqueue-simulation",
+        headers=admin_headers,
+        json={"league_id": test_league.id, "num_simulations": 5},
+    )
+    job_id = response.json()["job_id"]
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        collect_finished_jobs(db_session)
+        job = db_session.get(SimulationJob, job_id)
+        db_session.refresh(job)
+        if job.status not in (SimulationJobStatus.QUEUED, SimulationJobStatus.RUNNING):
+            break
+        time.sleep(0.2)
+
+    assert job.status == SimulationJobStatus.DONE, job.error
+    assert job.simulation_result_id is not None
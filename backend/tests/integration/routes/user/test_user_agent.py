@@ -1,3 +1,5 @@
+import json
+import uuid
 from datetime import timedelta
 
 import pytest
@@ -113,6 +115,9 @@ class CustomPlayer(Player):
     # total_points; exact value is stochastic but always a valid rank.
     assert latest_submission.ranking is not None
     assert latest_submission.ranking >= 1
+    # The validation run's decision timings are stored with the submission.
+    profile = json.loads(latest_submission.decision_profile)
+    assert profile["players"][team.name]["count"] > 0
 
     # Test case 2: Submission with complex strategy
     complex_code = """
@@ -135,6 +140,50 @@ class CustomPlayer(Player):
     assert response.json()["submission_id"] is not None
 
 
+def test_submit_agent_resubmission_served_from_cache(
+    client, db_session: Session, student_token: str, setup_test_team: Team, monkeypatch
+):
+    """Byte-identical code is validated once; the resubmission reuses the
+    stored result and is saved and ranked exactly like the first, with no
+    duration of its own since nothing ran."""
+    code = f"""
+from games.prisoners_dilemma.player import Player
+
+class CustomPlayer(Player):
+    # {uuid.uuid4().hex}
+    def make_decision(self, game_state):
+        return "defect"
+"""
+    headers = {"Authorization": f"Bearer {student_token}"}
+    first = client.post("/user/submit-agent", json={"code": code}, headers=headers)
+    assert first.status_code == 200
+
+    def no_worker(**kwargs):
+        raise AssertionError("cached submission must not be enqueued")
+
+    monkeypatch.setattr(user_router_module, "enqueue_validation", no_worker)
+    second = client.post("/user/submit-agent", json={"code": code}, headers=headers)
+    assert second.status_code == 200
+    assert second.json()["results"] == first.json()["results"]
+    assert second.json()["submission_id"] != first.json()["submission_id"]
+    assert first.json()["duration_ms"] > 0
+    assert second.json()["duration_ms"] is None
+
+    saved = db_session.exec(
+        select(Submission)
+        .join(SubmissionMetadata, Submission.metadata_id == SubmissionMetadata.id)
+        .where(SubmissionMetadata.team_id == setup_test_team.id)
+    ).all()
+    assert len(saved) == 2
+    assert saved[0].ranking == saved[1].ranking
+    durations = db_session.exec(
+        select(SubmissionMetadata.duration_ms)
+        .where(SubmissionMetadata.team_id == setup_test_team.id)
+        .order_by(SubmissionMetadata.id)
+    ).all()
+    assert durations[0] > 0 and durations[1] is None
+
+
 def test_submit_agent_exceptions(
     client,
     student_token: str,
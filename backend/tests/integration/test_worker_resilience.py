@@ -14,8 +14,11 @@ resource-exhaustion modes the platform must survive:
    abort the run as an agent error — is what terminates the child.
 
 2. CPU bomb. A busy loop that also swallows exceptions inside itself, so the
-   soft-limit SoftTimeLimitExceeded cannot stop it. Only the hard time_limit=6
-   SIGKILL backstop kills it; .get() raises TimeLimitExceeded.
+   soft-limit SoftTimeLimitExceeded cannot stop it. The per-decision hard limit
+   (decision_budget) still interrupts it — DecisionBudgetExceeded is not an
+   Exception — and the run fails as a timeout naming the agent. A loop with a
+   bare ``except:`` swallows even that; only the hard time_limit=6 SIGKILL
+   backstop kills it, and .get() raises TimeLimitExceeded.
 
 The memory bomb relies on the worker container having NO swap (compose sets
 memswap_limit == mem_limit): with swap the hoard spills to disk, thrashes, and
@@ -71,6 +74,21 @@ class CustomPlayer(Player):
                 continue
 """
 
+# Swallows everything, the per-decision interrupt included.
+CPU_BOMB_BARE_EXCEPT = """
+from games.greedy_pig.player import Player
+
+class CustomPlayer(Player):
+    def make_decision(self, game_state):
+        while True:
+            try:
+                n = 0
+                for i in range(10 ** 8):
+                    n += i * i
+            except:
+                continue
+"""
+
 # A normal, well-behaved agent used to prove the worker recovers afterwards.
 VALID_PROBE = """
 from games.greedy_pig.player import Player
@@ -93,7 +111,7 @@ def _validate(code: str, team: str):
 
 def test_hostile_agents_pass_the_ast_check():
     """Both bombs are 'safe' by AST rules, so they genuinely reach a worker."""
-    for code in (MEMORY_BOMB_RECURSION, CPU_BOMB):
+    for code in (MEMORY_BOMB_RECURSION, CPU_BOMB, CPU_BOMB_BARE_EXCEPT):
         is_safe, message = validate_code(code)
         assert is_safe, f"expected AST-clean, got: {message}"
 
@@ -109,10 +127,20 @@ def test_memory_bomb_is_contained_and_worker_recovers(celery_workers):
     assert result["status"] == "success", result
 
 
+def test_cpu_bomb_is_stopped_by_the_decision_budget(celery_workers):
+    """A soft-limit-swallowing busy loop is interrupted at the per-decision
+    hard limit and reported as a timeout of that decision."""
+    result = _validate(CPU_BOMB, "cpu_bomb_team")
+    assert result["status"] == "error"
+    assert result["message"].startswith("Your agent consumes too much time - ")
+    assert "hard limit" in result["message"]
+
+
 def test_cpu_bomb_is_hard_killed_and_worker_recovers(celery_workers):
-    """A soft-limit-swallowing busy loop is hard-killed; the pool keeps serving."""
+    """A busy loop that swallows every exception is hard-killed; the pool
+    keeps serving."""
     with pytest.raises(TimeLimitExceeded):
-        _validate(CPU_BOMB, "cpu_bomb_team")
+        _validate(CPU_BOMB_BARE_EXCEPT, "cpu_bomb_team")
 
     result = _validate(VALID_PROBE, "recovery_after_cpu")
     assert result["status"] == "success", result
@@ -1,3 +1,6 @@
+import itertools
+import uuid
+from collections import Counter
 from datetime import timedelta
 from types import SimpleNamespace
 
@@ -5,7 +8,15 @@ import pytest
 from sqlmodel import Session, select
 
 from backend.database.db_models import League
-from backend.tasks.simulation_task import aggregate_simulation_results, run_simulation
+from backend.tasks.code_store import store_code_blobs
+from backend.tasks.simulation_task import (
+    aggregate_simulation_results,
+    enqueue_sharded_simulation,
+    merge_simulation_shards,
+    run_simulation,
+    run_simulation_shard,
+    split_simulations,
+)
 from backend.time_utils import utc_now
 
 
@@ -122,6 +133,20 @@ def test_run_simulation_direct_success(db_session, test_league):
     assert "strategies" in sim
 
 
+def test_run_simulation_direct_decision_profile(db_session, test_league):
+    result = run_simulation(
+        league_id=test_league.id,
+        game_name="prisoners_dilemma",
+        num_simulations=2,
+    )
+    sim = result["simulation_results"]
+    profile = sim["decision_profile"]
+    assert set(profile["players"]) == set(sim["total_points"])
+    assert all(p["count"] > 0 for p in profile["players"].values())
+    assert profile["engine_ms"] >= 0
+    assert "decision_profile_state" in sim
+
+
 def test_run_simulation_direct_with_player_feedback(db_session, test_league):
     result = run_simulation(
         league_id=test_league.id,
@@ -152,6 +177,91 @@ def test_run_simulation_direct_with_submissions(db_session, test_league):
     assert set(points) == {"good_team"}  # broken_team failed construction
 
 
+def test_run_simulation_direct_with_submission_refs(db_session, test_league):
+    """The worker resolves {team: digest} refs from the code store."""
+    refs = store_code_blobs({"TeamA": COLLUDER_CODE, "TeamB": COLLUDER_CODE})
+    result = run_simulation(
+        league_id=test_league.id,
+        game_name="prisoners_dilemma",
+        submission_refs=refs,
+        num_simulations=2,
+    )
+    assert result["status"] == "success"
+    assert set(result["simulation_results"]["total_points"]) == {"TeamA", "TeamB"}
+
+
+def test_run_simulation_direct_expired_submission_refs(db_session, test_league):
+    result = run_simulation(
+        league_id=test_league.id,
+        game_name="prisoners_dilemma",
+        submission_refs={"TeamA": "0" * 64},
+        num_simulations=2,
+    )
+    assert result["status"] == "error"
+    assert "TeamA" in result["message"]
+
+
+SLOW_CODE = """
+import time
+from games.prisoners_dilemma.player import Player
+
+class CustomPlayer(Player):
+    def make_decision(self, game_state):
+        time.sleep(0.005)
+        return 'collude'
+"""
+
+
+def test_run_simulation_direct_disqualifies_slow_agent(
+    monkeypatch, db_session, test_league
+):
+    """An agent over its per-decision budget is dropped; the run goes on."""
+    monkeypatch.setattr("backend.tasks.decision_budget.DECISION_BUDGET_MS", 1)
+    monkeypatch.setattr("backend.tasks.decision_budget.DECISION_MAX_OVERRUNS", 2)
+    result = run_simulation(
+        league_id=test_league.id,
+        game_name="prisoners_dilemma",
+        submissions={
+            "fast_a": COLLUDER_CODE,
+            "fast_b": COLLUDER_CODE,
+            "slow_team": SLOW_CODE,
+        },
+        num_simulations=4,
+        player_feedback=True,
+    )
+    assert result["status"] == "success"
+    sim = result["simulation_results"]
+    assert set(sim["disqualified"]) == {"slow_team"}
+    assert "per-decision budget" in sim["disqualified"]["slow_team"]
+    assert sim["num_simulations"] == 4
+    assert sim["total_points"]["fast_a"] > 0
+    # Disqualified in the feedback game, so it never reached the simulations.
+    assert "slow_team" not in sim["decision_profile"]["players"]
+
+
+def test_run_simulation_direct_counts_only_kept_games(
+    monkeypatch, db_session, test_league
+):
+    """The game a disqualification breaks off is not in num_simulations."""
+    monkeypatch.setattr("backend.tasks.decision_budget.DECISION_BUDGET_MS", 1)
+    monkeypatch.setattr("backend.tasks.decision_budget.DECISION_MAX_OVERRUNS", 2)
+    result = run_simulation(
+        league_id=test_league.id,
+        game_name="prisoners_dilemma",
+        submissions={
+            "fast_a": COLLUDER_CODE,
+            "fast_b": COLLUDER_CODE,
+            "slow_team": SLOW_CODE,
+        },
+        num_simulations=4,
+    )
+    assert result["status"] == "success"
+    sim = result["simulation_results"]
+    assert set(sim["disqualified"]) == {"slow_team"}
+    assert sim["num_simulations"] == 3
+    assert sim["discarded_games"] == 1
+
+
 def test_run_simulation_direct_empty_submissions(db_session, test_league):
     """No submissions (empty or None) keeps the game's validation players."""
     for submissions in ({}, None):
@@ -209,6 +319,42 @@ def test_run_simulation_direct_simulation_error(monkeypatch, db_session):
     assert "Error running simulations" in result["message"]
 
 
+def test_run_simulation_until_stable_stops_early(monkeypatch, db_session):
+    """A clearly separated ranking stops long before num_simulations and
+    reports a confidence interval per team."""
+    import random
+
+    rng = random.Random(5)
+
+    class NoisyGame(_StubGame):
+        def play_game(self, custom_rewards=None):
+            return {"points": {"strong": 10 + rng.random(), "weak": rng.random()}}
+
+    _stub_factory(monkeypatch, NoisyGame)
+    result = run_simulation(
+        league_id=999_999,
+        game_name="prisoners_dilemma",
+        num_simulations=5000,
+        until_stable=True,
+    )
+    sim = result["simulation_results"]
+    assert sim["stable"] is True
+    assert sim["num_simulations"] < 100
+    low, high = sim["confidence_intervals"]["strong"]
+    assert low <= sim["total_points"]["strong"] <= high
+
+
+def test_run_simulation_without_until_stable_runs_everything(monkeypatch, db_session):
+    _stub_factory(monkeypatch, _StubGame)
+    result = run_simulation(
+        league_id=999_999, game_name="prisoners_dilemma", num_simulations=40
+    )
+    sim = result["simulation_results"]
+    assert sim["num_simulations"] == 40
+    assert sim["confidence"] == 0.95
+    assert "stub" in sim["confidence_intervals"]
+
+
 def test_aggregate_simulation_results_success():
     """Test successful aggregation of simulation results"""
     simulation_results = [
@@ -226,3 +372,344 @@ def test_aggregate_simulation_results_success():
     assert result["total_points"] == {"player1": 25, "player2": 45}
     assert result["num_simulations"] == 2
     assert "table" in result
+
+
+# --- Sharded runs -------------------------------------------------------------
+
+
+def test_split_simulations():
+    assert split_simulations(10, 3) == [4, 3, 3]
+    assert split_simulations(2, 8) == [1, 1]  # never an empty shard
+    assert split_simulations(5, 1) == [5]
+
+
+def test_run_simulation_shard_direct(db_session, test_league):
+    """A shard is a plain run with its own seed and a clipped budget."""
+    result = run_simulation_shard(
+        league_id=test_league.id,
+        game_name="prisoners_dilemma",
+        num_simulations=3,
+        seed=1234,
+    )
+    assert result["status"] == "success"
+    assert result["simulation_results"]["num_simulations"] == 3
+
+
+def test_run_simulation_direct_seed_replays_run(db_session, test_league):
+    """The same seed gives the same dice, hence the same greedy pig totals."""
+    runs = [
+        run_simulation(
+            league_id=test_league.id,
+            game_name="greedy_pig",
+            num_simulations=5,
+            seed=seed,
+        )["simulation_results"]["total_points"]
+        for seed in (99, 99, 100)
+    ]
+    assert runs[0] == runs[1]
+    assert runs[0] != runs[2]
+
+
+def _tagged(code):
+    """`code` made unique to this test run, so no stored pairing matches it."""
+    return f"# {uuid.uuid4().hex}\n{code}"
+
+
+# Breakthrough agents whose matches end the same wherever they start: a
+# runner sidesteps the defender's row, then runs for the goal; as defender it
+# stays put, like a stayer does in both roles.
+RUNNER_CODE = """
+from games.breakthrough.player import Player
+
+class CustomPlayer(Player):
+    def make_decision(self, game_state):
+        if game_state["role"] == "defender":
+            return "STAY"
+        if game_state["turn"] == 1:
+            y, opp_y = game_state["my_pos"][1], game_state["opp_pos"][1]
+            return "N" if y + 1 != opp_y else "S"
+        return "E"
+"""
+
+STAYER_CODE = """
+from games.breakthrough.player import Player
+
+class CustomPlayer(Player):
+    def make_decision(self, game_state):
+        return "STAY"
+"""
+
+
+def _delta_run(test_league, submissions, game_name="breakthrough", **kwargs):
+    return run_simulation(
+        league_id=test_league.id,
+        game_name=game_name,
+        submissions=submissions,
+        num_simulations=3,
+        delta=True,
+        **kwargs,
+    )
+
+
+def test_delta_run_replays_only_changed_pairings(db_session, test_league):
+    submissions = {f"team_{i}": _tagged(RUNNER_CODE) for i in range(4)}
+    submissions["stayer"] = _tagged(STAYER_CODE)
+
+    first = _delta_run(test_league, submissions)
+    assert first["status"] == "success"
+    assert first["simulation_results"]["delta"] == {"pairings": 10, "replayed": 10}
+
+    again = _delta_run(test_league, submissions)
+    assert again["simulation_results"]["delta"] == {"pairings": 10, "replayed": 0}
+    assert (
+        again["simulation_results"]["total_points"]
+        == first["simulation_results"]["total_points"]
+    )
+
+    submissions["stayer"] = _tagged(RUNNER_CODE)
+    resubmitted = _delta_run(test_league, submissions)
+    sim = resubmitted["simulation_results"]
+    assert sim["delta"] == {"pairings": 10, "replayed": 4}
+    # Five runners: each breaks through in every match it attacks, 4
+    # opponents x 3 passes, and all score alike.
+    assert len(set(sim["total_points"].values())) == 1
+    assert sim["table"]["breakthroughs"] == {name: 12 for name in submissions}
+
+
+def test_delta_run_matches_the_round_robin_for_independent_pairings(
+    db_session, test_league
+):
+    """Deterministic agents that ignore the rest of the league score the same
+    whether their pairings are played together or one at a time."""
+    submissions = {
+        "a": _tagged(RUNNER_CODE),
+        "b": _tagged(RUNNER_CODE),
+        "c": _tagged(STAYER_CODE),
+    }
+    full = run_simulation(
+        league_id=test_league.id,
+        game_name="breakthrough",
+        submissions=submissions,
+        num_simulations=3,
+    )
+    delta = _delta_run(test_league, submissions)
+    assert (
+        delta["simulation_results"]["total_points"]
+        == full["simulation_results"]["total_points"]
+    )
+
+
+def test_delta_run_stores_pairings_finished_before_the_budget(
+    monkeypatch, db_session, test_league
+):
+    submissions = {f"team_{i}": _tagged(RUNNER_CODE) for i in range(4)}
+    monkeypatch.setattr(
+        "backend.tasks.simulation_task.SIMULATION_TIME_BUDGET_SECONDS", 0
+    )
+    cut = _delta_run(test_league, submissions)
+    assert cut["status"] == "error"
+    assert "replaying 1 of 6" in cut["message"]
+
+    monkeypatch.undo()
+    resumed = _delta_run(test_league, submissions)
+    assert resumed["simulation_results"]["delta"] == {"pairings": 6, "replayed": 5}
+
+
+FIELD_WATCHER_CODE = """
+from games.prisoners_dilemma.player import Player
+
+class CustomPlayer(Player):
+    def make_decision(self, game_state):
+        # Colludes one on one, defects as soon as it sees a crowd.
+        return 'defect' if len(game_state['all_history']) > 2 else 'collude'
+"""
+
+
+def test_delta_run_rejects_agents_that_see_the_whole_field(db_session, test_league):
+    """A prisoners' dilemma agent reads all_history, so its pairings played one
+    at a time would rank the league differently from the round robin."""
+    submissions = {
+        "watcher": _tagged(FIELD_WATCHER_CODE),
+        "a": _tagged(COLLUDER_CODE),
+        "b": _tagged(COLLUDER_CODE),
+    }
+
+    def standings(teams):
+        return run_simulation(
+            league_id=test_league.id,
+            game_name="prisoners_dilemma",
+            submissions={name: submissions[name] for name in teams},
+            num_simulations=3,
+        )["simulation_results"]["total_points"]
+
+    full = standings(submissions)
+    pairings_alone = Counter()
+    for pair in itertools.combinations(submissions, 2):
+        pairings_alone.update(standings(pair))
+    assert full["watcher"] > full["a"] == full["b"]
+    assert pairings_alone["watcher"] == pairings_alone["a"] == pairings_alone["b"]
+
+    delta = _delta_run(test_league, submissions, game_name="prisoners_dilemma")
+    assert delta["status"] == "error"
+    assert "pairwise" in delta["message"]
+
+
+def test_delta_run_needs_a_pairwise_game(db_session, test_league):
+    result = run_simulation(
+        league_id=test_league.id,
+        game_name="greedy_pig",
+        num_simulations=3,
+        delta=True,
+    )
+    assert result["status"] == "error"
+    assert "pairwise" in result["message"]
+
+
+def test_run_simulation_rescores_recorded_placements(db_session, test_league):
+    """One seeded run under several reward schemes scores like separate runs."""
+    other = [5, 3, 1, 0, 0, 0, 0]
+
+    def run(**kwargs):
+        return run_simulation(
+            league_id=test_league.id,
+            game_name="greedy_pig",
+            num_simulations=20,
+            seed=5,
+            **kwargs,
+        )["simulation_results"]
+
+    recorded = run(reward_schemes=[other])
+    assert "placements" in recorded
+    assert recorded["rescored"][0]["rewards"] == other
+    assert recorded["rescored"][0]["total_points"] == pytest.approx(
+        run(custom_rewards=other)["total_points"]
+    )
+    assert "placements" not in run()
+
+
+def test_record_placements_is_ignored_by_other_games(db_session, test_league):
+    sim = run_simulation(
+        league_id=test_league.id,
+        game_name="prisoners_dilemma",
+        num_simulations=2,
+        record_placements=True,
+    )["simulation_results"]
+    assert "placements" not in sim
+
+
+def test_run_simulation_shard_past_deadline_runs_one_game(db_session, test_league):
+    """A deadline already behind us still yields one whole game, then stops."""
+    import time
+
+    result = run_simulation_shard(
+        league_id=test_league.id,
+        game_name="prisoners_dilemma",
+        num_simulations=5,
+        deadline=time.time() - 1,
+    )
+    sim = result["simulation_results"]
+    assert sim["num_simulations"] == 1
+    assert sim["capped"] is True
+
+
+def test_merge_simulation_shards_sums_points():
+    shards = [
+        {
+            "status": "success",
+            "feedback": "first",
+            "player_feedback": {"a": ["hi"]},
+            "simulation_results": {
+                "total_points": {"a": 3, "b": 1},
+                "num_simulations": 2,
+                "requested_simulations": 2,
+                "table": {"defections": {"a": 1}},
+                "capped": False,
+                "strategies": {"a": "always"},
+            },
+        },
+        {
+            "status": "success",
+            "feedback": "No feedback",
+            "player_feedback": "No player feedback",
+            "simulation_results": {
+                "total_points": {"a": 2, "b": 5},
+                "num_simulations": 1,
+                "requested_simulations": 2,
+                "table": {"defections": {"a": 2}},
+                "capped": True,
+                "strategies": {"a": "always"},
+                "disqualified": {"b": "too slow"},
+            },
+        },
+    ]
+    result = merge_simulation_shards(shards, game_name="prisoners_dilemma")
+    assert result["status"] == "success"
+    assert result["feedback"] == "first"
+    sim = result["simulation_results"]
+    assert sim["total_points"] == {"a": 5, "b": 6}
+    assert sim["num_simulations"] == 3
+    assert sim["requested_simulations"] == 4
+    assert sim["capped"] is True
+    assert sim["table"] == {"defections": {"a": 2}}
+    assert sim["disqualified"] == {"b": "too slow"}
+
+
+def test_merge_simulation_shards_rescores_summed_placements():
+    def shard(points, placements):
+        return {
+            "status": "success",
+            "simulation_results": {
+                "total_points": points,
+                "num_simulations": 1,
+                "table": {},
+                "placements": placements,
+            },
+        }
+
+    result = merge_simulation_shards(
+        [
+            shard({"a": 10, "b": 0}, {"a": {"0": 1}, "b": {"1": 1}}),
+            shard({"a": 5, "b": 5}, {"a": {"0-1": 1}, "b": {"0-1": 1}}),
+        ],
+        game_name="greedy_pig",
+        reward_schemes=[[4, 2]],
+    )
+    sim = result["simulation_results"]
+    assert sim["placements"] == {"a": {"0": 1, "0-1": 1}, "b": {"1": 1, "0-1": 1}}
+    assert sim["rescored"] == [{"rewards": [4, 2], "total_points": {"a": 7, "b": 5}}]
+
+
+def test_merge_simulation_shards_propagates_error():
+    shards = [
+        {"status": "success", "simulation_results": {"total_points": {}, "num_simulations": 1}},
+        {
+            "status": "error",
+            "message": "Error running simulations: boom",
+            "simulation_results": {"total_points": {}, "num_simulations": 1},
+        },
+    ]
+    result = merge_simulation_shards(shards, game_name="prisoners_dilemma")
+    assert result["status"] == "error"
+    assert result["message"] == "Error running simulations: boom"
+
+
+def test_sharded_simulation_workflow(celery_workers, test_league: League):
+    """The shard chord runs on the simulation queue and merges every game."""
+    result = enqueue_sharded_simulation(
+        league_id=test_league.id,
+        game_name="prisoners_dilemma",
+        submissions=None,
+        num_simulations=9,
+        custom_rewards=None,
+        player_feedback=True,
+        shards=3,
+    ).get(timeout=60)
+    assert result["status"] == "success"
+    assert result["simulation_results"]["num_simulations"] == 9
+    assert result["feedback"] != "No feedback"
+    # Every shard's decision timings are folded into one profile.
+    profile = result["simulation_results"]["decision_profile"]
+    state = result["simulation_results"]["decision_profile_state"]
+    assert sum(p["count"] for p in profile["players"].values()) == sum(
+        acc[0] for acc in state["players"].values()
+    )
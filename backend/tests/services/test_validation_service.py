@@ -60,6 +60,67 @@ class CustomPlayer(Player):
     assert "thinking..." in result["stdout"]
 
 
+def test_run_validation_direct_reports_decision_profile():
+    slow_code = """
+import time
+from games.prisoners_dilemma.player import Player
+
+class CustomPlayer(Player):
+    def make_decision(self, game_state):
+        time.sleep(0.001)
+        return 'collude'
+"""
+    result = run_validation(
+        code=slow_code,
+        game_name="prisoners_dilemma",
+        team_name="slow_team",
+    )
+    profile = result["simulation_results"]["decision_profile"]
+    slow = profile["players"]["slow_team"]
+    assert slow["count"] > 0
+    assert 1.0 <= slow["p50_ms"] <= slow["p99_ms"] <= slow["max_ms"]
+    assert profile["agent_ms"] >= slow["total_ms"]
+    assert profile["engine_ms"] >= 0
+
+
+def test_run_validation_direct_profiles_only_the_simulations():
+    """The verbose feedback game stays out of the profile, as in a league run."""
+    from backend.games.prisoners_dilemma.prisoners_dilemma import (
+        PrisonersDilemmaGame,
+    )
+
+    result = run_validation(
+        code=VALID_CODE, game_name="prisoners_dilemma", team_name="profiled"
+    )
+    profile = result["simulation_results"]["decision_profile"]
+    # 5 bots, 5 rounds each, per validation pass.
+    passes = PrisonersDilemmaGame.validation_simulations
+    assert profile["players"]["profiled"]["count"] == passes * 5 * 5
+
+
+def test_run_validation_direct_decision_budget_names_slow_agent(monkeypatch):
+    monkeypatch.setattr("backend.tasks.decision_budget.DECISION_BUDGET_MS", 1)
+    monkeypatch.setattr("backend.tasks.decision_budget.DECISION_MAX_OVERRUNS", 2)
+    slow_code = """
+import time
+from games.prisoners_dilemma.player import Player
+
+class CustomPlayer(Player):
+    def make_decision(self, game_state):
+        time.sleep(0.005)
+        return 'collude'
+"""
+    result = run_validation(
+        code=slow_code,
+        game_name="prisoners_dilemma",
+        team_name="slow_team",
+    )
+    assert result["status"] == "error"
+    assert result["message"].startswith("Your agent consumes too much time - ")
+    assert "3 decisions over the 1 ms per-decision budget" in result["message"]
+    assert "make_decision" in result["traceback"]
+
+
 def test_run_validation_direct_soft_limit_chained():
     """The soft limit interrupting an agent call is re-raised by the engine as
     ValueError; the chain walk must still classify the run as a timeout."""
@@ -1,4 +1,5 @@
 import pytest
+import copy
 import random
 from unittest.mock import patch, MagicMock
 
@@ -41,6 +42,13 @@ def test_game(test_league):
     return game
 
 
+@pytest.fixture
+def mock_randint(test_game):
+    """Control the dice: they come from the game's private RNG, not `random`."""
+    with patch.object(test_game._rng, "randint") as mock:
+        yield mock
+
+
 def test_game_initialization(test_league):
     """Test that the game initializes properly"""
     game = GreedyPigGame(test_league)
@@ -202,7 +210,6 @@ def test_assign_points_unbanked_money_is_lost(test_game):
     assert results["points"]["Player3"] == 4
 
 
-@patch('random.randint')
 def test_play_round_roll_one(mock_randint, test_game):
     """Test what happens when player rolls a 1"""
     # Make the dice roll return 1
@@ -218,7 +225,6 @@ def test_play_round_roll_one(mock_randint, test_game):
     assert test_game.players[1].unbanked_money == 0
 
 
-@patch('random.randint')
 def test_play_round_bank_decision(mock_randint, test_game):
     """Test player banking decision during a round"""
     # Make the dice roll return 6 to avoid rolling a 1
@@ -235,7 +241,6 @@ def test_play_round_bank_decision(mock_randint, test_game):
     assert all(not p.has_banked_this_turn for p in test_game.players)
 
 
-@patch('random.randint')
 def test_play_game_win_condition(mock_randint, test_game):
     """Test game ends once a player has BANKED 100 points"""
     # Make the dice always roll 6 for faster testing
@@ -258,7 +263,6 @@ def test_play_game_win_condition(mock_randint, test_game):
     assert results["points"]["TestRiskyPlayer"] == 0
 
 
-@patch('random.randint')
 def test_no_automated_banking_at_100(mock_randint, test_game):
     """Unbanked money over 100 does NOT end the game — you must bank to win"""
     # TestRiskyPlayer rides to 102 unbanked, then a 1 wipes it out
@@ -272,7 +276,6 @@ def test_no_automated_banking_at_100(mock_randint, test_game):
     assert test_game.players[1].unbanked_money == 0
 
 
-@patch('random.randint')
 def test_failsafe_bank_at_150(mock_randint, test_game):
     """A player holding 150 unbanked is force-banked"""
     # 25 rolls of 6 → TestRiskyPlayer reaches exactly 150 unbanked
@@ -340,4 +343,77 @@ def test_run_single_game_with_feedback(test_game):
     # Check that feedback was collected as dict
     assert isinstance(result["feedback"], dict)
     assert result["feedback"]["game"] == "greedy_pig"
-    assert len(result["feedback"]["rounds"]) > 0
\ No newline at end of file
+    assert len(result["feedback"]["rounds"]) > 0
+
+class StateRecordingPlayer(Player):
+    """Keeps every game_state it is handed, the unbanked money it showed at
+    the time, and ranks itself on each."""
+
+    def __init__(self):
+        super().__init__()
+        self.states = []
+        self.unbanked_seen = []
+        self.ranks = []
+
+    def make_decision(self, game_state):
+        self.states.append(game_state)
+        self.unbanked_seen.append(dict(game_state["unbanked_money"]))
+        self.ranks.append(self.my_rank(game_state))
+        return "continue"
+
+
+def test_players_share_one_read_only_snapshot_per_roll(mock_randint, test_game):
+    """Every decision on a roll reads the same maps, with the roll added for
+    the seats up to the decider's own; agents cannot write to them."""
+    mock_randint.side_effect = [4, 1]
+    first, second = StateRecordingPlayer(), StateRecordingPlayer()
+    first.name, second.name = "First", "Second"
+    test_game.players = [first, second]
+    test_game.active_players = list(test_game.players)
+
+    test_game.play_round()
+
+    (state_1,), (state_2,) = first.states, second.states
+    assert state_1["unbanked_money"] is state_2["unbanked_money"]
+    assert first.unbanked_seen == [{"First": 4, "Second": 0}]
+    assert second.unbanked_seen == [{"First": 4, "Second": 4}]
+    with pytest.raises(TypeError):
+        state_1["banked_money"]["First"] = 100
+    # Copies are the agent's own to change
+    copied = copy.deepcopy(state_1)
+    copied["banked_money"]["First"] = 100
+    assert state_2["banked_money"]["First"] == 0
+
+
+def test_my_rank_uses_the_rolls_ranking(mock_randint, test_game):
+    """The precomputed ranking matches ranking a plain dict of the same state."""
+    mock_randint.side_effect = [5, 1]
+    leader, trailer = StateRecordingPlayer(), StateRecordingPlayer()
+    leader.name, trailer.name = "Leader", "Trailer"
+    leader.banked_money, trailer.banked_money = 30, 10
+    test_game.players = [trailer, leader]
+    test_game.active_players = list(test_game.players)
+
+    test_game.play_round()
+
+    assert leader.ranks == [1] and trailer.ranks == [2]
+    plain = dict(trailer.states[0])
+    assert trailer.my_rank(plain) == 2 and leader.my_rank(plain) == 1
+
+
+def test_ranking_follows_the_roll_seat_by_seat(mock_randint, test_game):
+    """A seat that overtakes another with the roll ranks ahead of it from
+    its own turn on, as a ranking of a plain dict of the same state would."""
+    mock_randint.side_effect = [4, 1]
+    first, second = StateRecordingPlayer(), StateRecordingPlayer()
+    first.name, second.name = "First", "Second"
+    first.banked_money, second.banked_money = 10, 12
+    test_game.players = [first, second]
+    test_game.active_players = list(test_game.players)
+
+    test_game.play_round()
+
+    # First: 14 against Second's 12; then Second: 16 against 14.
+    assert first.ranks == [1] and second.ranks == [1]
+    plain = dict(second.states[0])
+    assert first.my_rank(plain) == 2 and second.my_rank(plain) == 1
@@ -214,6 +214,17 @@ def test_check_winner_diagonal(test_game):
     assert test_game.check_winner() is True
 
 
+def test_every_winning_set_is_a_line_on_the_bitboard(test_game):
+    """Shift-based win detection agrees with the table of 69 lines"""
+    for winning_set in test_game.winning_sets:
+        test_game.initialize_board()
+        for pos in winning_set:
+            test_game.make_move(pos, 'O')
+        assert test_game.check_winner() is True
+    assert all(p.all_winning_sets is test_game.players[0].all_winning_sets
+               for p in test_game.players)
+
+
 def test_is_board_full(test_game):
     """Test detecting a full board"""
     # Empty board should not be full
@@ -222,7 +233,7 @@ def test_is_board_full(test_game):
     # Fill the board
     for col in range(1, 8):
         for row in string.ascii_uppercase[:6]:
-            test_game.board[f"{col}{row}"] = 'X'
+            test_game.make_move(f"{col}{row}", 'X')
     
     # Now board should be full
     assert test_game.is_board_full() is True
@@ -231,7 +242,7 @@ def test_is_board_full(test_game):
     test_game.initialize_board()
     for col in range(1, 8):
         for row in string.ascii_uppercase[:5]:  # Leave top row empty
-            test_game.board[f"{col}{row}"] = 'X'
+            test_game.make_move(f"{col}{row}", 'X')
     
     # Board should not be full
     assert test_game.is_board_full() is False
@@ -364,6 +375,16 @@ def test_run_simulations(test_game):
     assert results["num_simulations"] == 2 * n * (n - 1)
 
 
+def test_board_is_only_copied_for_feedback(test_game):
+    """Without verbose feedback a match records no per-move board copies"""
+    test_game.verbose = False
+    player1, player2 = test_game.players[:2]
+    match_result = test_game.play_match(player1, player2)
+    assert match_result["moves"] == []
+    assert match_result["final_board"] is None
+    assert match_result["winner"] in [player1.name, player2.name, "draw"]
+
+
 def test_player_decision_exception(test_game):
     """A player whose make_decision raises aborts the match with ValueError"""
     player1, player2 = test_game.players[:2]
@@ -1,4 +1,5 @@
 import pytest
+import copy
 import random
 from unittest.mock import patch, MagicMock
 
@@ -336,4 +337,89 @@ def test_game_instructions():
     )
     assert "Game Objective" in PrisonersDilemmaGame.game_instructions
     assert "Scoring" in PrisonersDilemmaGame.game_instructions
-    assert "Strategy Tips" in PrisonersDilemmaGame.game_instructions
\ No newline at end of file
+    assert "Strategy Tips" in PrisonersDilemmaGame.game_instructions
+
+def test_game_state_histories_are_read_only_views(test_game):
+    """States share the history lists instead of copying them: read-only,
+    list-like, fixed at the length they had when the state was built."""
+    colluder, defector = test_game.players[:2]
+    test_game.play_pairing(colluder, defector)
+    state = test_game.get_game_state(colluder.name, defector.name, 6)
+    history = test_game.histories[str(defector.name)][str(colluder.name)]
+    history.append("collude")  # a later round
+
+    opponent_history = state["opponent_history"]
+    assert len(opponent_history) == 5
+    assert opponent_history == ["defect"] * 5
+    assert opponent_history[-1] == "defect"
+    assert opponent_history[-3:] == ["defect"] * 3
+    assert opponent_history.count("defect") == 5
+    assert opponent_history + ["collude"] == ["defect"] * 5 + ["collude"]
+    assert ["collude"] + opponent_history == ["collude"] + ["defect"] * 5
+    assert opponent_history * 2 == ["defect"] * 10
+    assert 2 * opponent_history == ["defect"] * 10
+    assert opponent_history.copy() == ["defect"] * 5
+    assert type(opponent_history.copy()) is list
+    assert repr(opponent_history) == repr(["defect"] * 5)
+    assert not hasattr(opponent_history, "append")
+    with pytest.raises(TypeError):
+        state["all_history"][str(colluder.name)] = {}
+    with pytest.raises(TypeError):
+        state["scores"][str(colluder.name)] = 100
+    copied = copy.deepcopy(state)["all_history"][str(colluder.name)]
+    assert copied == {str(defector.name): ["collude"] * 5}
+    assert isinstance(copied[str(defector.name)], list)
+
+
+def test_opponent_summary_counts_decisions_across_pairings(test_game):
+    colluder, defector, tit_for_tat = test_game.players
+    test_game.play_pairing(defector, colluder)
+    test_game.play_pairing(defector, tit_for_tat)
+
+    state = test_game.get_game_state(colluder.name, defector.name, 1)
+    assert state["opponent_summary"] == {"collude": 0, "defect": 10}
+    assert test_game.decision_counts[str(tit_for_tat.name)] == {
+        "collude": 1,
+        "defect": 4,
+    }
+
+
+ECHO_STATE_CODE = """
+from games.prisoners_dilemma.player import Player
+
+class CustomPlayer(Player):
+    def make_decision(self, game_state):
+        history = game_state["opponent_history"]
+        self.add_feedback(history)
+        self.add_feedback(game_state["my_history"].copy() + ["next"] * 2)
+        self.add_feedback({
+            "all_history": game_state["all_history"],
+            "scores": game_state["scores"],
+        })
+        return "collude"
+"""
+
+
+def test_state_echoed_into_feedback_is_plain_json(db_session):
+    """Views an agent echoes into its feedback reach the result as the plain
+    lists and dicts they stand for, snapshotted when it echoed them."""
+    from kombu.utils.json import dumps, loads
+
+    from backend.tasks.simulation_task import run_simulation
+
+    result = run_simulation(
+        league_id=1,
+        game_name="prisoners_dilemma",
+        submissions={"Echo": ECHO_STATE_CODE, "Other": ECHO_STATE_CODE},
+        num_simulations=2,
+        player_feedback=True,
+    )
+    assert result["status"] == "success"
+    decoded = loads(dumps(result))
+
+    entry = decoded["player_feedback"]["Echo"][1]
+    history, mine, state = entry["messages"]
+    assert history == ["collude"]
+    assert mine == ["collude", "next", "next"]
+    assert state["all_history"]["Echo"] == {"Other": ["collude"]}
+    assert state["scores"] == {"Echo": 4, "Other": 4}
@@ -0,0 +1,72 @@
+"""Content-addressed code blobs: store once, refresh TTL, resolve in the worker.
+
+These talk to the real valkey; each test stores its own uuid-tagged code so
+runs never collide.
+"""
+
+import uuid
+
+import pytest
+
+from backend.tasks import code_store
+from backend.tasks.code_store import (
+    CODE_BLOB_TTL_SECONDS,
+    CodeBlobMissingError,
+    code_digest,
+    load_code_blobs,
+    store_code_blobs,
+)
+
+
+@pytest.fixture
+def code():
+    return f"# {uuid.uuid4().hex}\n"
+
+
+def test_round_trip(code):
+    refs = store_code_blobs({"alpha": code, "beta": code + "x = 1\n"})
+    assert refs["alpha"] == code_digest(code)
+    assert load_code_blobs(refs) == {"alpha": code, "beta": code + "x = 1\n"}
+
+
+def test_identical_code_is_stored_once(code):
+    refs = store_code_blobs({"alpha": code, "beta": code})
+    assert refs["alpha"] == refs["beta"]
+
+
+def test_store_refreshes_ttl_without_resending(code, monkeypatch):
+    store_code_blobs({"alpha": code})
+    key = code_store._blob_key(code_digest(code))
+    code_store._get_redis().expire(key, 5)
+
+    sent = []
+    real_redis = code_store._get_redis()
+    real_pipeline = real_redis.pipeline
+
+    def spying_pipeline(*args, **kwargs):
+        pipe = real_pipeline(*args, **kwargs)
+        real_set = pipe.set
+
+        def spy_set(*a, **k):
+            sent.append(a[0])
+            return real_set(*a, **k)
+
+        pipe.set = spy_set
+        return pipe
+
+    monkeypatch.setattr(real_redis, "pipeline", spying_pipeline)
+    store_code_blobs({"alpha": code})
+    assert sent == []
+    assert real_redis.ttl(key) > CODE_BLOB_TTL_SECONDS - 60
+
+
+def test_empty_submissions(code):
+    assert store_code_blobs({}) == {}
+    assert load_code_blobs({}) == {}
+
+
+def test_missing_blob_names_the_teams():
+    with pytest.raises(CodeBlobMissingError) as excinfo:
+        load_code_blobs({"alpha": code_digest(uuid.uuid4().hex)})
+    assert excinfo.value.team_names == ["alpha"]
+    assert "alpha" in str(excinfo.value)
@@ -0,0 +1,42 @@
+"""decision_budget: the watchdog stops a decision that runs past the hard limit."""
+
+import time
+
+import pytest
+
+from backend.games.decision_profile import DecisionBudgetExceeded, DecisionProfiler
+from backend.tasks import decision_budget
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    monkeypatch.setattr(decision_budget, "DECISION_HARD_LIMIT_MS", 100)
+    profiler = DecisionProfiler()
+    decision_budget.enforce(profiler)
+    yield profiler
+    profiler.set_budget(None)
+
+
+def _spin():
+    while True:
+        pass
+
+
+def test_watchdog_interrupts_a_spinning_agent(profiler):
+    start = time.perf_counter()
+    with pytest.raises(DecisionBudgetExceeded) as exc_info:
+        profiler.time("spinner", _spin)
+    assert time.perf_counter() - start < 1.0
+    assert exc_info.value.player_name == "spinner"
+    assert "spinner" in profiler.disqualified
+
+
+def test_watchdog_interrupts_a_sleeping_agent(profiler):
+    with pytest.raises(DecisionBudgetExceeded):
+        profiler.time("sleeper", time.sleep, 5)
+
+
+def test_watchdog_leaves_fast_agents_alone(profiler):
+    for _ in range(3):
+        assert profiler.time("quick", time.sleep, 0.06) is None
+    assert profiler.disqualified == {}
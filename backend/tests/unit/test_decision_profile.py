@@ -0,0 +1,113 @@
+"""DecisionProfiler: per-player counts, bucketed percentiles, shard merging,
+per-decision budgets."""
+
+import json
+
+import pytest
+
+from backend.games.decision_profile import (
+    DecisionBudgetExceeded,
+    DecisionProfiler,
+    _bucket,
+    _bucket_upper,
+)
+
+
+@pytest.mark.parametrize("ns", [0, 1, 15, 16, 17, 1000, 123_456, 9_876_543_210])
+def test_bucket_bounds_are_within_an_eighth(ns):
+    upper = _bucket_upper(_bucket(ns))
+    assert ns <= upper <= ns + ns / 8 + 1
+
+
+def _fill(profiler, name, durations_ns, monkeypatch):
+    """Record exact durations by faking the clock around each call."""
+    ticks = []
+    for ns in durations_ns:
+        ticks += [0, ns]
+    clock = iter(ticks)
+    monkeypatch.setattr(
+        "backend.games.decision_profile.perf_counter_ns", lambda: next(clock)
+    )
+    for _ in durations_ns:
+        profiler.time(name, lambda: None)
+    monkeypatch.undo()
+
+
+def test_summary_percentiles(monkeypatch):
+    profiler = DecisionProfiler()
+    durations = [1_000_000] * 98 + [50_000_000, 80_000_000]
+    _fill(profiler, "alpha", durations, monkeypatch)
+    alpha = profiler.summary()["players"]["alpha"]
+    assert alpha["count"] == 100
+    assert alpha["max_ms"] == 80.0
+    assert 1.0 <= alpha["p50_ms"] <= 1.125
+    assert 50.0 <= alpha["p99_ms"] <= 56.25
+    assert alpha["total_ms"] == pytest.approx(228.0)
+
+
+def test_time_returns_the_result_and_records_failures():
+    profiler = DecisionProfiler()
+    assert profiler.time("alpha", lambda x: x * 2, 21) == 42
+
+    def boom():
+        raise RuntimeError("agent bug")
+
+    with pytest.raises(RuntimeError):
+        profiler.time("alpha", boom)
+    assert profiler.summary()["players"]["alpha"]["count"] == 2
+
+
+def test_engine_time_is_wall_minus_agent():
+    profiler = DecisionProfiler()
+    profiler.time("alpha", sum, range(1000))
+    summary = profiler.summary()
+    assert summary["engine_ms"] == pytest.approx(
+        summary["wall_ms"] - summary["agent_ms"], abs=1e-3
+    )
+
+
+def test_merged_states_survive_json(monkeypatch):
+    first, second = DecisionProfiler(), DecisionProfiler()
+    _fill(first, "alpha", [2_000_000] * 3, monkeypatch)
+    _fill(second, "alpha", [4_000_000], monkeypatch)
+    _fill(second, "beta", [1_000], monkeypatch)
+    states = [json.loads(json.dumps(p.state())) for p in (first, second)]
+
+    merged = DecisionProfiler.merged(states)
+    summary = merged.summary()
+    assert summary["players"]["alpha"]["count"] == 4
+    assert summary["players"]["alpha"]["max_ms"] == 4.0
+    assert summary["players"]["beta"]["count"] == 1
+    assert merged.wall_ns() == sum(s["wall_ns"] for s in states)
+
+
+def test_budget_disqualifies_after_max_overruns(monkeypatch):
+    profiler = DecisionProfiler()
+    profiler.set_budget(10, hard_limit_ms=1000, max_overruns=2)
+    _fill(profiler, "slow", [20_000_000, 1_000, 20_000_000], monkeypatch)
+    with pytest.raises(DecisionBudgetExceeded) as exc_info:
+        _fill(profiler, "slow", [30_000_000], monkeypatch)
+    monkeypatch.undo()
+    assert exc_info.value.player_name == "slow"
+    assert "3 decisions over the 10 ms" in exc_info.value.reason
+    summary = profiler.summary()
+    assert summary["players"]["slow"]["overruns"] == 3
+    assert summary["disqualified"] == {"slow": exc_info.value.reason}
+
+
+def test_budget_hard_limit_disqualifies_at_once(monkeypatch):
+    profiler = DecisionProfiler()
+    profiler.set_budget(10, hard_limit_ms=100, max_overruns=5)
+    with pytest.raises(DecisionBudgetExceeded, match="hard limit 100 ms"):
+        _fill(profiler, "stuck", [150_000_000], monkeypatch)
+
+
+def test_budget_survives_reset_and_merges():
+    profiler = DecisionProfiler()
+    profiler.set_budget(10, max_overruns=0)
+    profiler.disqualified["slow"] = "too slow"
+    profiler.reset()
+    state = json.loads(json.dumps(profiler.state()))
+    assert DecisionProfiler.merged([state]).summary()["disqualified"] == {
+        "slow": "too slow"
+    }
@@ -0,0 +1,58 @@
+"""Pairing cache: keying, storage and folding the matrix into standings.
+
+These talk to the real valkey; each test keys its pairings on uuid-tagged
+digests so runs never collide.
+"""
+
+import uuid
+
+import pytest
+
+from backend.tasks.pairing_cache import (
+    get_pairings,
+    matrix_totals,
+    pairing_key,
+    store_pairing,
+)
+
+
+@pytest.fixture
+def sides():
+    return ("TeamA", uuid.uuid4().hex), ("TeamB", uuid.uuid4().hex)
+
+
+def test_key_ignores_side_order(sides):
+    a, b = sides
+    assert pairing_key("prisoners_dilemma", None, 10, a, b) == pairing_key(
+        "prisoners_dilemma", None, 10, b, a
+    )
+
+
+def test_key_covers_code_team_rewards_and_passes(sides):
+    a, b = sides
+    key = pairing_key("prisoners_dilemma", None, 10, a, b)
+    assert key != pairing_key("prisoners_dilemma", None, 10, a, (b[0], "other"))
+    assert key != pairing_key("prisoners_dilemma", None, 10, a, ("TeamC", b[1]))
+    assert key != pairing_key("prisoners_dilemma", [4, 0, 6, 2], 10, a, b)
+    assert key != pairing_key("prisoners_dilemma", None, 20, a, b)
+    assert key != pairing_key("arena_champions", None, 10, a, b)
+
+
+def test_miss_then_hit(sides):
+    key = pairing_key("prisoners_dilemma", None, 10, *sides)
+    record = {"points": {"TeamA": 30, "TeamB": 5}}
+    assert get_pairings([key]) == [None]
+    store_pairing(key, record)
+    assert get_pairings([key]) == [record]
+
+
+def test_matrix_totals_sums_every_pairing():
+    total_points, table = matrix_totals(
+        [
+            {"points": {"A": 3, "B": 1}, "wins": {"A": 2, "B": 0}},
+            {"points": {"A": 2, "C": 2}, "wins": {"A": 1, "C": 1}},
+            {"points": {"B": 0, "C": 4}, "wins": {"B": 0, "C": 2}},
+        ]
+    )
+    assert total_points == {"A": 5, "B": 1, "C": 6}
+    assert table == {"wins": {"A": 3, "B": 0, "C": 3}}
@@ -0,0 +1,45 @@
+"""json-zlib result serializer: threshold compression and legacy JSON decode."""
+
+import json as stdlib_json
+
+from kombu.serialization import dumps, loads
+
+from backend.tasks.celery_app import celery_app
+from backend.tasks.result_serializer import (
+    COMPRESS_THRESHOLD_BYTES,
+    CONTENT_TYPE,
+    SERIALIZER_NAME,
+)
+
+
+def _round_trip(obj):
+    content_type, encoding, data = dumps(obj, serializer=SERIALIZER_NAME)
+    assert content_type == CONTENT_TYPE
+    return data, loads(data, content_type, encoding, accept=[CONTENT_TYPE])
+
+
+def test_small_payload_stays_plain_json():
+    data, decoded = _round_trip({"status": "success", "points": {"a": 1}})
+    assert stdlib_json.loads(data) == {"status": "success", "points": {"a": 1}}
+    assert decoded == {"status": "success", "points": {"a": 1}}
+
+
+def test_large_payload_is_compressed():
+    feedback = {"moves": [{"turn": i, "player": "alpha"} for i in range(5000)]}
+    plain = len(stdlib_json.dumps(feedback))
+    assert plain > COMPRESS_THRESHOLD_BYTES
+    data, decoded = _round_trip(feedback)
+    assert len(data) < plain / 5
+    assert decoded == feedback
+
+
+def test_plain_json_written_before_the_switch_still_decodes():
+    legacy = stdlib_json.dumps({"status": "success"}).encode()
+    assert loads(legacy, CONTENT_TYPE, "binary", accept=[CONTENT_TYPE]) == {
+        "status": "success"
+    }
+
+
+def test_celery_results_use_it():
+    assert celery_app.conf.result_serializer == SERIALIZER_NAME
+    assert SERIALIZER_NAME in celery_app.conf.accept_content
@@ -0,0 +1,111 @@
+"""Live simulation progress: per-shard publishing, merging, and early stop.
+
+These talk to the real valkey (the same broker the Celery tests use); each
+test works under its own uuid progress id so runs never collide.
+"""
+
+import uuid
+
+import pytest
+
+from backend.tasks import simulation_progress
+from backend.tasks.simulation_progress import (
+    ProgressReporter,
+    read_progress,
+    request_stop,
+)
+
+
+@pytest.fixture
+def progress_id():
+    return uuid.uuid4().hex
+
+
+def test_read_progress_none_before_first_publish(progress_id):
+    assert read_progress(progress_id) is None
+
+
+def test_shards_are_merged(progress_id):
+    first = ProgressReporter(progress_id, 0, 2, requested=10, budget_seconds=60)
+    second = ProgressReporter(progress_id, 1, 2, requested=10, budget_seconds=60)
+    first.add_result({"points": {"a": 3, "b": 1}})
+    second.add_result({"points": {"a": 1}})
+    first.publish(4, elapsed=2.0, sim_elapsed=2.0, state="running")
+    second.publish(2, elapsed=2.0, sim_elapsed=2.0, state="done")
+
+    progress = read_progress(progress_id)
+    assert progress["state"] == "running"
+    assert progress["games_completed"] == 6
+    assert progress["requested_simulations"] == 20
+    assert progress["total_points"] == {"a": 4, "b": 1}
+    # Shard 0: 6 games left at 0.5s each.
+    assert progress["projected_remaining_seconds"] == pytest.approx(3.0)
+
+
+def test_unstarted_shard_keeps_run_running(progress_id):
+    ProgressReporter(progress_id, 0, 3, requested=5, budget_seconds=60).publish(
+        5, elapsed=1.0, sim_elapsed=1.0, state="done"
+    )
+    assert read_progress(progress_id)["state"] == "running"
+
+
+def test_stop_flag(progress_id):
+    reporter = ProgressReporter(progress_id, 0, 1, requested=5, budget_seconds=60)
+    assert not reporter.stop_requested()
+    request_stop(progress_id)
+    assert reporter.stop_requested()
+
+
+def test_run_simulation_publishes_and_stops(db_session, monkeypatch, progress_id):
+    """A stop request ends the run at its next publish with whole games kept."""
+    from backend.tasks.simulation_task import run_simulation
+
+    monkeypatch.setattr(simulation_progress, "PROGRESS_EVERY_GAMES", 1)
+    request_stop(progress_id)
+    result = run_simulation(
+        league_id=1,
+        game_name="prisoners_dilemma",
+        num_simulations=50,
+        progress_id=progress_id,
+    )
+    sim = result["simulation_results"]
+    assert result["status"] == "success"
+    assert sim["stopped"] is True
+    assert sim["num_simulations"] == 1
+
+    progress = read_progress(progress_id)
+    assert progress["state"] == "stopped"
+    assert progress["games_completed"] == 1
+    assert progress["total_points"] == sim["total_points"]
+
+
+def test_early_failure_ends_the_runs_progress(progress_id):
+    """A run that fails before its first game still publishes a final state."""
+    from backend.tasks.simulation_task import run_simulation, run_simulation_shard
+
+    result = run_simulation(
+        league_id=1,
+        game_name="greedy_pig",
+        num_simulations=5,
+        progress_id=progress_id,
+        delta=True,
+    )
+    assert result["status"] == "error"
+    assert read_progress(progress_id)["state"] == "failed"
+
+    # A shard failing on its own counts as finished for the merged state.
+    other_id = uuid.uuid4().hex
+    ProgressReporter(other_id, 0, 2, requested=5, budget_seconds=60).publish(
+        5, elapsed=1.0, sim_elapsed=1.0, state="done"
+    )
+    result = run_simulation_shard(
+        league_id=1,
+        game_name="greedy_pig",
+        num_simulations=5,
+        progress_id=other_id,
+        shard=1,
+        shard_count=2,
+        submission_refs={"TeamA": "0" * 64},
+    )
+    assert result["status"] == "error"
+    assert read_progress(other_id)["state"] == "failed"
@@ -0,0 +1,88 @@
+"""Streaming simulation statistics: Welford accumulators, merging, stability."""
+
+import random
+import statistics
+
+import pytest
+
+from backend.tasks.simulation_stats import RunningStats, z_for_confidence
+
+
+def test_matches_batch_statistics():
+    rng = random.Random(7)
+    samples = [rng.gauss(10, 3) for _ in range(200)]
+    stats = RunningStats()
+    for x in samples:
+        stats.add({"a": x})
+
+    n, mean, m2 = stats.acc["a"]
+    assert n == 200
+    assert mean == pytest.approx(statistics.fmean(samples))
+    assert m2 / (n - 1) == pytest.approx(statistics.variance(samples))
+
+
+def test_merge_equals_single_stream():
+    rng = random.Random(3)
+    samples = [{"a": rng.random(), "b": rng.random() * 2} for _ in range(90)]
+    whole, left, right = RunningStats(), RunningStats(), RunningStats()
+    for i, points in enumerate(samples):
+        whole.add(points)
+        (left if i < 40 else right).add(points)
+
+    merged = RunningStats(left.state())
+    merged.merge(right)
+    for player in ("a", "b"):
+        assert merged.acc[player] == pytest.approx(whole.acc[player])
+    assert merged.pairs["a"]["b"] == pytest.approx(whole.pairs["a"]["b"])
+
+
+def test_ranking_separated():
+    z = z_for_confidence(0.95)
+    rng = random.Random(11)
+    apart, close = RunningStats(), RunningStats()
+    for _ in range(100):
+        apart.add({"a": rng.gauss(10, 1), "b": rng.gauss(5, 1)})
+        close.add({"a": rng.gauss(10, 5), "b": rng.gauss(10, 5)})
+    assert apart.ranking_separated(z)
+    assert not close.ranking_separated(z)
+
+
+def test_negatively_correlated_pair_is_tested_on_its_difference():
+    """In a zero-sum game one player's luck is the other's loss, so their
+    difference varies twice as much as independent samples would."""
+    z = z_for_confidence(0.95)
+    zero_sum, independent = RunningStats(), RunningStats()
+    for i in range(100):
+        luck = 1 if i % 2 else -1
+        zero_sum.add({"a": 10.33 + luck, "b": 10 - luck})
+        # The same per-player samples, with b's luck unrelated to a's.
+        independent.add({"a": 10.33 + luck, "b": 10 - (1 if i % 4 < 2 else -1)})
+    assert zero_sum.acc["a"] == pytest.approx(independent.acc["a"])
+    assert zero_sum.acc["b"] == pytest.approx(independent.acc["b"])
+    assert not zero_sum.ranking_separated(z)
+    assert independent.ranking_separated(z)
+
+
+def test_shared_luck_cancels_out_of_the_difference():
+    rng = random.Random(5)
+    stats = RunningStats()
+    for _ in range(30):
+        luck = rng.gauss(0, 10)
+        stats.add({"a": luck + 1, "b": luck})
+    assert stats.ranking_separated(z_for_confidence(0.99))
+
+
+def test_deterministic_tie_counts_as_settled():
+    stats = RunningStats()
+    for _ in range(5):
+        stats.add({"a": 3, "b": 3})
+    assert stats.ranking_separated(z_for_confidence(0.99))
+
+
+def test_confidence_interval_brackets_total():
+    stats = RunningStats()
+    for x in (1, 2, 3, 4):
+        stats.add({"a": x})
+    low, high = stats.confidence_intervals(z_for_confidence(0.95))["a"]
+    assert low < 10 < high
+    assert 10 - low == pytest.approx(high - 10)
@@ -0,0 +1,90 @@
+"""Validation result cache: keying, success-only storage, engine versioning.
+
+These talk to the real valkey; each test validates its own uuid-tagged code so
+runs never collide.
+"""
+
+import uuid
+
+import pytest
+
+from backend.games import engine_source
+from backend.tasks import validation_cache
+from backend.tasks.validation_cache import (
+    engine_version,
+    get_cached_validation,
+    store_validation,
+)
+
+SUCCESS = {
+    "status": "success",
+    "message": None,
+    "feedback": {"game": "greedy_pig"},
+    "simulation_results": {"total_points": {"team": 3}},
+    "duration_ms": 12.5,
+    "traceback": None,
+    "stdout": None,
+}
+
+
+@pytest.fixture
+def code():
+    return f"# {uuid.uuid4().hex}\n"
+
+
+def test_miss_then_hit(code):
+    assert get_cached_validation(code, "greedy_pig", "team") is None
+    store_validation(code, "greedy_pig", "team", None, SUCCESS)
+    assert get_cached_validation(code, "greedy_pig", "team") == SUCCESS
+
+
+def test_key_covers_game_team_and_rewards(code):
+    store_validation(code, "greedy_pig", "team", None, SUCCESS)
+    assert get_cached_validation(code, "prisoners_dilemma", "team") is None
+    assert get_cached_validation(code, "greedy_pig", "other_team") is None
+    assert get_cached_validation(code, "greedy_pig", "team", [10, 5]) is None
+    assert get_cached_validation(code + " ", "greedy_pig", "team") is None
+
+
+def test_failures_are_not_stored(code):
+    store_validation(
+        code, "greedy_pig", "team", None, {**SUCCESS, "status": "error"}
+    )
+    assert get_cached_validation(code, "greedy_pig", "team") is None
+
+
+def test_engine_version_is_per_game():
+    assert engine_version("greedy_pig") != engine_version("prisoners_dilemma")
+    assert engine_version("greedy_pig") == engine_version("greedy_pig")
+
+
+@pytest.mark.parametrize(
+    "changed", ["base_game.py", "table_tournament.py", "hearts/hearts.py"]
+)
+def test_engine_version_covers_shared_engine_modules(tmp_path, monkeypatch, changed):
+    games_dir = tmp_path / "games"
+    (games_dir / "hearts").mkdir(parents=True)
+    for source in ["base_game.py", "table_tournament.py", "hearts/hearts.py"]:
+        (games_dir / source).write_text("# engine\n")
+    monkeypatch.setattr(engine_source, "ROOT_DIR", str(tmp_path))
+    engine_version.cache_clear()
+    try:
+        before = engine_version("hearts")
+        (games_dir / changed).write_text("# changed engine\n")
+        engine_version.cache_clear()
+        assert engine_version("hearts") != before
+    finally:
+        engine_version.cache_clear()
+
+
+def test_valkey_errors_are_a_miss(code, monkeypatch):
+    class Broken:
+        def get(self, key):
+            raise ConnectionError("down")
+
+        def set(self, *args, **kwargs):
+            raise ConnectionError("down")
+
+    monkeypatch.setattr(validation_cache, "_get_redis", lambda: Broken())
+    store_validation(code, "greedy_pig", "team", None, SUCCESS)
+    assert get_cached_validation(code, "greedy_pig", "team") is None
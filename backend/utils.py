@@ -53,6 +53,8 @@ def process_simulation_results(sim, league_name, active=None):
         ),
         "feedback": feedback,
         "publish_link": sim.publish_link,  # Include the publish link
+        # Recorded placements: /admin/rescore-simulation can apply other rewards
+        "rescorable": sim.placements is not None,
     }
 
     # Add active status if provided